@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+from __future__ import annotations
+from typing import Any, Optional, Sequence
+import argparse
+import sys
+
+from flowly.benchmark.benchmark_suite import BenchmarkResults, BenchmarkSuite
+from flowly.benchmark.graph_generator import GraphGenerator
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the benchmark suite from the command line, e.g. `python -m flowly.benchmark --baseline baseline.json`.
+
+    :param argv: The command line arguments. Defaults to `sys.argv[1:]`.
+    :type argv: Optional[Sequence[str]]
+    :return: The exit code, 1 if a regression against the baseline was found, otherwise 0.
+    :rtype: int
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='flowly-benchmark', description="Benchmarks graph construction, validation, serialization and evaluation."
+    )
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[100, 1_000, 10_000, 100_000],
+        help="graph sizes in attributes, e.g. 100 1000000 (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--generators', nargs='+', choices=list(GraphGenerator.get_generators()), default=None,
+        help="graph generators to run (default: all)"
+    )
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per graph (default: %(default)s)")
+    parser.add_argument('--no-memory', action='store_true', help="skip the peak memory measurement")
+    parser.add_argument('--output', help="save the results as JSON, e.g. as a new baseline")
+    parser.add_argument('--baseline', help="compare the results against a saved baseline")
+    parser.add_argument(
+        '--threshold', type=float, default=1.2,
+        help="ratio to the baseline above which a metric is a regression (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--min-time-delta', type=float, default=BenchmarkSuite.MIN_DELTAS['time'] * 1000,
+        help="milliseconds a stage must slow down by to be a regression (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--min-memory-delta', type=float, default=BenchmarkSuite.MIN_DELTAS['peak_memory'] / 1024,
+        help="kilobytes the peak memory must grow by to be a regression (default: %(default)s)"
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    try:
+        suite: BenchmarkSuite = BenchmarkSuite(args.sizes, args.generators, args.repeat, not args.no_memory)
+    except ValueError as e:
+        parser.error(str(e))
+    results: BenchmarkResults = suite.run(progress=_print_metrics)
+    if args.output:
+        BenchmarkSuite.save(results, args.output)
+
+    if not args.baseline:
+        return 0
+
+    min_deltas: dict[str, float] = {'time': args.min_time_delta / 1000, 'peak_memory': args.min_memory_delta * 1024}
+    rows: list[dict[str, Any]] = BenchmarkSuite.compare(
+        results, BenchmarkSuite.load(args.baseline), args.threshold, min_deltas
+    )
+    regressions: list[dict[str, Any]] = [row for row in rows if row['regression']]
+    for row in regressions:
+        print(f"REGRESSION {row['key']} {row['metric']}: {row['baseline']:.6g} -> {row['current']:.6g} "
+              f"({row['ratio']:.2f}x)")
+    print(f"{len(rows)} metrics compared, {len(regressions)} regressions above {args.threshold:.2f}x.")
+    return 1 if regressions else 0
+
+
+def _print_metrics(key: str, metrics: dict[str, float]) -> None:
+    """Prints the time in milliseconds and the peak memory in kilobytes of a finished stage."""
+    memory: str = f"{metrics['peak_memory'] / 1024:>12.1f} KiB" if 'peak_memory' in metrics else ''
+    print(f"{key:<40} {metrics['time'] * 1e3:>12.3f} ms{memory}", flush=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
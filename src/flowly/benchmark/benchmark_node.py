@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+from __future__ import annotations
+from typing import Any, Optional
+from uuid import UUID
+
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.attribute import Attribute
+from flowly.core.node import Node
+
+
+class BenchmarkNode(Node):
+    """
+    A minimal node with the inputs `a` and `b` and the output `sum`, used by the synthetic benchmark graphs.
+
+    Inherits:
+        Node: Provides the attribute handling and serialization.
+    """
+
+    __slots__ = ()
+
+    ATTRIBUTE_COUNT: int = 3
+
+    def __init__(self, uuid: Optional[UUID | int] = None, name: str = "Benchmark") -> None:
+        """
+        Initializes a `BenchmarkNode` instance with its three attributes.
+
+        :param uuid: The unique identifier for the node. If not provided, a new UUID will be generated.
+        :type uuid: Optional[UUID | int]
+        :param name: The name of the node. Defaults to "Benchmark".
+        :type name: str
+        """
+        super().__init__(uuid=uuid, name=name)
+        for attr_name, flag in (
+                ('a', AttributeFlags.INPUT), ('b', AttributeFlags.INPUT), ('sum', AttributeFlags.OUTPUT)
+        ):
+            self.attributes.append(Attribute(name=attr_name, data=0, data_type=int, flag=flag, parent=self))
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Adds the inputs. Inputs fed by several edges are summed up first.
+
+        :param inputs: The values of `a` and `b`.
+        :type inputs: dict[str, Any]
+        :return: The value of `sum`.
+        :rtype: dict[str, Any]
+        """
+        a: Any = sum(inputs['a']) if isinstance(inputs['a'], list) else inputs['a']
+        b: Any = sum(inputs['b']) if isinstance(inputs['b'], list) else inputs['b']
+        return {'sum': a + b}
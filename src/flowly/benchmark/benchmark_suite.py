@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Optional
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from flowly.core.attribute import Attribute
+from flowly.core.node_graph import NodeGraph
+from flowly.benchmark.benchmark_node import BenchmarkNode
+from flowly.benchmark.graph_generator import EdgeSpec, GraphGenerator
+
+BenchmarkResults = dict[str, dict[str, float]]
+
+
+class BenchmarkSuite:
+    """
+    Measures the time and peak memory of the core operations on synthetic graphs of increasing size.
+
+    For every generator and size, a graph is built and evaluated in stages, each measured separately:
+        - `create_entities`: creating the nodes and their attributes,
+        - `add_node_item`: adding the nodes one by one,
+        - `validate_connection`: validating every edge before it is added,
+        - `add_edge_item`: adding the edges one by one,
+        - `attribute_json`: converting every attribute to JSON and back,
+        - `evaluate`: evaluating the whole graph.
+
+    The time of a stage is the minimum over all repetitions, which is the most stable estimate on a busy machine. The
+    peak memory is measured in one additional run with `tracemalloc`. Results are keyed `generator/size/stage` and can
+    be saved as a JSON baseline and compared against one later. A metric only counts as a regression if it exceeds the
+    baseline both by a ratio and by an absolute amount, by default 2 ms or 64 KiB, since small stages vary by more than
+    any useful ratio between back-to-back runs. Everything runs offline and in process.
+
+    Examples:
+        >>> suite = BenchmarkSuite(sizes=(100, 10_000), generators=('chain', 'grid'))  # doctest: +SKIP
+        >>> results = suite.run()  # doctest: +SKIP
+        >>> BenchmarkSuite.compare(results, BenchmarkSuite.load('baseline.json'))  # doctest: +SKIP
+    """
+
+    STAGES: tuple[str, ...] = (
+        'create_entities', 'add_node_item', 'validate_connection', 'add_edge_item', 'attribute_json', 'evaluate'
+    )
+    MIN_DELTAS: dict[str, float] = {'time': 0.002, 'peak_memory': 64 * 1024}
+
+    __slots__ = ('_sizes', '_generators', '_repeat', '_measure_memory')
+
+    def __init__(
+        self,
+        sizes: Iterable[int] = (100, 1_000, 10_000, 100_000),
+        generators: Optional[Iterable[str]] = None,
+        repeat: int = 3,
+        measure_memory: bool = True
+    ) -> None:
+        """
+        Initializes a `BenchmarkSuite` instance.
+
+        :param sizes: The graph sizes in attributes, e.g. up to 1_000_000.
+        :type sizes: Iterable[int]
+        :param generators: The names of the graph generators to run. Defaults to all of `GraphGenerator`.
+        :type generators: Optional[Iterable[str]]
+        :param repeat: The number of timed runs per generator and size.
+        :type repeat: int
+        :param measure_memory: Whether to measure the peak memory in an additional run.
+        :type measure_memory: bool
+        :raises ValueError: If a generator is unknown, or if a size or the repeat count is smaller than one.
+        """
+        self._sizes: tuple[int, ...] = tuple(sizes)
+        self._generators: tuple[str, ...] = tuple(generators or GraphGenerator.get_generators())
+        self._repeat: int = repeat
+        self._measure_memory: bool = measure_memory
+
+        unknown_generators: set[str] = set(self._generators).difference(GraphGenerator.get_generators())
+        if unknown_generators:
+            raise ValueError(f"Unknown graph generator: {sorted(unknown_generators)[0]}")
+        if repeat < 1 or any(size < 1 for size in self._sizes):
+            raise ValueError("Sizes and the repeat count must be at least one.")
+
+    def run(self, progress: Optional[Callable[[str, dict[str, float]], None]] = None) -> BenchmarkResults:
+        """
+        Runs all benchmarks.
+
+        :param progress: A function called with the key and the metrics of every finished stage.
+        :type progress: Optional[Callable[[str, dict[str, float]], None]]
+        :return: The time in seconds and, if measured, the peak memory in bytes per `generator/size/stage` key.
+        :rtype: BenchmarkResults
+        """
+        results: BenchmarkResults = {}
+        for generator_name in self._generators:
+            generator: Callable[[int], tuple[int, list[EdgeSpec]]] = GraphGenerator.get_generators()[generator_name]
+            for size in self._sizes:
+                node_count, edges = generator(size)
+                times: dict[str, float] = {}
+                for _ in range(self._repeat):
+                    for stage, (duration, _) in self._run_stages(node_count, edges, trace_memory=False).items():
+                        times[stage] = min(duration, times.get(stage, duration))
+                peak_memory: dict[str, tuple[float, int]] = (
+                    self._run_stages(node_count, edges, trace_memory=True) if self._measure_memory else {}
+                )
+
+                for stage in self.STAGES:
+                    key: str = f"{generator_name}/{size}/{stage}"
+                    results[key] = {'time': times[stage]}
+                    if stage in peak_memory:
+                        results[key]['peak_memory'] = peak_memory[stage][1]
+                    if progress is not None:
+                        progress(key, results[key])
+        return results
+
+    @classmethod
+    def _run_stages(
+        cls, node_count: int, edges: list[EdgeSpec], trace_memory: bool
+    ) -> dict[str, tuple[float, int]]:
+        """Builds, serializes and evaluates one graph, returning the time and peak memory of every stage."""
+        measurements: dict[str, tuple[float, int]] = {}
+        node_graph: NodeGraph = NodeGraph()
+        node_items: list[BenchmarkNode] = []
+
+        def measure(stage: str, function: Callable[[], Any]) -> None:
+            gc.collect()
+            if trace_memory:
+                tracemalloc.start()
+            start: float = time.perf_counter()
+            function()
+            duration: float = time.perf_counter() - start
+            peak_memory: int = 0
+            if trace_memory:
+                _, peak_memory = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            measurements[stage] = duration, peak_memory
+
+        def create_entities() -> None:
+            node_items.extend(BenchmarkNode(name=str(index)) for index in range(node_count))
+
+        def add_node_items() -> None:
+            for node_item in node_items:
+                node_graph.add_node_item(node_item)
+
+        def validate_connections() -> None:
+            for source, target, target_input in edges:
+                node_graph.validate_connection(
+                    node_items[source].attributes[2], node_items[target].attributes[target_input]
+                )
+
+        def add_edge_items() -> None:
+            for source, target, target_input in edges:
+                node_graph.add_edge_item(node_items[source], 2, node_items[target], target_input)
+
+        def convert_attributes() -> None:
+            for node_item in node_items:
+                for attr_item in node_item.attributes:
+                    Attribute.from_json(attr_item.to_json())
+
+        measure('create_entities', create_entities)
+        measure('add_node_item', add_node_items)
+        measure('validate_connection', validate_connections)
+        measure('add_edge_item', add_edge_items)
+        measure('attribute_json', convert_attributes)
+        measure('evaluate', node_graph.evaluate)
+        return measurements
+
+    @staticmethod
+    def compare(
+        results: BenchmarkResults,
+        baseline: BenchmarkResults,
+        threshold: float = 1.2,
+        min_deltas: Optional[dict[str, float]] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Compares results against a baseline. Keys or metrics missing in either are skipped.
+
+        :param results: The current results.
+        :type results: BenchmarkResults
+        :param baseline: The baseline results.
+        :type baseline: BenchmarkResults
+        :param threshold: The ratio of current to baseline value above which a metric counts as a regression.
+        :type threshold: float
+        :param min_deltas: The minimum increase over the baseline value per metric for a regression, below which
+                           differences are treated as noise. Defaults to `MIN_DELTAS`.
+        :type min_deltas: Optional[dict[str, float]]
+        :return: One row per compared metric with the key, metric, both values, their ratio and a regression flag.
+        :rtype: list[dict[str, Any]]
+        """
+        min_deltas = BenchmarkSuite.MIN_DELTAS if min_deltas is None else min_deltas
+        rows: list[dict[str, Any]] = []
+        for key, metrics in results.items():
+            for metric, value in metrics.items():
+                baseline_value: Optional[float] = baseline.get(key, {}).get(metric)
+                if baseline_value is None:
+                    continue
+                ratio: float = value / baseline_value if baseline_value else (1.0 if not value else float('inf'))
+                rows.append({
+                    'key': key, 'metric': metric, 'baseline': baseline_value, 'current': value, 'ratio': ratio,
+                    'regression': ratio > threshold and value - baseline_value > min_deltas.get(metric, 0.0)
+                })
+        return rows
+
+    @staticmethod
+    def save(results: BenchmarkResults, path: str | os.PathLike) -> None:
+        """
+        Saves results together with the Python version and platform as JSON.
+
+        :param results: The results to save.
+        :type results: BenchmarkResults
+        :param path: The path of the file to create or overwrite.
+        :type path: str | os.PathLike
+        """
+        with open(path, 'w') as file:
+            json.dump({
+                'python': sys.version.split()[0], 'platform': platform.platform(), 'results': results
+            }, file, indent=2)
+
+    @staticmethod
+    def load(path: str | os.PathLike) -> BenchmarkResults:
+        """
+        Loads results saved with `save`.
+
+        :param path: The path of the results file.
+        :type path: str | os.PathLike
+        :return: The loaded results.
+        :rtype: BenchmarkResults
+        :raises ValueError: If the file contains no results.
+        """
+        with open(path) as file:
+            data: dict[str, Any] = json.load(file)
+        if 'results' not in data:
+            raise ValueError(f"Invalid benchmark results file: {path}")
+        return data['results']
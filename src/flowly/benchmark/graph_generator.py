@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+from __future__ import annotations
+from typing import Callable
+import math
+import random
+
+from flowly.benchmark.benchmark_node import BenchmarkNode
+
+EdgeSpec = tuple[int, int, int]
+
+
+class GraphGenerator:
+    """
+    Generates the topology of synthetic benchmark graphs made of `BenchmarkNode`s.
+
+    A topology is given by a node count and a list of edges `(source node index, target node index, target input)`,
+    where the target input is 0 for `a` and 1 for `b`, and edges always point from lower to higher node indices. The
+    node count is derived from the requested number of attributes, three per node. All generators are deterministic,
+    the random DAG uses a seeded random number generator.
+
+    Examples:
+        >>> GraphGenerator.chain(12)
+        (4, [(0, 1, 0), (1, 2, 0), (2, 3, 0)])
+    """
+
+    @staticmethod
+    def get_node_count(attribute_count: int) -> int:
+        """
+        Returns the number of nodes holding the given number of attributes, at least one.
+
+        :param attribute_count: The requested number of attributes.
+        :type attribute_count: int
+        :return: The number of nodes.
+        :rtype: int
+        """
+        return max(attribute_count // BenchmarkNode.ATTRIBUTE_COUNT, 1)
+
+    @classmethod
+    def chain(cls, attribute_count: int) -> tuple[int, list[EdgeSpec]]:
+        """
+        Generates a linear chain, in which every node feeds the next one.
+
+        :param attribute_count: The requested number of attributes.
+        :type attribute_count: int
+        :return: The node count and the edges.
+        :rtype: tuple[int, list[EdgeSpec]]
+        """
+        node_count: int = cls.get_node_count(attribute_count)
+        return node_count, [(index, index + 1, 0) for index in range(node_count - 1)]
+
+    @classmethod
+    def fan_out(cls, attribute_count: int) -> tuple[int, list[EdgeSpec]]:
+        """
+        Generates a wide fan-out, in which the first node feeds all other nodes.
+
+        :param attribute_count: The requested number of attributes.
+        :type attribute_count: int
+        :return: The node count and the edges.
+        :rtype: tuple[int, list[EdgeSpec]]
+        """
+        node_count: int = cls.get_node_count(attribute_count)
+        return node_count, [(0, index, 0) for index in range(1, node_count)]
+
+    @classmethod
+    def random_dag(cls, attribute_count: int, seed: int = 0) -> tuple[int, list[EdgeSpec]]:
+        """
+        Generates a random DAG, in which both inputs of every node but the first are fed by a random earlier node.
+
+        :param attribute_count: The requested number of attributes.
+        :type attribute_count: int
+        :param seed: The seed of the random number generator.
+        :type seed: int
+        :return: The node count and the edges.
+        :rtype: tuple[int, list[EdgeSpec]]
+        """
+        node_count: int = cls.get_node_count(attribute_count)
+        generator: random.Random = random.Random(seed)
+        return node_count, [
+            (generator.randrange(index), index, target_input)
+            for index in range(1, node_count) for target_input in (0, 1)
+        ]
+
+    @classmethod
+    def grid(cls, attribute_count: int) -> tuple[int, list[EdgeSpec]]:
+        """
+        Generates a square grid, in which every node is fed by its upper and its left neighbour.
+
+        :param attribute_count: The requested number of attributes.
+        :type attribute_count: int
+        :return: The node count and the edges.
+        :rtype: tuple[int, list[EdgeSpec]]
+        """
+        node_count: int = cls.get_node_count(attribute_count)
+        width: int = math.isqrt(node_count - 1) + 1
+        edges: list[EdgeSpec] = []
+        for index in range(node_count):
+            if index >= width:
+                edges.append((index - width, index, 0))
+            if index % width:
+                edges.append((index - 1, index, 1))
+        return node_count, edges
+
+    @classmethod
+    def get_generators(cls) -> dict[str, Callable[[int], tuple[int, list[EdgeSpec]]]]:
+        """
+        Returns all generators by name.
+
+        :return: The generator functions, taking the requested number of attributes.
+        :rtype: dict[str, Callable[[int], tuple[int, list[EdgeSpec]]]]
+        """
+        return {'chain': cls.chain, 'fan_out': cls.fan_out, 'random_dag': cls.random_dag, 'grid': cls.grid}
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.attribute import Attribute
+if TYPE_CHECKING:
+    from flowly.core.node import Node
+    from flowly.core.edge import Edge
+
+
+class ArrayAttribute(Attribute):
+    """
+    An attribute holding a NumPy array with an optional fixed dtype and shape.
+
+    Assigned data is converted to an array of the attribute's dtype, which does not copy arrays already having that
+    dtype, and is stored as a read-only view. Passing data along an edge therefore shares the upstream buffer instead of
+    copying it. A compute function mutating an input in place must call `writable` first, which copies the array only
+    if it is shared (copy-on-write).
+
+    The shape may contain None for dimensions of any length. Two array attributes are compatible if the dtype can be
+    cast safely and the shapes match in every fixed dimension.
+
+    Examples:
+        >>> attribute = ArrayAttribute(name="Points", dtype=np.float64, shape=(None, 3))
+        >>> attribute.data = [[0, 0, 0], [1, 2, 3]]
+        >>> attribute.data.dtype, attribute.data.flags.writeable
+        (dtype('float64'), False)
+
+    Inherits:
+        Attribute: Provides the data, edge and serialization handling.
+    """
+
+    __slots__ = ('_dtype', '_shape')
+
+    def __init__(
+            self,
+            uuid: Optional[UUID | int] = None,
+            name: str = "Attribute",
+            data: Any = None,
+            data_type: type = np.ndarray,
+            flag: AttributeFlags = AttributeFlags.INPUT,
+            parent: Optional[Node] = None,
+            is_multi_edge: bool = True,
+            edges: Optional[Iterable[Edge]] = None,
+            dtype: Optional[np.typing.DTypeLike] = None,
+            shape: Optional[Sequence[Optional[int]]] = None
+    ) -> None:
+        """
+        Initializes an `ArrayAttribute` instance. The other parameters are the same as for `Attribute`.
+
+        :param dtype: The dtype of the array. Defaults to None, i.e. the dtype of the assigned data.
+        :type dtype: Optional[np.typing.DTypeLike]
+        :param shape: The shape of the array, with None for dimensions of any length. Defaults to None, i.e. any shape.
+        :type shape: Optional[Sequence[Optional[int]]]
+        """
+        self._dtype: Optional[np.dtype] = np.dtype(dtype) if dtype is not None else None
+        self._shape: Optional[tuple[Optional[int], ...]] = tuple(shape) if shape is not None else None
+        super().__init__(
+            uuid=uuid, name=name, data=data, data_type=data_type, flag=flag, parent=parent, is_multi_edge=is_multi_edge,
+            edges=edges
+        )
+
+    @property
+    def dtype(self) -> Optional[np.dtype]:
+        """
+        Gets the dtype of the array.
+
+        :return: The dtype, or None if any dtype is accepted.
+        :rtype: Optional[np.dtype]
+        """
+        return self._dtype
+
+    @property
+    def shape(self) -> Optional[tuple[Optional[int], ...]]:
+        """
+        Gets the shape of the array, with None for dimensions of any length.
+
+        :return: The shape, or None if any shape is accepted.
+        :rtype: Optional[tuple[Optional[int], ...]]
+        """
+        return self._shape
+
+    @staticmethod
+    def writable(array: np.ndarray) -> np.ndarray:
+        """
+        Returns the array itself if it may be written to, otherwise a writable copy.
+
+        :param array: An array, e.g. an input of a compute function.
+        :type array: np.ndarray
+        :return: A writable array with the same content.
+        :rtype: np.ndarray
+        """
+        return array if array.flags.writeable else array.copy()
+
+    def _convert_data(self, value: Any) -> Any:
+        """
+        Converts the data to a read-only array of the attribute's dtype without copying it if possible. The list an
+        input fed by several edges receives is converted item by item, like the other typed attributes keep lists.
+
+        :param value: The assigned or loaded data.
+        :type value: Any
+        :return: A read-only array, a list of read-only arrays, or None.
+        :rtype: Any
+        :raises ValueError: If the data does not match the shape.
+        """
+        if isinstance(value, list) and self._flag is not AttributeFlags.OUTPUT and len(self._edges) > 1:
+            return [self._convert_array(item) for item in value]
+        return self._convert_array(value)
+
+    def _convert_array(self, value: Any) -> Optional[np.ndarray]:
+        """Converts a single value to a read-only array of the attribute's dtype and checks its shape."""
+        if value is None:
+            return None
+
+        array: np.ndarray = np.asarray(value, dtype=self._dtype)
+        if self._shape is not None and not self._matches_shape(array.shape):
+            raise ValueError(f"Invalid array shape {array.shape}, expected {self._shape}.")
+        if array.flags.writeable:
+            array = array.view()
+            array.flags.writeable = False
+        return array
+
+    def serialize_data(self, value: Any) -> Any:
+        """
+        Converts the array to nested lists. The list of an input fed by several edges is derived from its edges and
+        stored as None, since it may be ragged and the edges are connected only after the attribute is restored.
+
+        :param value: The data of the attribute.
+        :type value: Any
+        :return: The serializable data.
+        :rtype: Any
+        """
+        if isinstance(value, list):
+            return None
+        return super().serialize_data(value)
+
+    def _matches_shape(self, shape: tuple[Optional[int], ...]) -> bool:
+        """Checks if a shape, which may contain None, matches the attribute's shape in every fixed dimension."""
+        return len(shape) == len(self._shape) and all(
+            size is None or expected_size is None or size == expected_size
+            for size, expected_size in zip(shape, self._shape)
+        )
+
+    def is_compatible_with(self, other: Attribute) -> bool:
+        """
+        Checks if the data of this attribute can be passed to another attribute through an edge.
+
+        :param other: The attribute receiving the data.
+        :type other: Attribute
+        :return: True if the other array attribute accepts the dtype and shape or, for other attributes, if the data
+                 types are compatible. Otherwise False.
+        :rtype: bool
+        """
+        if not isinstance(other, ArrayAttribute):
+            return super().is_compatible_with(other)
+
+        if self._dtype is not None and other.dtype is not None and not np.can_cast(self._dtype, other.dtype, 'safe'):
+            return False
+        return self._shape is None or other.shape is None or other._matches_shape(self._shape)
+
+    def get_options(self) -> dict[str, Any]:
+        """
+        Returns the dtype and shape as JSON serializable constructor arguments.
+
+        :return: The dtype string and the shape list, if set.
+        :rtype: dict[str, Any]
+        """
+        options: dict[str, Any] = {}
+        if self._dtype is not None:
+            options['dtype'] = self._dtype.str
+        if self._shape is not None:
+            options['shape'] = list(self._shape)
+        return options
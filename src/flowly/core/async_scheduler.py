@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Optional
+import asyncio
+import inspect
+
+from flowly.core.profiler import Profiler
+if TYPE_CHECKING:
+    from flowly.core.node import Node
+    from flowly.core.node_graph import NodeGraph
+
+
+class AsyncScheduler:
+    """
+    Evaluates the dirty nodes of a node graph on the running asyncio event loop.
+
+    Every dirty node becomes a task that waits for the tasks of its dirty upstream nodes, so independent nodes are
+    awaited concurrently. Coroutine compute functions are awaited directly, while regular compute functions are run in
+    a worker thread via `asyncio.to_thread`, so the event loop is never blocked. A semaphore bounds the number of
+    concurrently running compute functions. Nodes with a result in the node graph's cache are not computed again.
+
+    If a node fails or is cancelled, all nodes downstream of it are cancelled, while independent branches finish
+    normally. Cancelling the evaluation itself cancels all of its node tasks.
+
+    Examples:
+        >>> await node_graph.evaluate_async(AsyncScheduler(max_concurrency=8))  # doctest: +SKIP
+    """
+
+    __slots__ = ('_max_concurrency',)
+
+    def __init__(self, max_concurrency: Optional[int] = None) -> None:
+        """
+        Initializes an `AsyncScheduler` instance.
+
+        :param max_concurrency: The maximum number of concurrently running compute functions. Unbounded if None.
+        :type max_concurrency: Optional[int]
+        :raises ValueError: If `max_concurrency` is smaller than one.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("The maximum concurrency must be at least one.")
+
+        self._max_concurrency: Optional[int] = max_concurrency
+
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        """
+        Gets the maximum number of concurrently running compute functions.
+
+        :return: The maximum concurrency, or None if unbounded.
+        :rtype: Optional[int]
+        """
+        return self._max_concurrency
+
+    async def run(self, node_graph: NodeGraph, node_items: Optional[list[Node]] = None) -> None:
+        """
+        Computes all dirty nodes of the node graph, awaiting independent nodes concurrently.
+
+        :param node_graph: The node graph to evaluate.
+        :type node_graph: NodeGraph
+        :param node_items: The dirty nodes to compute in topological order, which must include their dirty upstream
+                           nodes. Defaults to all dirty nodes.
+        :type node_items: Optional[list[Node]]
+        :raises Exception: Re-raises the first exception of a compute function once all node tasks are done.
+        :raises asyncio.CancelledError: If node tasks were cancelled without any compute function failing.
+        """
+        semaphore: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(self._max_concurrency) if self._max_concurrency is not None else None
+        )
+        dirty_node_items: list[Node] = (
+            node_items if node_items is not None else node_graph.get_sorted_dirty_node_items()
+        )
+        upstream_node_items: dict[Node, set[Node]] = {node_item: set() for node_item in dirty_node_items}
+        for node_item in dirty_node_items:
+            for downstream_node_item in node_graph.get_downstream_node_items(node_item):
+                if downstream_node_item in upstream_node_items:
+                    upstream_node_items[downstream_node_item].add(node_item)
+
+        tasks: dict[Node, asyncio.Task] = {}
+        for node_item in dirty_node_items:  # Upstream tasks are always created first due to the topological order
+            upstream_tasks: list[asyncio.Task] = [tasks[upstream] for upstream in upstream_node_items[node_item]]
+            tasks[node_item] = asyncio.create_task(
+                self._evaluate_node_item(node_graph, node_item, upstream_tasks, semaphore)
+            )
+
+        try:
+            results: list[Any] = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        for result in results:
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+
+    @staticmethod
+    async def _evaluate_node_item(
+        node_graph: NodeGraph,
+        node_item: Node,
+        upstream_tasks: list[asyncio.Task],
+        semaphore: Optional[asyncio.Semaphore]
+    ) -> None:
+        """Waits for the upstream tasks, then computes node_item, or cancels itself if an upstream task failed."""
+        if upstream_tasks:
+            await asyncio.wait(upstream_tasks)
+            if any(task.cancelled() or task.exception() is not None for task in upstream_tasks):
+                raise asyncio.CancelledError(f"Upstream of {node_item.name} failed or was cancelled.")
+
+        inputs: dict[str, Any] = node_graph.get_input_data(node_item)
+        cache_key: Optional[str] = node_graph.get_cache_key(node_item, inputs)
+        outputs: Optional[dict[str, Any]] = node_graph.cache.get(cache_key) if cache_key is not None else None
+        if outputs is None:
+            if semaphore is not None:
+                async with semaphore:
+                    outputs = await AsyncScheduler._compute(node_graph, node_item, inputs)
+            else:
+                outputs = await AsyncScheduler._compute(node_graph, node_item, inputs)
+            if cache_key is not None:
+                node_graph.cache.put(cache_key, outputs)
+        node_graph.set_output_data(node_item, outputs)
+
+    @staticmethod
+    async def _compute(node_graph: NodeGraph, node_item: Node, inputs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Awaits a coroutine compute function or runs a regular one in a worker thread, measuring it if the node graph has
+        a profiler. The CPU time of a coroutine is that of the event loop thread while it is awaited.
+        """
+        profiler: Optional[Profiler] = node_graph.profiler
+        if inspect.iscoroutinefunction(node_item.compute):
+            if profiler is None:
+                return await node_item.compute(inputs)
+            with profiler.measure('node', node_item.name, node_item.uuid):
+                return await node_item.compute(inputs)
+
+        if profiler is None:
+            return await asyncio.to_thread(node_item.compute, inputs)
+        outputs, sample = await asyncio.to_thread(Profiler.measure_call, node_item.compute, inputs)
+        profiler.add_sample('node', node_item.name, node_item.uuid, sample)
+        return outputs
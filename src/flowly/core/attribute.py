@@ -23,13 +23,13 @@
 # ************************************************************************
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
-import importlib
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable, KeysView, Optional
 from uuid import UUID
 import json
 
 from flowly.core.enumerations import AttributeFlags
 from flowly.core.base_entity import BaseEntity
+from flowly.core.type_registry import TYPE_REGISTRY
 if TYPE_CHECKING:
     from flowly.core.node import Node
     from flowly.core.edge import Edge
@@ -44,26 +44,36 @@ class Attribute(BaseEntity):
     depending on the role specified by the `flag`. The attribute's data can be of any type,
     defined by the `data_type` attribute. An attribute can be connected to other attributes
     through edges and may be linked to multiple edges if `is_multi_edge` is set to `True`.
+
+    The connected edges are kept in an insertion-ordered dictionary, so checking, connecting and disconnecting an edge
+    take constant time even for attributes with thousands of edges.
+
+    Typed subclasses convert assigned data by overriding `_convert_data`, restrict connections by overriding
+    `is_compatible_with` and serialize additional constructor arguments through `get_options`.
     """
 
-    __slots__ = ('_name', '_data', '_data_type', '_flag', '_parent', '_edges', '_is_multi_edge')
+    __slots__ = ('_name', '_data', '_data_type', '_flag', '_parent', '_edges', '_is_multi_edge', '_data_loader')
+
+    _REQUIRED_KEYS: ClassVar[frozenset[str]] = frozenset(
+        ('class_name', 'uuid', 'name', 'data', 'data_type', 'flag', 'is_multi_edge')
+    )
 
     def __init__(
         self,
-        uuid: Optional[UUID] = None,
+        uuid: Optional[UUID | int] = None,
         name: str = "Attribute",
         data: Any = None,
         data_type: type = Any,
         flag: AttributeFlags = AttributeFlags.INPUT,
         parent: Optional[Node] = None,
         is_multi_edge: bool = True,
-        edges: Optional[list[Edge]] = None
+        edges: Optional[Iterable[Edge]] = None
     ) -> None:
         """
         Initializes an `Attribute` instance.
 
         :param uuid: The unique identifier for the attribute. If not provided, a new UUID will be generated.
-        :type uuid: Optional[UUID]
+        :type uuid: Optional[UUID | int]
         :param name: The name of the attribute. Defaults to "Attribute".
         :type name: str
         :param data: The data associated with the attribute. Can be any type. Defaults to None.
@@ -76,17 +86,18 @@ class Attribute(BaseEntity):
         :type parent: Optional[Node]
         :param is_multi_edge: Determines if the attribute can connect to multiple edges. Defaults to True.
         :type is_multi_edge: bool
-        :param edges: A list of edges connected to this attribute. Defaults to an empty list.
-        :type edges: Optional[list[Edge]]
+        :param edges: The edges connected to this attribute. Defaults to no edges.
+        :type edges: Optional[Iterable[Edge]]
         """
         super().__init__(uuid=uuid)
         self._name: str = name
-        self._data: Any = data
         self._data_type: type = data_type
         self._flag: AttributeFlags = flag
         self._parent: Optional[Node] = parent
         self._is_multi_edge: bool = is_multi_edge
-        self._edges: list[Edge] = edges or []
+        self._edges: dict[Edge, None] = dict.fromkeys(edges) if edges else {}
+        self._data_loader: Optional[Callable[[], Any]] = None
+        self._data: Any = self._convert_data(data)
 
     def __repr__(self) -> str:
         """
@@ -102,55 +113,37 @@ class Attribute(BaseEntity):
         """
         Creates an `Attribute` instance from a dictionary, dynamically using the class name.
 
+        Class and data type names are resolved through the shared type registry, which caches every resolution.
+
         :param data: A dictionary containing the attribute properties.
         :type data: dict[str, Any]
         :return: An instance of `Attribute`.
         :rtype: Attribute
         :raises ValueError: If required fields are missing or invalid.
         """
-        required_keys: list[str] = ['class_name', 'uuid', 'name', 'data', 'data_type', 'flag', 'is_multi_edge']
-        for key in required_keys:
-            if key not in data:
-                raise ValueError(f"Missing required key: '{key}' in input data.")
-
-        class_name: str = data.get('class_name')
-        module_name, class_basename = class_name.rsplit('.', 1)
-        try:
-            module = importlib.import_module(module_name)  # Dynamically import the module and get the class
-            dynamic_class: type = getattr(module, class_basename)
-
-            try:
-                uuid: UUID = UUID(data['uuid'])  # Validate UUID
-            except ValueError as e:
-                raise ValueError(f"Invalid UUID: {data['uuid']}") from e
-
-            name: str = data['name']
-            data_value: Any = data['data']
+        missing_keys: set[str] = cls._REQUIRED_KEYS.difference(data)
+        if missing_keys:
+            raise ValueError(f"Missing required key: '{sorted(missing_keys)[0]}' in input data.")
 
-            data_type_str: str = data['data_type']
-            try:
-                data_type: type = eval(data_type_str)  # Validate data_type
-            except NameError:
-                raise ValueError(f"Invalid data type: {data_type_str}")
+        dynamic_class: type = TYPE_REGISTRY.resolve_class(data['class_name'])
 
-            try:
-                flag: AttributeFlags = AttributeFlags[data['flag']]  # Validate flag
-            except KeyError:
-                raise ValueError(f"Invalid flag value: {data['flag']}")
-
-            parent: Optional[Node] = None  # The parent must be resolved in the actual application context
-            is_multi_edge: bool = data.get('is_multi_edge', True)
+        try:
+            uuid: UUID = UUID(data['uuid'])  # Validate UUID
+        except ValueError as e:
+            raise ValueError(f"Invalid UUID: {data['uuid']}") from e
 
-            # Assume that the application will resolve the edge instances based on UUIDs
-            edges: list[Edge] = []  # This should be populated later in the actual context
+        data_type: type = TYPE_REGISTRY.resolve_data_type(data['data_type'])  # Validate data_type
 
-            return dynamic_class(
-                uuid=uuid, name=name, data=data_value, data_type=data_type, flag=flag, parent=parent,
-                is_multi_edge=is_multi_edge, edges=edges
-            )
+        try:
+            flag: AttributeFlags = AttributeFlags[data['flag']]  # Validate flag
+        except KeyError:
+            raise ValueError(f"Invalid flag value: {data['flag']}")
 
-        except (ImportError, AttributeError) as e:
-            raise ValueError(f"Could not import class {class_name}: {e}")
+        # The parent and the edge instances must be resolved by UUID in the actual application context
+        return dynamic_class(
+            uuid=uuid, name=data['name'], data=data['data'], data_type=data_type, flag=flag, parent=None,
+            is_multi_edge=data['is_multi_edge'], edges=[], **data.get('options', {})
+        )
 
     @classmethod
     def from_json(cls, json_str: str) -> Attribute:
@@ -184,14 +177,78 @@ class Attribute(BaseEntity):
         """
         Gets or sets the data associated with the attribute.
 
+        Setting the data marks everything downstream of the attribute as dirty in the parent's node graph and records
+        it in the node graph's snapshot, if any. If a data loader is set, the data is loaded on first access.
+
         :return: The data associated with the attribute.
         :rtype: Any
         """
+        if self._data_loader is not None:
+            self._data = self._convert_data(self._data_loader())
+            self._data_loader = None
         return self._data
 
     @data.setter
     def data(self, value: Any) -> None:
-        self._data = value
+        self._data = self._convert_data(value)
+        self._data_loader = None
+        if self._parent is not None and self._parent.node_graph is not None:
+            self._parent.node_graph.on_attribute_item_data_changed(self)
+
+    @property
+    def is_data_loaded(self) -> bool:
+        """
+        Returns whether the data is materialized, i.e. no data loader is pending.
+
+        :return: True if the data is loaded, otherwise False.
+        :rtype: bool
+        """
+        return self._data_loader is None
+
+    @property
+    def data_loader(self) -> Optional[Callable[[], Any]]:
+        """
+        Returns the pending data loader, if the data is not loaded yet.
+
+        :return: The data loader, if any.
+        :rtype: Optional[Callable[[], Any]]
+        """
+        return self._data_loader
+
+    def set_data_loader(self, loader: Callable[[], Any]) -> None:
+        """
+        Defers the data to a loader, which is called once on the first access of `data`, e.g. to read a file lazily.
+        Unlike setting the data, this does not mark anything as dirty.
+
+        :param loader: A function without arguments returning the data.
+        :type loader: Callable[[], Any]
+        """
+        self._data_loader = loader
+
+    def _convert_data(self, value: Any) -> Any:
+        """
+        Converts data before it is stored. The base implementation stores the data as it is.
+
+        :param value: The assigned or loaded data.
+        :type value: Any
+        :return: The data to store.
+        :rtype: Any
+        """
+        return value
+
+    def serialize_data(self, value: Any) -> Any:
+        """
+        Converts data to the JSON serializable form stored by `to_dict`, which the attribute converts back on
+        assignment. The base implementation turns NumPy arrays and scalars into nested lists and numbers.
+
+        :param value: The data of the attribute.
+        :type value: Any
+        :return: The serializable data.
+        :rtype: Any
+        """
+        if hasattr(value, 'tolist') and hasattr(value, 'dtype'):
+            return value.tolist()
+        return value
 
     @property
     def data_type(self) -> type:
@@ -237,15 +294,36 @@ class Attribute(BaseEntity):
         """
         return self._is_multi_edge
 
+    def is_compatible_with(self, other: Attribute) -> bool:
+        """
+        Checks if the data of this attribute can be passed to another attribute through an edge.
+
+        :param other: The attribute receiving the data.
+        :type other: Attribute
+        :return: True if the data types are equal or one of them is Any, otherwise False.
+        :rtype: bool
+        """
+        return self._data_type == other.data_type or self._data_type == Any or other.data_type == Any
+
+    def get_options(self) -> dict[str, Any]:
+        """
+        Returns the JSON serializable constructor arguments of a subclass, e.g. an array shape. These are stored as
+        `options` by `to_dict` and passed to the constructor by `from_dict`.
+
+        :return: The additional constructor arguments by name. Empty for the base class.
+        :rtype: dict[str, Any]
+        """
+        return {}
+
     @property
-    def edges(self) -> list[Edge]:
+    def edges(self) -> KeysView[Edge]:
         """
-        Gets the list of edges connected to the attribute.
+        Gets a live, read-only view of the edges connected to the attribute, in connection order.
 
-        :return: A list of edges.
-        :rtype: list[Edge]
+        :return: The connected edges.
+        :rtype: KeysView[Edge]
         """
-        return self._edges
+        return self._edges.keys()
 
     @property
     def edge_count(self) -> int:
@@ -285,7 +363,25 @@ class Attribute(BaseEntity):
             raise ValueError("This edge is already connected.")
         if not self._is_multi_edge and len(self._edges) >= 1:
             raise ValueError("This attribute does not allow multiple edges.")
-        self._edges.append(edge)
+        self._edges[edge] = None
+
+    def connect_edges(self, edges: Iterable[Edge]) -> None:
+        """
+        Connects several edges to the attribute. Either all edges are connected or, on error, none of them.
+
+        :param edges: The edges to be connected.
+        :type edges: Iterable[Edge]
+        :raises ValueError: If an edge is already connected or given twice, or if `_is_multi_edge` is False and more
+                            than one edge would be connected.
+        """
+        new_edges: dict[Edge, None] = {}
+        for edge in edges:
+            if edge in self._edges or edge in new_edges:
+                raise ValueError("This edge is already connected.")
+            new_edges[edge] = None
+        if not self._is_multi_edge and len(self._edges) + len(new_edges) > 1:
+            raise ValueError("This attribute does not allow multiple edges.")
+        self._edges.update(new_edges)
 
     def disconnect_edge(self, edge: Edge) -> None:
         """
@@ -293,8 +389,26 @@ class Attribute(BaseEntity):
 
         :param edge: The edge to be disconnected.
         :type edge: Edge
+        :raises ValueError: If the edge is not connected.
+        """
+        try:
+            del self._edges[edge]
+        except KeyError:
+            raise ValueError("This edge is not connected.")
+
+    def disconnect_edges(self, edges: Iterable[Edge]) -> None:
+        """
+        Disconnects several edges from the attribute. Either all edges are disconnected or, on error, none of them.
+
+        :param edges: The edges to be disconnected.
+        :type edges: Iterable[Edge]
+        :raises ValueError: If an edge is not connected.
         """
-        self._edges.remove(edge)
+        old_edges: dict[Edge, None] = dict.fromkeys(edges)
+        if any(edge not in self._edges for edge in old_edges):
+            raise ValueError("This edge is not connected.")
+        for edge in old_edges:
+            del self._edges[edge]
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -307,13 +421,16 @@ class Attribute(BaseEntity):
         attribute_dict = {
             'class_name': f"{type(self).__module__}.{type(self).__name__}",  # Full class name
             'name': self._name,
-            'data': self._data,
-            'data_type': self._data_type.__name__ if self._data_type else None,
+            'data': self.serialize_data(self.data),
+            'data_type': TYPE_REGISTRY.get_data_type_name(self._data_type),
             'flag': self._flag.name,
             'parent': str(self._parent.uuid) if self._parent else None,
             'is_multi_edge': self._is_multi_edge,
             'edges': [str(edge.uuid) for edge in self._edges],  # Store edge UUIDs
         }
+        options: dict[str, Any] = self.get_options()
+        if options:
+            attribute_dict['options'] = options
         return {**base_dict, **attribute_dict}  # Merge dictionaries
 
     def to_json(self) -> str:
@@ -23,10 +23,12 @@
 # ************************************************************************
 
 from __future__ import annotations
-from uuid import UUID, uuid1
-from typing import Any, Optional
+from uuid import UUID
+from typing import Any, ClassVar, Optional
 import json
 
+from flowly.core.id_generator import ID_GENERATOR, IdGenerator
+
 
 class BaseEntity:
     """
@@ -34,11 +36,14 @@ class BaseEntity:
 
     The `BaseEntity` class generates a UUID for each instance, which is used to make instances
     hashable and comparable. If a UUID is not provided during initialization, a new UUID is
-    generated automatically. The UUID is immutable after the object is created.
+    generated automatically by the class-wide `id_generator`. The UUID is immutable after the object is created.
+
+    The UUID is stored as a 128-bit int, which makes creating, hashing and comparing entities cheap. A `UUID` object is
+    only created when the `uuid` property is accessed, e.g. for serialization.
 
     Features:
         - Provides a unique identifier for each instance using a UUID.
-        - Implements hashability and equality comparison based on the UUID.
+        - Implements hashability and equality comparison based on the integer ID.
         - Supports conversion to and from dictionary and JSON representations.
         - Uses `__slots__` to reduce memory usage by limiting instance attributes.
 
@@ -55,18 +60,24 @@ class BaseEntity:
         True
     """
 
-    __slots__ = ('_uuid', '_hash')  # Use __slots__ to reduce memory usage
+    __slots__ = ('_id',)  # Use __slots__ to reduce memory usage
+
+    id_generator: ClassVar[IdGenerator] = ID_GENERATOR
 
-    def __init__(self, uuid: Optional[UUID] = None) -> None:
+    def __init__(self, uuid: Optional[UUID | int] = None) -> None:
         """
         Initializes a `BaseEntity` instance.
 
-        :param uuid: The UUID for the instance. If not provided, a new UUID is generated
-                     using `uuid1()`.
-        :type uuid: Optional[UUID]
+        :param uuid: The UUID for the instance, or its 128-bit integer value. If not provided, a new ID is generated
+                     by `id_generator`.
+        :type uuid: Optional[UUID | int]
         """
-        self._uuid: UUID = uuid or uuid1()
-        self._hash = hash(self._uuid)  # Cache the hash value
+        if uuid is None:
+            self._id: int = self.id_generator.next_id()
+        elif isinstance(uuid, int):
+            self._id: int = uuid
+        else:
+            self._id: int = uuid.int
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -77,16 +88,16 @@ class BaseEntity:
         :return: `True` if the other object is a `BaseEntity` instance with the same UUID, `False` otherwise.
         :rtype: bool
         """
-        return isinstance(other, BaseEntity) and self._uuid == other.uuid
+        return isinstance(other, BaseEntity) and self._id == other._id
 
     def __hash__(self) -> int:
         """
-        Returns the hash value of the instance, based on the cached UUID hash.
+        Returns the hash value of the instance, based on the integer ID.
 
-        :return: The hash value of the UUID.
+        :return: The hash value of the ID.
         :rtype: int
         """
-        return self._hash
+        return hash(self._id)
 
     def __repr__(self) -> str:
         """
@@ -95,7 +106,7 @@ class BaseEntity:
         :return: A string representation including the module, class name, UUID, and memory address.
         :rtype: str
         """
-        return f"<{type(self).__module__}.{type(self).__name__} {self._uuid} at {hex(id(self))}>"
+        return f"<{type(self).__module__}.{type(self).__name__} {self.uuid} at {hex(id(self))}>"
 
     @classmethod
     def from_dict(cls, data: dict[str, str]) -> BaseEntity:
@@ -129,15 +140,25 @@ class BaseEntity:
         data: dict[str, str] = json.loads(json_str)
         return cls.from_dict(data)
 
+    @property
+    def id(self) -> int:
+        """
+        Returns the unique identifier of the instance as a 128-bit integer.
+
+        :return: The integer value of the UUID.
+        :rtype: int
+        """
+        return self._id
+
     @property
     def uuid(self) -> UUID:
         """
-        Returns the UUID of the instance. The UUID is cached after the first access.
+        Returns the UUID of the instance. The UUID object is created on every access.
 
         :return: The unique identifier for this instance.
         :rtype: UUID
         """
-        return self._uuid
+        return UUID(int=self._id)
 
     def to_dict(self) -> dict[str, str]:
         """
@@ -146,7 +167,7 @@ class BaseEntity:
         :return: A dictionary with the UUID.
         :rtype: Dict[str, str]
         """
-        return {'uuid': str(self._uuid)}
+        return {'uuid': str(self.uuid)}
 
 
     def to_json(self) -> str:
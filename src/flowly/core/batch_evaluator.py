@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batch evaluation is then unavailable
+    np = None
+
+from flowly.core.enumerations import AttributeFlags
+if TYPE_CHECKING:
+    from flowly.core.attribute import Attribute
+    from flowly.core.node import Node
+    from flowly.core.node_graph import NodeGraph
+
+
+class BatchEvaluator:
+    """
+    Evaluates a node graph for many input rows in a single traversal.
+
+    The batch data maps input and option attributes to NumPy arrays whose leading axis is the batch axis, all of the
+    same length. Every node is visited once in topological order:
+        - Nodes without batched inputs are computed once, their outputs are shared by all rows.
+        - Vectorizable nodes are computed once with the whole batch, their outputs must have the same leading axis.
+        - Other nodes are computed once per row, their outputs are stacked along a new leading axis.
+
+    The evaluation runs on a separate value table, the data of the node graph's attributes, its dirty state and its
+    cache are left untouched. Unconnected attributes without batch data use their current data for every row.
+
+    Examples:
+        >>> batch_data = {source.attributes[0]: np.linspace(0, 1, 10_000)}  # doctest: +SKIP
+        >>> outputs = BatchEvaluator().run(node_graph, batch_data)  # doctest: +SKIP
+        >>> outputs[sink.attributes[-1]].shape  # doctest: +SKIP
+        (10000,)
+    """
+
+    __slots__ = ()
+
+    def run(self, node_graph: NodeGraph, batch_data: dict[Attribute, Any]) -> dict[Attribute, Any]:
+        """
+        Evaluates all nodes of the node graph for every row of the batch data.
+
+        :param node_graph: The node graph to evaluate.
+        :type node_graph: NodeGraph
+        :param batch_data: Arrays with a leading batch axis, keyed by the input or option attribute they feed.
+        :type batch_data: dict[Attribute, Any]
+        :return: The data of all output attributes. Outputs depending on the batch data have a leading batch axis.
+        :rtype: dict[Attribute, Any]
+        :raises ImportError: If NumPy is not installed.
+        :raises ValueError: If an attribute does not belong to the node graph, is an output or is connected, or if the
+                            arrays differ in their length.
+        """
+        if np is None:
+            raise ImportError("Batch evaluation requires NumPy.")
+
+        batch_size: Optional[int] = None
+        values: dict[Attribute, Any] = {}
+        for attr_item, data in batch_data.items():
+            if node_graph.get_attribute_item_by_uuid(attr_item.id) is not attr_item:
+                raise ValueError(f"Attribute {attr_item.name} does not belong to the node graph.")
+            if attr_item.flag is AttributeFlags.OUTPUT or attr_item.has_edge():
+                raise ValueError(f"Attribute {attr_item.name} is not an unconnected input or option.")
+
+            data = np.asanyarray(data)
+            if data.ndim == 0 or (batch_size is not None and len(data) != batch_size):
+                raise ValueError(f"Batch data of attribute {attr_item.name} does not match the batch size.")
+            batch_size = len(data)
+            values[attr_item] = data
+        batched: set[Attribute] = set(values)
+
+        outputs: dict[Attribute, Any] = {}
+        for node_item in node_graph.get_sorted_node_items():
+            inputs, row_getters = self._get_inputs(node_graph, node_item, values, batched)
+            output_attr_items: list[Attribute] = [
+                attr_item for attr_item in node_item.attributes if attr_item.flag is AttributeFlags.OUTPUT
+            ]
+            if not row_getters:
+                node_outputs: dict[str, Any] = node_item.compute(inputs)
+            elif node_item.is_vectorizable:
+                node_outputs: dict[str, Any] = node_item.compute(inputs)
+                batched.update(attr_item for attr_item in output_attr_items if attr_item.name in node_outputs)
+            else:
+                node_outputs: dict[str, Any] = self._compute_rows(node_item, inputs, row_getters, batch_size)
+                batched.update(attr_item for attr_item in output_attr_items if attr_item.name in node_outputs)
+
+            for attr_item in output_attr_items:
+                data: Any = node_outputs[attr_item.name] if attr_item.name in node_outputs else attr_item.data
+                values[attr_item] = outputs[attr_item] = data
+        return outputs
+
+    @staticmethod
+    def _get_inputs(
+        node_graph: NodeGraph, node_item: Node, values: dict[Attribute, Any], batched: set[Attribute]
+    ) -> tuple[dict[str, Any], dict[str, Callable[[int], Any]]]:
+        """
+        Returns the whole batch inputs of node_item by name, like `NodeGraph.get_input_data`, and a function returning
+        a single row for every input depending on the batch data.
+        """
+        inputs: dict[str, Any] = {}
+        row_getters: dict[str, Callable[[int], Any]] = {}
+        for attr_item in node_item.attributes:
+            if attr_item.flag is AttributeFlags.OUTPUT:
+                continue
+
+            upstream_attr_items: list[Attribute] = list(node_graph.main_graph.predecessors(attr_item))
+            if not upstream_attr_items:
+                inputs[attr_item.name] = values.get(attr_item, attr_item.data)
+                if attr_item in batched:
+                    row_getters[attr_item.name] = inputs[attr_item.name].__getitem__
+            elif len(upstream_attr_items) == 1:
+                inputs[attr_item.name] = values[upstream_attr_items[0]]
+                if upstream_attr_items[0] in batched:
+                    row_getters[attr_item.name] = inputs[attr_item.name].__getitem__
+            else:
+                upstream_data: list[Any] = [values[upstream_attr_item] for upstream_attr_item in upstream_attr_items]
+                inputs[attr_item.name] = upstream_data
+                if batched.intersection(upstream_attr_items):
+                    is_batched: list[bool] = [
+                        upstream_attr_item in batched for upstream_attr_item in upstream_attr_items
+                    ]
+                    row_getters[attr_item.name] = (
+                        lambda row, data=upstream_data, flags=is_batched:
+                        [item[row] if flag else item for item, flag in zip(data, flags)]
+                    )
+        return inputs, row_getters
+
+    @staticmethod
+    def _compute_rows(
+        node_item: Node, inputs: dict[str, Any], row_getters: dict[str, Callable[[int], Any]], batch_size: int
+    ) -> dict[str, Any]:
+        """Computes node_item once per row and stacks the outputs along a new leading batch axis."""
+        rows: dict[str, list[Any]] = {}
+        for row in range(batch_size):
+            row_inputs: dict[str, Any] = dict(inputs)
+            for name, row_getter in row_getters.items():
+                row_inputs[name] = row_getter(row)
+            for name, data in node_item.compute(row_inputs).items():
+                rows.setdefault(name, []).append(data)
+
+        outputs: dict[str, Any] = {}
+        for name, data in rows.items():
+            if len(data) != batch_size:
+                raise ValueError(f"Node {node_item.name} did not return output {name} for every row.")
+            try:
+                outputs[name] = np.stack([np.asanyarray(item) for item in data])
+            except ValueError:  # Ragged or mismatching rows are kept as objects
+                outputs[name] = np.empty(batch_size, dtype=object)
+                for row, item in enumerate(data):
+                    outputs[name][row] = item
+        return outputs
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import Any, BinaryIO, Callable, Optional
+from array import array
+from uuid import uuid4
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, arrays are then loaded as memoryviews
+    np = None
+
+from flowly.core.enumerations import AttributeFlags, GraphStorage
+from flowly.core.attribute import Attribute
+from flowly.core.node import Node
+from flowly.core.node_graph import NodeGraph
+from flowly.core.type_registry import TYPE_REGISTRY
+
+
+class BinaryGraphFile:
+    """
+    Reads and writes node graphs in a compact binary file format with lazily loaded attribute data.
+
+    The file starts with a fixed header holding the offsets and sizes of all sections, followed by:
+        - a string table with all class, data type and entity names, stored once each,
+        - a node table and an attribute table of fixed size records with UUIDs as 16 raw bytes,
+        - an edge table of (edge UUID, out attribute index, in attribute index) records,
+        - the attribute data as blobs, each aligned to 64 bytes.
+
+    Reading maps the file into memory and only parses the tables. The data of each attribute is materialized on its
+    first access. NumPy arrays and bytes are exposed zero-copy as read-only arrays or memoryviews of the mapped file,
+    plain JSON data, i.e. None, booleans, numbers, strings and lists and string keyed dicts of them, is decoded from
+    JSON and everything else, e.g. tuples, is unpickled, so all data is loaded with its original types.
+
+    Examples:
+        >>> BinaryGraphFile.write(node_graph, 'project.flowly')  # doctest: +SKIP
+        >>> node_graph = BinaryGraphFile.read('project.flowly')  # doctest: +SKIP
+    """
+
+    MAGIC: bytes = b'FLOWLY\x00\x01'
+    VERSION: int = 4
+    ALIGNMENT: int = 64
+
+    _HEADER: struct.Struct = struct.Struct('<8sI4x10Q')
+    _NODE: struct.Struct = struct.Struct('<16sIIIII')
+    _ATTRIBUTE: struct.Struct = struct.Struct('<16sIIIBB2xIIIQQ')
+    _EDGE: struct.Struct = struct.Struct('<16sII')
+
+    _DATA_NONE: int = 0
+    _DATA_JSON: int = 1
+    _DATA_PICKLE: int = 2
+    _DATA_BYTES: int = 3
+    _DATA_ARRAY: int = 4
+
+    @classmethod
+    def write(cls, node_graph: NodeGraph, path: str | os.PathLike) -> None:
+        """
+        Writes the node graph to a binary file. The file is written to a temporary file next to the target, which then
+        replaces the target, so a graph read lazily from the target can be written back to it.
+
+        :param node_graph: The node graph to write.
+        :type node_graph: NodeGraph
+        :param path: The path of the file to create or overwrite.
+        :type path: str | os.PathLike
+        """
+        strings: dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            return strings.setdefault(value, len(strings))
+
+        attribute_indices: dict[Attribute, int] = {}
+        node_records: list[bytes] = []
+        attribute_fields: list[list[Any]] = []
+        blobs: list[Any] = []
+
+        for node_item in node_graph.node_items:
+            node_options: dict[str, Any] = node_item.get_options()
+            node_records.append(cls._NODE.pack(
+                node_item.id.to_bytes(16, 'big'),
+                intern(f"{type(node_item).__module__}.{type(node_item).__qualname__}"), intern(node_item.name),
+                len(attribute_indices), len(node_item.attributes),
+                intern(json.dumps(node_options) if node_options else '')
+            ))
+            for attr_item in node_item.attributes:
+                attribute_indices[attr_item] = len(attribute_indices)
+                data_kind, data_meta, blob = cls._encode_data(attr_item.data)
+                options: dict[str, Any] = attr_item.get_options()
+                blobs.append(blob)
+                attribute_fields.append([
+                    attr_item.id.to_bytes(16, 'big'),
+                    intern(f"{type(attr_item).__module__}.{type(attr_item).__qualname__}"), intern(attr_item.name),
+                    intern(TYPE_REGISTRY.get_data_type_name(attr_item.data_type) or ''),
+                    attr_item.flag.value, attr_item.is_multi_edge, data_kind, intern(data_meta),
+                    intern(json.dumps(options) if options else ''), 0, 0
+                ])
+
+        edge_records: list[bytes] = [
+            cls._EDGE.pack(
+                edge_item.id.to_bytes(16, 'big'), attribute_indices[edge_item.source],
+                attribute_indices[edge_item.target]
+            )
+            for edge_item in node_graph.iter_edge_items()
+        ]
+
+        encoded_strings: list[bytes] = [value.encode('utf-8') for value in strings]
+        string_offsets: array = array('Q', [0])
+        for encoded_string in encoded_strings:
+            string_offsets.append(string_offsets[-1] + len(encoded_string))
+        if sys.byteorder != 'little':
+            string_offsets.byteswap()
+
+        strings_offset: int = cls._HEADER.size
+        nodes_offset: int = strings_offset + len(string_offsets) * 8 + string_offsets[-1]
+        attributes_offset: int = nodes_offset + len(node_records) * cls._NODE.size
+        edges_offset: int = attributes_offset + len(attribute_fields) * cls._ATTRIBUTE.size
+        blobs_offset: int = cls._align(edges_offset + len(edge_records) * cls._EDGE.size)
+
+        blob_offset: int = blobs_offset
+        for fields, blob in zip(attribute_fields, blobs):
+            if blob is not None:
+                fields[9] = blob_offset
+                fields[10] = memoryview(blob).nbytes
+                blob_offset = cls._align(blob_offset + fields[10])
+
+        # Blobs of lazily loaded attributes may be views of the target's mapping, which truncating it would invalidate
+        directory, file_name = os.path.split(os.path.abspath(path))
+        temp_path: str = os.path.join(directory, f".{file_name}.{uuid4().hex[:8]}.tmp")
+        try:
+            with open(temp_path, 'xb') as file:
+                file.write(cls._HEADER.pack(
+                    cls.MAGIC, cls.VERSION, strings_offset, len(encoded_strings), nodes_offset, len(node_records),
+                    attributes_offset, len(attribute_fields), edges_offset, len(edge_records), blobs_offset,
+                    blob_offset - blobs_offset
+                ))
+                file.write(string_offsets.tobytes())
+                file.write(b''.join(encoded_strings))
+                file.write(b''.join(node_records))
+                file.write(b''.join(cls._ATTRIBUTE.pack(*fields) for fields in attribute_fields))
+                file.write(b''.join(edge_records))
+                for fields, blob in zip(attribute_fields, blobs):
+                    if blob is not None:
+                        cls._pad(file, fields[9])
+                        file.write(blob)
+                cls._pad(file, blob_offset)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    @classmethod
+    def read(cls, path: str | os.PathLike, storage: GraphStorage = GraphStorage.NETWORKX) -> NodeGraph:
+        """
+        Opens a binary file as a node graph. The attribute data is loaded lazily from the memory mapped file.
+
+        :param path: The path of the file to read.
+        :type path: str | os.PathLike
+        :param storage: The main graph storage of the created node graph.
+        :type storage: GraphStorage
+        :return: The deserialized node graph.
+        :rtype: NodeGraph
+        :raises ValueError: If the file is not a valid graph file.
+        """
+        with open(path, 'rb') as file:
+            buffer: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(buffer) < cls._HEADER.size:
+            raise ValueError(f"Invalid graph file: {path}")
+        (magic, version, strings_offset, string_count, nodes_offset, node_count, attributes_offset, attribute_count,
+         edges_offset, edge_count, _, _) = cls._HEADER.unpack_from(buffer)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"Invalid graph file or unsupported version: {path}")
+
+        view: memoryview = memoryview(buffer)
+        string_offsets: array = array('Q')
+        string_offsets.frombytes(view[strings_offset:strings_offset + (string_count + 1) * 8])
+        if sys.byteorder != 'little':
+            string_offsets.byteswap()
+        string_data: bytes = bytes(view[strings_offset + (string_count + 1) * 8:nodes_offset])
+        strings: list[str] = [
+            string_data[string_offsets[index]:string_offsets[index + 1]].decode('utf-8')
+            for index in range(string_count)
+        ]
+
+        attribute_items: list[Attribute] = []
+        attribute_records = cls._ATTRIBUTE.iter_unpack(
+            view[attributes_offset:attributes_offset + attribute_count * cls._ATTRIBUTE.size]
+        )
+        node_items: list[Node] = []
+        for node_uuid, class_index, name_index, _, node_attribute_count, node_options_index in cls._NODE.iter_unpack(
+                view[nodes_offset:nodes_offset + node_count * cls._NODE.size]):
+            node_item: Node = TYPE_REGISTRY.resolve_class(strings[class_index])(
+                uuid=int.from_bytes(node_uuid, 'big'), name=strings[name_index],
+                **(json.loads(strings[node_options_index]) if strings[node_options_index] else {})
+            )
+            node_attribute_items: list[Attribute] = []
+            for _ in range(node_attribute_count):
+                (attribute_uuid, class_index, name_index, data_type_index, flag, is_multi_edge, data_kind, meta_index,
+                 options_index, data_offset, data_length) = next(attribute_records)
+
+                attr_item: Attribute = TYPE_REGISTRY.resolve_class(strings[class_index])(
+                    uuid=int.from_bytes(attribute_uuid, 'big'), name=strings[name_index],
+                    data_type=TYPE_REGISTRY.resolve_data_type(strings[data_type_index] or None),
+                    flag=AttributeFlags(flag), parent=node_item, is_multi_edge=bool(is_multi_edge),
+                    **(json.loads(strings[options_index]) if strings[options_index] else {})
+                )
+                if data_kind != cls._DATA_NONE:
+                    attr_item.set_data_loader(cls._create_loader(
+                        view, data_kind, strings[meta_index], data_offset, data_length
+                    ))
+                node_attribute_items.append(attr_item)
+                attribute_items.append(attr_item)
+            node_item.attributes[:] = node_attribute_items
+            node_items.append(node_item)
+
+        node_graph: NodeGraph = NodeGraph(storage)
+        node_graph.add_node_items(node_items)
+
+        for edge_uuid, out_index, in_index in cls._EDGE.iter_unpack(
+                view[edges_offset:edges_offset + edge_count * cls._EDGE.size]):
+            node_graph.connect_attribute_items(
+                attribute_items[out_index], attribute_items[in_index], int.from_bytes(edge_uuid, 'big')
+            )
+        return node_graph
+
+    @classmethod
+    def _encode_data(cls, data: Any) -> tuple[int, str, Optional[Any]]:
+        """Returns the data kind, a metadata string and a buffer holding the encoded data."""
+        if data is None:
+            return cls._DATA_NONE, '', None
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return cls._DATA_BYTES, '', memoryview(data).cast('B')
+        if hasattr(data, '__array_interface__') and not data.dtype.hasobject:
+            meta: str = json.dumps({'dtype': data.dtype.str, 'shape': list(data.shape)})
+            if data.flags.c_contiguous and data.size and data.dtype.char not in 'mM':
+                return cls._DATA_ARRAY, meta, memoryview(data).cast('B')
+            return cls._DATA_ARRAY, meta, data.tobytes()
+        if cls._is_plain_json(data):
+            return cls._DATA_JSON, '', json.dumps(data).encode('utf-8')
+        return cls._DATA_PICKLE, '', pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def _is_plain_json(cls, data: Any) -> bool:
+        """Checks if the data is loaded from JSON with the same types, i.e. no tuples, non-string keys or subclasses."""
+        data_type: type = type(data)
+        if data is None or data_type in (bool, int, float, str):
+            return True
+        if data_type is list:
+            return all(cls._is_plain_json(item) for item in data)
+        if data_type is dict:
+            return all(type(key) is str and cls._is_plain_json(item) for key, item in data.items())
+        return False
+
+    @classmethod
+    def _create_loader(
+        cls, view: memoryview, data_kind: int, meta: str, offset: int, length: int
+    ) -> Callable[[], Any]:
+        """Creates the function materializing an attribute's data from the mapped file."""
+        def load() -> Any:
+            blob: memoryview = view[offset:offset + length]
+            if data_kind == cls._DATA_BYTES:
+                return blob
+            if data_kind == cls._DATA_ARRAY:
+                array_meta: dict[str, Any] = json.loads(meta)
+                if np is None:
+                    return blob
+                return np.frombuffer(blob, dtype=np.dtype(array_meta['dtype'])).reshape(array_meta['shape'])
+            if data_kind == cls._DATA_JSON:
+                return json.loads(bytes(blob))
+            return pickle.loads(blob)
+        return load
+
+    @classmethod
+    def _align(cls, offset: int) -> int:
+        """Rounds the offset up to the next multiple of the blob alignment."""
+        return -(-offset // cls.ALIGNMENT) * cls.ALIGNMENT
+
+    @staticmethod
+    def _pad(file: BinaryIO, offset: int) -> None:
+        """Writes zero bytes until the file position reaches the offset."""
+        padding: int = offset - file.tell()
+        if padding > 0:
+            file.write(b'\x00' * padding)
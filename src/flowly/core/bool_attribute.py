@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+from uuid import UUID
+
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.attribute import Attribute
+if TYPE_CHECKING:
+    from flowly.core.node import Node
+    from flowly.core.edge import Edge
+
+_TRUE_WORDS: frozenset[str] = frozenset(('true', 'yes', 'on', '1'))
+_FALSE_WORDS: frozenset[str] = frozenset(('false', 'no', 'off', '0'))
+
+
+class BoolAttribute(Attribute):
+    """
+    An attribute holding a single boolean value.
+
+    Assigned data is converted to a bool, so that NumPy scalars are stored as plain Python bools. Strings are parsed
+    as words like "true" and "false" instead of by their length. Lists, as gathered from several connected edges, are
+    kept as they are. Boolean data may be passed to boolean, integer and float
+    attributes.
+
+    Inherits:
+        Attribute: Provides the data, edge and serialization handling.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+            self,
+            uuid: Optional[UUID | int] = None,
+            name: str = "Attribute",
+            data: Any = None,
+            data_type: type = bool,
+            flag: AttributeFlags = AttributeFlags.INPUT,
+            parent: Optional[Node] = None,
+            is_multi_edge: bool = True,
+            edges: Optional[Iterable[Edge]] = None
+    ) -> None:
+        super().__init__(
+            uuid=uuid, name=name, data=data, data_type=data_type, flag=flag, parent=parent, is_multi_edge=is_multi_edge,
+            edges=edges
+        )
+
+    def _convert_data(self, value: Any) -> Any:
+        """
+        Converts the data to a bool.
+
+        :param value: The assigned or loaded data.
+        :type value: Any
+        :return: The converted data, or the data itself if it is None or a list.
+        :rtype: Any
+        :raises ValueError: If the data cannot be converted.
+        """
+        if value is None or isinstance(value, list):
+            return value
+        if isinstance(value, str):
+            word: str = value.strip().lower()
+            if word in _TRUE_WORDS:
+                return True
+            if word in _FALSE_WORDS:
+                return False
+            raise ValueError(f"Invalid boolean data: {value!r}")
+        try:
+            return bool(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid boolean data: {value!r}") from e
+
+    def is_compatible_with(self, other: Attribute) -> bool:
+        """
+        Checks if the data of this attribute can be passed to another attribute through an edge.
+
+        :param other: The attribute receiving the data.
+        :type other: Attribute
+        :return: True if the other attribute accepts booleans, otherwise False.
+        :rtype: bool
+        """
+        return other.data_type in (bool, int, float) or super().is_compatible_with(other)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable
+import inspect
+
+from flowly.core.enumerations import AttributeFlags
+if TYPE_CHECKING:
+    from flowly.core.attribute import Attribute
+    from flowly.core.node import Node
+    from flowly.core.node_graph import NodeGraph
+
+
+class CompiledGraph:
+    """
+    Evaluates a node graph through generated functions, each fusing a tree of pure nodes into a single call.
+
+    Compiling partitions the nodes into groups. A pure node whose outputs all feed one single pure downstream node is
+    merged into the group of that node, so linear chains and fan-in trees end up in one group rooted at their last node.
+    For every group, Python source is generated that calls the compute functions of its nodes in order, passing
+    intermediate results as local variables, and is compiled into one function.
+
+    Running the compiled graph calls the function of every group containing a dirty node, in topological order, writes
+    the outputs of the group's root node and explicitly marks all nodes of the group clean. The outputs of the other
+    nodes are not written: they stay in the function's local variables and are handed to their output attributes as
+    data loaders, see `NodeGraph.defer_output_data`, so they are only materialized if read. The dirty set therefore
+    stays closed downstream, and later edits and a regular `NodeGraph.evaluate` see the same state as after an
+    uncompiled evaluation. The node cache is not used. A compiled graph reflects the topology at compile time and is
+    obtained from `NodeGraph.compile`, which caches it until the topology version changes.
+
+    Examples:
+        >>> compiled_graph = node_graph.compile()  # doctest: +SKIP
+        >>> for value in values:  # doctest: +SKIP
+        ...     source.attributes[0].data = value
+        ...     compiled_graph.run()
+    """
+
+    __slots__ = ('_node_graph', '_topology_version', '_groups')
+
+    def __init__(self, node_graph: NodeGraph) -> None:
+        """
+        Compiles the node graph.
+
+        :param node_graph: The node graph to compile.
+        :type node_graph: NodeGraph
+        :raises ValueError: If a node has an asynchronous compute function.
+        """
+        self._node_graph: NodeGraph = node_graph
+        self._topology_version: int = node_graph.topology_version
+        self._groups: list[
+            tuple[Callable[..., tuple[dict[str, Any], ...]], list[Node], Node, list[Attribute], str]
+        ] = []
+
+        sorted_node_items: list[Node] = node_graph.get_sorted_node_items()
+        roots: dict[Node, Node] = {}
+        for node_item in reversed(sorted_node_items):
+            if inspect.iscoroutinefunction(node_item.compute):
+                raise ValueError(f"Node {node_item.name} has an asynchronous compute function.")
+
+            root: Node = roots.setdefault(node_item, node_item)
+            if not node_item.is_pure:
+                continue
+            for upstream_node_item in self._get_upstream_node_items(node_item):
+                if (upstream_node_item.is_pure and upstream_node_item not in roots and
+                        set(node_graph.get_downstream_node_items(upstream_node_item)) == {node_item}):
+                    roots[upstream_node_item] = root
+
+        members: dict[Node, list[Node]] = {}
+        for node_item in sorted_node_items:
+            members.setdefault(roots[node_item], []).append(node_item)
+        for root, node_items in members.items():
+            self._groups.append(self._compile_group(root, node_items))
+
+    @property
+    def node_graph(self) -> NodeGraph:
+        """
+        Returns the compiled node graph.
+
+        :return: The node graph.
+        :rtype: NodeGraph
+        """
+        return self._node_graph
+
+    @property
+    def topology_version(self) -> int:
+        """
+        Returns the topology version of the node graph at compile time.
+
+        :return: The topology version.
+        :rtype: int
+        """
+        return self._topology_version
+
+    @property
+    def group_count(self) -> int:
+        """
+        Returns the number of generated functions, i.e. the number of calls per full evaluation.
+
+        :return: The number of node groups.
+        :rtype: int
+        """
+        return len(self._groups)
+
+    def get_sources(self) -> list[str]:
+        """
+        Returns the generated source code of every group function, e.g. for debugging.
+
+        :return: The source code per group, in evaluation order.
+        :rtype: list[str]
+        """
+        return [source for *_, source in self._groups]
+
+    def run(self) -> None:
+        """
+        Calls the functions of all groups containing a dirty node, stores the outputs of their root nodes and defers
+        the outputs of their other nodes.
+
+        :raises ValueError: If the topology of the node graph changed since compiling.
+        """
+        if self._topology_version != self._node_graph.topology_version:
+            raise ValueError("The node graph topology changed, compile it again.")
+
+        dirty_node_items: set[Node] = self._node_graph.dirty_node_items
+        for function, node_items, root, input_attr_items, _ in self._groups:
+            if not dirty_node_items.isdisjoint(node_items):
+                results: tuple[dict[str, Any], ...] = function(*[attr_item.data for attr_item in input_attr_items])
+                for node_item, outputs in zip(node_items, results):
+                    if node_item is root:
+                        self._node_graph.set_output_data(node_item, outputs)
+                    else:
+                        self._node_graph.defer_output_data(node_item, outputs)
+
+    def _get_upstream_node_items(self, node_item: Node) -> set[Node]:
+        """Returns the node_items feeding an input or option of node_item."""
+        return {
+            upstream_attr_item.parent
+            for attr_item in node_item.attributes if attr_item.flag is not AttributeFlags.OUTPUT
+            for upstream_attr_item in self._node_graph.main_graph.predecessors(attr_item)
+        }
+
+    def _compile_group(
+        self, root: Node, node_items: list[Node]
+    ) -> tuple[Callable[..., tuple[dict[str, Any], ...]], list[Node], Node, list[Attribute], str]:
+        """
+        Generates and compiles the function of a group. Its arguments are the data of all attribute_items read from
+        outside the group: unconnected inputs and options, and outputs of upstream groups. It returns the outputs of
+        every node of the group, in the order of node_items.
+        """
+        namespace: dict[str, Any] = {}
+        input_attr_items: list[Attribute] = []
+        results: dict[Node, str] = {}
+
+        def read(attr_item: Attribute) -> str:
+            """Returns the expression reading attr_item. Outputs missing in a group result keep their current data."""
+            input_attr_items.append(attr_item)
+            argument: str = f"a{len(input_attr_items) - 1}"
+            if attr_item.parent in results:
+                return f"{results[attr_item.parent]}.get({attr_item.name!r}, {argument})"
+            return argument
+
+        lines: list[str] = []
+        for index, node_item in enumerate(node_items):
+            namespace[f"compute_{index}"] = node_item.compute
+            arguments: list[str] = []
+            for attr_item in node_item.attributes:
+                if attr_item.flag is AttributeFlags.OUTPUT:
+                    continue
+                upstream_attr_items: list[Attribute] = list(self._node_graph.main_graph.predecessors(attr_item))
+                if not upstream_attr_items:
+                    value: str = read(attr_item)
+                elif len(upstream_attr_items) == 1:
+                    value: str = read(upstream_attr_items[0])
+                else:
+                    value: str = f"[{', '.join(map(read, upstream_attr_items))}]"
+                arguments.append(f"{attr_item.name!r}: {value}")
+            results[node_item] = f"r{index}"
+            lines.append(f"    r{index} = compute_{index}({{{', '.join(arguments)}}})")
+
+        parameters: str = ', '.join(f"a{index}" for index in range(len(input_attr_items)))
+        returned: str = ''.join(f"r{index}, " for index in range(len(node_items)))
+        source: str = '\n'.join([f"def fused({parameters}):", *lines, f"    return {returned.rstrip()}", ''])
+        exec(compile(source, f"<flowly fused {root.name}>", 'exec'), namespace)
+        return namespace['fused'], node_items, root, input_attr_items, source
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Connection, wait
+from multiprocessing.shared_memory import SharedMemory
+import io
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import traceback
+
+import networkx as nx
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.group_node import GroupNode
+from flowly.core.profiler import Profiler
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, all data is then pickled
+    np = None
+
+if TYPE_CHECKING:
+    from flowly.core.attribute import Attribute
+    from flowly.core.execution_plan import ExecutionPlan
+    from flowly.core.node import Node
+    from flowly.core.node_graph import NodeGraph
+
+# Steps sent to a worker: the position of the node in the partition, its inputs as (name, source attribute IDs, whether
+# the sources are gathered into a list), and its outputs as (name, attribute ID).
+Step = tuple[int, list[tuple[str, tuple[int, ...], bool]], list[tuple[str, int]]]
+
+# Shared memory segments attached by this process. Workers keep them open for zero-copy views until they exit, the
+# coordinating process copies arrays out and closes the segments immediately.
+_ATTACHED_SEGMENTS: list[SharedMemory] = []
+_ZERO_COPY: list[bool] = [False]
+
+
+def _attach_shared_array(name: str, shape: tuple[int, ...], dtype: str) -> Any:
+    """Unpickles an array from a shared memory segment. Defined on module level, so that pickles can reference it."""
+    segment: SharedMemory = SharedMemory(name=name)
+    view: Any = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+    if not _ZERO_COPY[0]:
+        array: Any = view.copy()
+        del view
+        segment.close()
+        return array
+
+    _ATTACHED_SEGMENTS.append(segment)
+    view.flags.writeable = False
+    return view
+
+
+class _SharedMemoryPickler(pickle.Pickler):
+    """A pickler moving large NumPy arrays into new shared memory segments and pickling only their names."""
+
+    def __init__(self, file: io.BytesIO, threshold: int) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.threshold: int = threshold
+        self.segment_names: list[str] = []
+
+    def reducer_override(self, obj: Any) -> Any:
+        if np is None or type(obj) is not np.ndarray or obj.nbytes < max(self.threshold, 1) or obj.dtype.hasobject:
+            return NotImplemented
+
+        segment: SharedMemory = SharedMemory(create=True, size=obj.nbytes)
+        target: Any = np.ndarray(obj.shape, dtype=obj.dtype, buffer=segment.buf)
+        target[...] = obj
+        del target
+        segment.close()
+        self.segment_names.append(segment.name)
+        return _attach_shared_array, (segment.name, obj.shape, obj.dtype.str)
+
+
+def _dumps(value: Any, threshold: int, segment_names: list[str]) -> bytes:
+    """Pickles value, moving large arrays to shared memory and appending the names of the new segments."""
+    buffer: io.BytesIO = io.BytesIO()
+    pickler: _SharedMemoryPickler = _SharedMemoryPickler(buffer, threshold)
+    pickler.dump(value)
+    segment_names.extend(pickler.segment_names)
+    return buffer.getvalue()
+
+
+def _get_inner_node_items(node_item: Node) -> list[Node]:
+    """Returns the nodes nested in node_item, including those of nested groups, or an empty list for other nodes."""
+    inner_node_items: list[Node] = []
+    if isinstance(node_item, GroupNode):
+        for inner_node_item in node_item.inner_graph.node_items:
+            inner_node_items.append(inner_node_item)
+            inner_node_items.extend(_get_inner_node_items(inner_node_item))
+    return inner_node_items
+
+
+def _get_inner_state(inner_node_items: list[Node], data_before: dict[int, Any]) -> tuple[dict[int, Any], list[int]]:
+    """
+    Returns the data of the inner attributes that changed since data_before was recorded, and the IDs of the clean
+    inner nodes, so the coordinating process can bring its copy of a group up to date.
+    """
+    changed_data: dict[int, Any] = {
+        attr_item.id: attr_item.data for inner_node_item in inner_node_items for attr_item in inner_node_item.attributes
+        if attr_item.is_data_loaded and data_before.get(attr_item.id, data_before) is not attr_item.data
+    }
+    clean_ids: list[int] = [
+        inner_node_item.id for inner_node_item in inner_node_items
+        if inner_node_item not in inner_node_item.node_graph.dirty_node_items
+    ]
+    return changed_data, clean_ids
+
+
+def _set_inner_state(node_item: Node, inner_state: tuple[dict[int, Any], list[int]]) -> None:
+    """Applies the inner state computed by a worker to the nested graphs of a group, see `_get_inner_state`."""
+    changed_data, clean_ids = inner_state
+    inner_node_items: list[Node] = _get_inner_node_items(node_item)
+    attr_items: dict[int, Attribute] = {
+        attr_item.id: attr_item for inner_node_item in inner_node_items for attr_item in inner_node_item.attributes
+    }
+    for attribute_id, data in changed_data.items():
+        attr_items[attribute_id].data = data
+
+    clean_id_set: set[int] = set(clean_ids)
+    for inner_node_item in inner_node_items:
+        if inner_node_item.id in clean_id_set and inner_node_item in inner_node_item.node_graph.dirty_node_items:
+            inner_node_item.node_graph.set_output_data(inner_node_item, {})
+
+
+def _worker_main(connection: Connection, threshold: int, profile: bool) -> None:
+    """
+    Runs in a worker process: receives a partition and its steps, computes the nodes in order and sends their outputs.
+    Values from other partitions arrive as messages, which a receiver thread queues, so sending never blocks the
+    coordinator while it forwards values to this worker.
+    """
+    _ZERO_COPY[0] = True
+    _, node_payload, steps, initial_payload = connection.recv()
+    node_items: list[Node] = pickle.loads(node_payload)
+    values: dict[int, Any] = pickle.loads(initial_payload)
+    messages: queue.SimpleQueue = queue.SimpleQueue()
+
+    def receive() -> None:
+        try:
+            while True:
+                message: tuple[Any, ...] = connection.recv()
+                messages.put(message)
+                if message[0] == 'stop':
+                    return
+        except (EOFError, OSError):
+            messages.put(('stop',))
+
+    threading.Thread(target=receive, daemon=True).start()
+    try:
+        for position, inputs_spec, outputs_spec in steps:
+            inputs: dict[str, Any] = {}
+            for name, source_ids, is_list in inputs_spec:
+                for source_id in source_ids:
+                    while source_id not in values:
+                        message = messages.get()
+                        if message[0] == 'stop':
+                            return
+                        values[message[1]] = pickle.loads(message[2])
+                inputs[name] = [values[source_id] for source_id in source_ids] if is_list else values[source_ids[0]]
+
+            node_item: Node = node_items[position]
+            inner_node_items: list[Node] = _get_inner_node_items(node_item)
+            data_before: dict[int, Any] = {
+                attr_item.id: attr_item.data for inner_node_item in inner_node_items
+                for attr_item in inner_node_item.attributes if attr_item.is_data_loaded
+            }
+            segment_names: list[str] = []
+            payloads: dict[str, bytes] = {}
+            inner_payload: Optional[bytes] = None
+            try:
+                if profile:
+                    outputs, sample = Profiler.measure_call(node_item.compute, inputs)
+                else:
+                    outputs, sample = node_item.compute(inputs), None
+                for name, attribute_id in outputs_spec:
+                    if name in outputs:
+                        values[attribute_id] = outputs[name]
+                        payloads[name] = _dumps(outputs[name], threshold, segment_names)
+                if inner_node_items:
+                    inner_payload = _dumps(
+                        _get_inner_state(inner_node_items, data_before), threshold, segment_names
+                    )
+            except Exception as error:
+                try:
+                    error_payload: bytes = pickle.dumps(error)
+                except Exception:
+                    error_payload = pickle.dumps(RuntimeError(traceback.format_exc()))
+                connection.send(('error', position, error_payload, segment_names))
+                return
+            connection.send(('outputs', position, payloads, segment_names, sample, inner_payload))
+
+        while messages.get()[0] != 'stop':
+            pass
+    finally:
+        values.clear()
+        for segment in _ATTACHED_SEGMENTS:
+            try:
+                segment.close()
+            except BufferError:  # A view is still referenced, the mapping is released when the process exits
+                pass
+
+
+class DistributedScheduler:
+    """
+    Evaluates the dirty nodes of a node graph on several local worker processes.
+
+    The dirty nodes are partitioned into one group per worker by recursive Kernighan-Lin bisection of the node level
+    graph, which keeps the number of edges between partitions small. Each worker receives its nodes once and computes
+    them in topological order. Data flowing along an edge inside a partition never leaves the worker. Outputs are sent
+    to the coordinating process, which stores them in the node graph and forwards the ones consumed by other partitions.
+
+    NumPy arrays of at least `shared_memory_threshold` bytes, also inside nodes or containers, are moved to
+    `multiprocessing.shared_memory` segments and only their names are pickled. Workers map received arrays zero-copy as
+    read-only views, and the coordinating process copies them out once. All other values and the control messages are
+    pickled over local pipes. The segments are released at the end of each run.
+
+    Nodes and their data must be picklable, and the compute functions run on copies of the nodes. For group nodes, the
+    workers also send back the changed data and the clean state of the inner nodes, so the nested graphs in the
+    coordinating process do not go stale. The node graph's cache is not consulted.
+
+    Examples:
+        >>> scheduler = DistributedScheduler(worker_count=4)
+        >>> node_graph.evaluate(scheduler=scheduler)  # doctest: +SKIP
+    """
+
+    __slots__ = ('_worker_count', '_shared_memory_threshold', '_start_method', '_join_timeout')
+
+    def __init__(
+        self,
+        worker_count: Optional[int] = None,
+        shared_memory_threshold: int = 64 * 1024,
+        start_method: Optional[str] = None,
+        join_timeout: float = 5.0
+    ) -> None:
+        """
+        Initializes a `DistributedScheduler` instance.
+
+        :param worker_count: The number of worker processes. Defaults to the number of CPUs.
+        :type worker_count: Optional[int]
+        :param shared_memory_threshold: The minimum size in bytes of arrays passed through shared memory.
+        :type shared_memory_threshold: int
+        :param start_method: The multiprocessing start method, e.g. 'spawn'. Defaults to the platform default.
+        :type start_method: Optional[str]
+        :param join_timeout: The seconds to wait for a worker to exit before terminating it.
+        :type join_timeout: float
+        :raises ValueError: If `worker_count` is smaller than one.
+        """
+        if worker_count is not None and worker_count < 1:
+            raise ValueError("The number of workers must be at least one.")
+
+        self._worker_count: int = worker_count or os.cpu_count() or 1
+        self._shared_memory_threshold: int = shared_memory_threshold
+        self._start_method: Optional[str] = start_method
+        self._join_timeout: float = join_timeout
+
+    @property
+    def worker_count(self) -> int:
+        """
+        Gets the number of worker processes.
+
+        :return: The number of workers.
+        :rtype: int
+        """
+        return self._worker_count
+
+    @staticmethod
+    def partition(node_graph: NodeGraph, node_items: Iterable[Node], part_count: int) -> list[list[Node]]:
+        """
+        Splits nodes into up to part_count parts of similar size with few edges between them, by repeatedly bisecting
+        the largest part with the Kernighan-Lin algorithm. Edges are weighted by the number of connections between two
+        nodes. Each part keeps the order of node_items.
+
+        :param node_graph: The node graph containing the nodes.
+        :type node_graph: NodeGraph
+        :param node_items: The nodes to partition.
+        :type node_items: Iterable[Node]
+        :param part_count: The maximum number of parts.
+        :type part_count: int
+        :return: The non-empty parts.
+        :rtype: list[list[Node]]
+        """
+        node_items = list(node_items)
+        dependency_graph: nx.Graph = nx.Graph()
+        dependency_graph.add_nodes_from(node_items)
+        for node_item in node_items:
+            for downstream_node_item in node_graph.get_downstream_node_items(node_item):
+                if downstream_node_item in dependency_graph and downstream_node_item is not node_item:
+                    if dependency_graph.has_edge(node_item, downstream_node_item):
+                        dependency_graph[node_item][downstream_node_item]['weight'] += 1
+                    else:
+                        dependency_graph.add_edge(node_item, downstream_node_item, weight=1)
+
+        parts: list[set[Node]] = [set(node_items)] if node_items else []
+        while 0 < len(parts) < part_count:
+            largest_part: set[Node] = max(parts, key=len)
+            if len(largest_part) < 2:
+                break
+            parts.remove(largest_part)
+            parts.extend(nx.algorithms.community.kernighan_lin_bisection(
+                dependency_graph.subgraph(largest_part), weight='weight', seed=0
+            ))
+        return [[node_item for node_item in node_items if node_item in part] for part in parts]
+
+    def run(self, node_graph: NodeGraph, node_items: Optional[Iterable[Node]] = None) -> None:
+        """
+        Computes all dirty nodes of the node graph on the worker processes.
+
+        :param node_graph: The node graph to evaluate.
+        :type node_graph: NodeGraph
+        :param node_items: The dirty nodes to compute, which must include their dirty upstream nodes. Defaults to all
+                           dirty nodes.
+        :type node_items: Optional[Iterable[Node]]
+        :raises Exception: Re-raises the exception of a failed compute function.
+        :raises RuntimeError: If a worker process exits unexpectedly.
+        """
+        plan: ExecutionPlan = node_graph.get_execution_plan()
+        dirty_node_items: list[Node] = sorted(
+            node_items if node_items is not None else node_graph.dirty_node_items, key=plan.positions.__getitem__
+        )
+        if not dirty_node_items:
+            return
+
+        parts: list[list[Node]] = self.partition(node_graph, dirty_node_items, self._worker_count)
+        producers: dict[int, int] = {
+            attr_item.id: worker_index
+            for worker_index, part in enumerate(parts) for node_item in part
+            for attr_item in node_item.attributes if attr_item.flag is AttributeFlags.OUTPUT
+        }
+
+        steps: list[list[Step]] = [[] for _ in parts]
+        initial_values: list[dict[int, Any]] = [{} for _ in parts]
+        consumers: dict[int, set[int]] = {}
+        for worker_index, part in enumerate(parts):
+            for position, node_item in enumerate(part):
+                inputs_spec: list[tuple[str, tuple[int, ...], bool]] = []
+                for attr_item, upstream_attr_items in plan.get_input_slots(node_item):
+                    if not upstream_attr_items:
+                        initial_values[worker_index][attr_item.id] = attr_item.data
+                    for upstream_attr_item in upstream_attr_items:
+                        if upstream_attr_item.id not in producers:
+                            initial_values[worker_index][upstream_attr_item.id] = upstream_attr_item.data
+                        else:
+                            consumers.setdefault(upstream_attr_item.id, set()).add(worker_index)
+                    inputs_spec.append((
+                        attr_item.name, tuple(upstream_attr_item.id for upstream_attr_item in upstream_attr_items)
+                        or (attr_item.id,), len(upstream_attr_items) > 1
+                    ))
+                outputs_spec: list[tuple[str, int]] = list(
+                    (name, attr_item.id) for name, attr_item in plan.get_output_slots(node_item).items()
+                )
+                steps[worker_index].append((position, inputs_spec, outputs_spec))
+
+        context: Any = multiprocessing.get_context(self._start_method)
+        profiler: Optional[Profiler] = node_graph.profiler
+        connections: list[Connection] = []
+        processes: list[Any] = []
+        segment_names: list[str] = []
+        # Workers inherit the running resource tracker, so segments created by them are released by unlinking them here
+        resource_tracker.ensure_running()
+        try:
+            for worker_index, part in enumerate(parts):
+                connection, worker_connection = context.Pipe()
+                process = context.Process(
+                    target=_worker_main, args=(worker_connection, self._shared_memory_threshold, profiler is not None),
+                    daemon=True
+                )
+                process.start()
+                worker_connection.close()
+                connections.append(connection)
+                processes.append(process)
+                connection.send((
+                    'run', _dumps(part, self._shared_memory_threshold, segment_names), steps[worker_index],
+                    _dumps(initial_values[worker_index], self._shared_memory_threshold, segment_names)
+                ))
+
+            remaining: int = len(dirty_node_items)
+            while remaining:
+                for connection in wait(connections):
+                    try:
+                        message: tuple[Any, ...] = connection.recv()
+                    except EOFError:
+                        raise RuntimeError("A worker process exited unexpectedly.") from None
+
+                    worker_index: int = connections.index(connection)
+                    if message[0] == 'error':
+                        segment_names.extend(message[3])
+                        raise pickle.loads(message[2])
+
+                    _, position, payloads, output_segment_names, sample, inner_payload = message
+                    segment_names.extend(output_segment_names)
+                    node_item: Node = parts[worker_index][position]
+                    if sample is not None:
+                        profiler.add_sample('node', node_item.name, node_item.uuid, sample)
+                    if inner_payload is not None:
+                        _set_inner_state(node_item, pickle.loads(inner_payload))
+                    node_graph.set_output_data(
+                        node_item, {name: pickle.loads(payload) for name, payload in payloads.items()}
+                    )
+
+                    for name, attr_item in plan.get_output_slots(node_item).items():
+                        targets: set[int] = consumers.get(attr_item.id, set())
+                        payload: Optional[bytes] = payloads.get(name)
+                        if payload is None:
+                            # Missing outputs keep their data, which the producing worker does not know either
+                            payload = _dumps(attr_item.data, self._shared_memory_threshold, segment_names)
+                        else:
+                            targets = targets - {worker_index}
+                        for target_index in targets:
+                            connections[target_index].send(('value', attr_item.id, payload))
+                    remaining -= 1
+        finally:
+            for connection in connections:
+                try:
+                    connection.send(('stop',))
+                except OSError:
+                    pass
+            for process in processes:
+                process.join(self._join_timeout)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            for connection in connections:
+                connection.close()
+            for name in segment_names:
+                try:
+                    segment: SharedMemory = SharedMemory(name=name)
+                except FileNotFoundError:
+                    continue
+                segment.close()
+                segment.unlink()
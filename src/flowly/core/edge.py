@@ -21,13 +21,126 @@
 # * USA                                                                  *
 # *                                                                      *
 # ************************************************************************
-
-from typing import Optional
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 from uuid import UUID
 
 from flowly.core.base_entity import BaseEntity
+if TYPE_CHECKING:
+    from flowly.core.attribute import Attribute
 
 
 class Edge(BaseEntity):
-    def __init__(self, uuid: Optional[UUID] = None) -> None:
+    """
+    Represents a connection between two attributes within a node-based system.
+
+    An `Edge` leads from the `source` attribute, an output or option, to the `target` attribute, an input or option, and
+    is registered in the edge lists of both. Edges are created and indexed by the node graph when attributes get
+    connected.
+
+    Inherits:
+       BaseEntity: Provides common functionality for entities within the node-based system.
+    """
+
+    __slots__ = ('_source', '_target')
+
+    def __init__(
+        self,
+        uuid: Optional[UUID | int] = None,
+        source: Optional[Attribute] = None,
+        target: Optional[Attribute] = None
+    ) -> None:
+        """
+        Initializes an `Edge` instance.
+
+        :param uuid: The unique identifier for the edge. If not provided, a new UUID will be generated.
+        :type uuid: Optional[UUID | int]
+        :param source: The attribute the edge starts from. Defaults to None.
+        :type source: Optional[Attribute]
+        :param target: The attribute the edge leads to. Defaults to None.
+        :type target: Optional[Attribute]
+        """
         super().__init__(uuid=uuid)
+        self._source: Optional[Attribute] = source
+        self._target: Optional[Attribute] = target
+
+    def __getstate__(self) -> tuple[Optional[dict[str, Any]], dict[str, Any]]:
+        """
+        Returns the pickle state of the edge without its endpoints.
+
+        Otherwise, pickling a single node would pull in every entity connected to it through its edges.
+
+        :return: The instance dictionary, if any, and the slot values.
+        :rtype: tuple[Optional[dict[str, Any]], dict[str, Any]]
+        """
+        dict_state, slot_state = super().__getstate__()
+        slot_state['_source'] = None
+        slot_state['_target'] = None
+        return dict_state, slot_state
+
+    @property
+    def source(self) -> Optional[Attribute]:
+        """
+        Gets the attribute the edge starts from.
+
+        :return: The source attribute, if any.
+        :rtype: Optional[Attribute]
+        """
+        return self._source
+
+    @property
+    def target(self) -> Optional[Attribute]:
+        """
+        Gets the attribute the edge leads to.
+
+        :return: The target attribute, if any.
+        :rtype: Optional[Attribute]
+        """
+        return self._target
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], attributes: Optional[Mapping[UUID, Attribute]] = None) -> Edge:
+        """
+        Creates an edge from a dictionary created by `to_dict`, resolving its endpoints by UUID. The edge is not
+        registered in the edge lists of its endpoints, which is done by the node graph when connecting them.
+
+        :param data: A dictionary containing the UUIDs of the edge and its endpoints.
+        :type data: dict[str, Any]
+        :param attributes: The attributes the endpoints are looked up in, by UUID. Defaults to no attributes.
+        :type attributes: Optional[Mapping[UUID, Attribute]]
+        :return: An instance of `Edge`.
+        :rtype: Edge
+        :raises ValueError: If a UUID is missing or invalid, or if an endpoint is not among the attributes.
+        """
+        attributes = attributes if attributes is not None else {}
+        edge: Edge = super().from_dict(data)
+        edge._source = cls._resolve_endpoint(data.get('source'), attributes)
+        edge._target = cls._resolve_endpoint(data.get('target'), attributes)
+        return edge
+
+    @staticmethod
+    def _resolve_endpoint(uuid: Optional[str], attributes: Mapping[UUID, Attribute]) -> Optional[Attribute]:
+        """Looks up the attribute with the UUID string, or returns None if there is no UUID."""
+        if uuid is None:
+            return None
+        try:
+            attribute: Optional[Attribute] = attributes.get(UUID(uuid))
+        except ValueError as e:
+            raise ValueError(f"Invalid UUID: {uuid}") from e
+        if attribute is None:
+            raise ValueError(f"Unknown edge endpoint: {uuid}")
+        return attribute
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Converts the edge to a dictionary representation, referencing its endpoints by UUID.
+
+        :return: A dictionary containing the edge's properties.
+        :rtype: dict[str, Any]
+        """
+        base_dict = super().to_dict()  # Get the dictionary from BaseEntity
+        edge_dict = {
+            'source': str(self._source.uuid) if self._source else None,
+            'target': str(self._target.uuid) if self._target else None,
+        }
+        return {**base_dict, **edge_dict}  # Merge dictionaries
@@ -32,3 +32,38 @@ class AttributeFlags(Enum):
     OPTION: int = 0
     INPUT: int = 1
     OUTPUT: int = 2
+
+
+class ExecutorMode(Enum):
+    """
+    Enum representing the executor types used for parallel node evaluation
+    """
+    THREAD: int = 0
+    PROCESS: int = 1
+
+
+class GraphStorage(Enum):
+    """
+    Enum representing the storage backends of the node graph's main graph
+    """
+    NETWORKX: int = 0
+    ARRAY: int = 1
+
+
+class StreamKind(Enum):
+    """
+    Enum representing how a node processes the items of a stream
+    """
+    MAP: int = 0
+    FILTER: int = 1
+    WINDOW: int = 2
+
+
+class IdStrategy(Enum):
+    """
+    Enum representing the schemes for generating entity IDs
+    """
+    UUID7: int = 0
+    COUNTER: int = 1
+    UUID4: int = 2
+    UUID1: int = 3
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from flowly.core.enumerations import AttributeFlags
+if TYPE_CHECKING:
+    from flowly.core.attribute import Attribute
+    from flowly.core.node import Node
+    from flowly.core.node_graph import NodeGraph
+
+InputSlots = tuple[tuple['Attribute', tuple['Attribute', ...]], ...]
+
+
+class ExecutionPlan:
+    """
+    A flat, topologically sorted evaluation plan of a node graph, valid for one topology version.
+
+    Building the plan sorts the nodes once and resolves, for every node, its input and option attributes together with
+    the upstream attributes feeding them, and its output attributes by name. Evaluating a node then looks these slots
+    up by its position instead of querying the main graph. The node graph caches the plan until its topology version
+    changes.
+    """
+
+    __slots__ = ('_topology_version', '_node_items', '_positions', '_input_slots', '_output_slots')
+
+    def __init__(self, node_graph: NodeGraph) -> None:
+        """
+        Builds the plan for the current topology of the node graph.
+
+        :param node_graph: The node graph to plan.
+        :type node_graph: NodeGraph
+        """
+        self._topology_version: int = node_graph.topology_version
+
+        in_degrees: dict[Node, int] = dict.fromkeys(node_graph.node_items, 0)
+        for node_item in node_graph.node_items:
+            for downstream_node_item in node_graph.get_downstream_node_items(node_item):
+                in_degrees[downstream_node_item] += 1
+
+        ready: list[Node] = [node_item for node_item, in_degree in in_degrees.items() if in_degree == 0]
+        self._node_items: list[Node] = []
+        while ready:
+            node_item: Node = ready.pop()
+            self._node_items.append(node_item)
+            for downstream_node_item in node_graph.get_downstream_node_items(node_item):
+                in_degrees[downstream_node_item] -= 1
+                if in_degrees[downstream_node_item] == 0:
+                    ready.append(downstream_node_item)
+        self._positions: dict[Node, int] = {node_item: index for index, node_item in enumerate(self._node_items)}
+
+        self._input_slots: list[InputSlots] = []
+        self._output_slots: list[dict[str, Attribute]] = []
+        for node_item in self._node_items:
+            self._input_slots.append(tuple(
+                (attr_item, tuple(node_graph.main_graph.predecessors(attr_item)))
+                for attr_item in node_item.attributes if attr_item.flag is not AttributeFlags.OUTPUT
+            ))
+            self._output_slots.append({
+                attr_item.name: attr_item
+                for attr_item in node_item.attributes if attr_item.flag is AttributeFlags.OUTPUT
+            })
+
+    @property
+    def topology_version(self) -> int:
+        """
+        Returns the topology version of the node graph the plan was built for.
+
+        :return: The topology version.
+        :rtype: int
+        """
+        return self._topology_version
+
+    @property
+    def node_items(self) -> list[Node]:
+        """
+        Returns all nodes in topological order.
+
+        :return: The sorted nodes.
+        :rtype: list[Node]
+        """
+        return self._node_items
+
+    @property
+    def positions(self) -> dict[Node, int]:
+        """
+        Returns the topological position of every node.
+
+        :return: The positions by node.
+        :rtype: dict[Node, int]
+        """
+        return self._positions
+
+    def get_input_slots(self, node_item: Node) -> InputSlots:
+        """
+        Returns the input and option attributes of a node, each with the upstream attributes feeding it.
+
+        :param node_item: A node of the planned node graph.
+        :type node_item: Node
+        :return: Pairs of an attribute and its upstream attributes.
+        :rtype: InputSlots
+        """
+        return self._input_slots[self._positions[node_item]]
+
+    def get_output_slots(self, node_item: Node) -> dict[str, Attribute]:
+        """
+        Returns the output attributes of a node by name.
+
+        :param node_item: A node of the planned node graph.
+        :type node_item: Node
+        :return: The output attributes by name.
+        :rtype: dict[str, Attribute]
+        """
+        return self._output_slots[self._positions[node_item]]
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import Any, Optional
+from uuid import UUID
+import hashlib
+import pickle
+import struct
+
+from flowly.core.base_entity import BaseEntity
+
+
+def fingerprint(value: Any) -> Optional[str]:
+    """
+    Computes a content fingerprint of a value, e.g. the input data of a node.
+
+    Equal values produce equal fingerprints, independent of the insertion order of dicts and sets. Buffers such as
+    bytes or NumPy arrays are hashed directly through the buffer protocol, so large arrays are neither converted to
+    strings nor copied, as long as they are contiguous. Containers are hashed recursively and entities by their UUID.
+    Other objects fall back to their pickled form.
+
+    Examples:
+        >>> fingerprint({'a': 1, 'b': [1.0, None]}) == fingerprint({'b': [1.0, None], 'a': 1})
+        True
+        >>> fingerprint(1) == fingerprint(1.0)
+        False
+
+    :param value: The value to fingerprint.
+    :type value: Any
+    :return: A 32 character hexadecimal digest, or None if the value cannot be fingerprinted.
+    :rtype: Optional[str]
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    try:
+        _update(hasher, value)
+    except (TypeError, ValueError, pickle.PicklingError, AttributeError):
+        return None
+    return hasher.hexdigest()
+
+
+def _update(hasher: Any, value: Any) -> None:
+    """Feeds a type tagged encoding of value into hasher."""
+    value_type: type = type(value)
+    if value is None or value_type is bool:
+        hasher.update(b'c' + repr(value).encode())
+    elif value_type is int:
+        hasher.update(b'i' + str(value).encode() + b';')
+    elif value_type is float:
+        hasher.update(b'f' + struct.pack('<d', value))
+    elif value_type is str:
+        encoded: bytes = value.encode('utf-8', 'surrogatepass')
+        hasher.update(b's' + struct.pack('<Q', len(encoded)) + encoded)
+    elif value_type in (bytes, bytearray, memoryview):
+        buffer: memoryview = memoryview(value).cast('B')
+        hasher.update(b'b' + struct.pack('<Q', buffer.nbytes))
+        hasher.update(buffer)
+    elif value_type in (list, tuple):
+        hasher.update((b'l' if value_type is list else b't') + struct.pack('<Q', len(value)))
+        for item in value:
+            _update(hasher, item)
+    elif value_type is dict:
+        hasher.update(b'd' + struct.pack('<Q', len(value)))
+        key_fingerprints: list[tuple[Optional[str], Any]] = [(fingerprint(key), item) for key, item in value.items()]
+        if any(key_fingerprint is None for key_fingerprint, _ in key_fingerprints):
+            raise TypeError('Dict contains a key that cannot be fingerprinted')
+        for key_fingerprint, item in sorted(key_fingerprints, key=lambda pair: pair[0]):
+            hasher.update(key_fingerprint.encode())
+            _update(hasher, item)
+    elif value_type in (set, frozenset):
+        hasher.update(b'e' + struct.pack('<Q', len(value)))
+        item_fingerprints: list[Optional[str]] = [fingerprint(item) for item in value]
+        if None in item_fingerprints:
+            raise TypeError('Set contains an item that cannot be fingerprinted')
+        for item_fingerprint in sorted(item_fingerprints):
+            hasher.update(item_fingerprint.encode())
+    elif isinstance(value, BaseEntity):
+        hasher.update(b'u' + value.id.to_bytes(16, 'big'))
+    elif isinstance(value, UUID):
+        hasher.update(b'U' + value.bytes)
+    elif hasattr(value, '__array_interface__') and getattr(value, 'dtype', None) is not None:
+        _update_array(hasher, value)
+    else:
+        hasher.update(b'p' + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _update_array(hasher: Any, value: Any) -> None:
+    """Feeds the dtype, shape and raw buffer of a NumPy compatible array into hasher."""
+    hasher.update(b'a' + value.dtype.str.encode() + repr(tuple(value.shape)).encode())
+    if value.dtype.hasobject:
+        hasher.update(pickle.dumps(value.tolist(), protocol=pickle.HIGHEST_PROTOCOL))
+    elif value.flags.c_contiguous and value.size and value.dtype.char not in 'mM':  # Datetimes export no buffer
+        hasher.update(memoryview(value).cast('B'))
+    else:
+        hasher.update(value.tobytes())
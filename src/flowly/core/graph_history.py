@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from collections import deque
+
+if TYPE_CHECKING:
+    from flowly.core.graph_snapshot import GraphSnapshot
+    from flowly.core.node_graph import NodeGraph
+
+
+class GraphHistory:
+    """
+    An undo and redo history of a node graph, built on its copy-on-write snapshots.
+
+    Call `record` before every edit to save the current state. Since snapshots share all unchanged parts, recording is
+    O(1) and a long history costs only the memory of the changes. Undoing and redoing restore a snapshot, touching only
+    what differs from the current state.
+
+    Examples:
+        >>> history = GraphHistory(node_graph)  # doctest: +SKIP
+        >>> history.record()  # doctest: +SKIP
+        >>> node_graph.remove_node_item(node_item)  # doctest: +SKIP
+        >>> history.undo()  # doctest: +SKIP
+        True
+        >>> node_item in node_graph.node_items  # doctest: +SKIP
+        True
+    """
+
+    __slots__ = ('_node_graph', '_undo_stack', '_redo_stack')
+
+    def __init__(self, node_graph: NodeGraph, max_size: int = 100) -> None:
+        """
+        Initializes a `GraphHistory` instance.
+
+        :param node_graph: The node graph whose edits are recorded.
+        :type node_graph: NodeGraph
+        :param max_size: The maximum number of undo steps. The oldest steps are dropped first. Defaults to 100.
+        :type max_size: int
+        :raises ValueError: If `max_size` is smaller than one.
+        """
+        if max_size < 1:
+            raise ValueError("The maximum history size must be at least one.")
+
+        self._node_graph: NodeGraph = node_graph
+        self._undo_stack: deque[GraphSnapshot] = deque(maxlen=max_size)
+        self._redo_stack: list[GraphSnapshot] = []
+
+    @property
+    def can_undo(self) -> bool:
+        """
+        Returns whether there is a recorded state to undo to.
+
+        :return: True if `undo` would change the node graph, otherwise False.
+        :rtype: bool
+        """
+        return bool(self._undo_stack)
+
+    @property
+    def can_redo(self) -> bool:
+        """
+        Returns whether there is an undone state to redo.
+
+        :return: True if `redo` would change the node graph, otherwise False.
+        :rtype: bool
+        """
+        return bool(self._redo_stack)
+
+    def record(self) -> None:
+        """
+        Saves the current state of the node graph as an undo step and discards the redo steps. Recording an unchanged
+        state again is ignored.
+        """
+        snapshot: GraphSnapshot = self._node_graph.snapshot()
+        if not self._undo_stack or self._undo_stack[-1] is not snapshot:
+            self._undo_stack.append(snapshot)
+        self._redo_stack.clear()
+
+    def undo(self) -> bool:
+        """
+        Restores the last recorded state and saves the current state as a redo step.
+
+        :return: True if a state was restored, False if there was nothing to undo.
+        :rtype: bool
+        """
+        if not self._undo_stack:
+            return False
+        self._redo_stack.append(self._node_graph.snapshot())
+        self._node_graph.restore(self._undo_stack.pop())
+        return True
+
+    def redo(self) -> bool:
+        """
+        Restores the last undone state and saves the current state as an undo step.
+
+        :return: True if a state was restored, False if there was nothing to redo.
+        :rtype: bool
+        """
+        if not self._redo_stack:
+            return False
+        self._undo_stack.append(self._node_graph.snapshot())
+        self._node_graph.restore(self._redo_stack.pop())
+        return True
+
+    def clear(self) -> None:
+        """Discards all undo and redo steps."""
+        self._undo_stack.clear()
+        self._redo_stack.clear()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import Any, Iterable, Iterator, Optional, TextIO, Union
+from uuid import UUID
+import json
+
+from flowly.core.enumerations import GraphStorage
+from flowly.core.attribute import Attribute
+from flowly.core.node import Node
+from flowly.core.edge import Edge
+from flowly.core.node_graph import NodeGraph
+
+GraphRecord = Union[Node, Attribute, Edge, tuple[UUID, UUID, UUID]]
+
+
+class GraphJsonLines:
+    """
+    Streams node graphs to and from JSON Lines, one entity per line.
+
+    Each line holds the `to_dict` representation of a single entity plus a `kind` key:
+        - `node`: a node without its attributes,
+        - `attribute`: an attribute, directly following the line of its parent node,
+        - `edge`: an edge with the UUIDs of its `source` output and `target` input attribute.
+
+    Writing never builds more than one entity dictionary at a time, and reading is a generator that parses one line
+    at a time. Writing runs in constant memory regardless of the graph size, while reading only keeps the attributes,
+    to resolve the endpoints of edges. Attributes read from a stream are attached to the node read directly before
+    them. Streams can be filtered by chaining `read` and `write_records`.
+
+    Examples:
+        >>> with open('project.jsonl', 'w') as file:  # doctest: +SKIP
+        ...     GraphJsonLines.write(node_graph, file)
+        >>> with open('project.jsonl') as source, open('nodes.jsonl', 'w') as target:  # doctest: +SKIP
+        ...     GraphJsonLines.write_records((r for r in GraphJsonLines.read(source) if isinstance(r, Node)), target)
+    """
+
+    @staticmethod
+    def iter_records(node_graph: NodeGraph) -> Iterator[GraphRecord]:
+        """
+        Iterates over all nodes, each followed by its attributes, and then over all edges between nodes.
+
+        :param node_graph: The node graph to iterate.
+        :type node_graph: NodeGraph
+        :return: An iterator over nodes, attributes and edges.
+        :rtype: Iterator[GraphRecord]
+        """
+        for node_item in node_graph.node_items:
+            yield node_item
+            yield from node_item.attributes
+        yield from node_graph.iter_edge_items()
+
+    @staticmethod
+    def write_records(records: Iterable[GraphRecord], file: TextIO) -> None:
+        """
+        Writes records one line at a time.
+
+        :param records: The nodes, attributes, edges and (edge UUID, source UUID, target UUID) tuples to write.
+        :type records: Iterable[GraphRecord]
+        :param file: A text file opened for writing.
+        :type file: TextIO
+        :raises TypeError: If a record has an unsupported type.
+        """
+        for record in records:
+            if isinstance(record, Node):
+                record_dict: dict[str, Any] = {'kind': 'node', **record.to_dict(include_attributes=False)}
+            elif isinstance(record, Attribute):
+                record_dict: dict[str, Any] = {'kind': 'attribute', **record.to_dict()}
+            elif isinstance(record, Edge):
+                record_dict: dict[str, Any] = {'kind': 'edge', **record.to_dict()}
+            elif isinstance(record, tuple):
+                record_dict: dict[str, Any] = {
+                    'kind': 'edge', 'uuid': str(record[0]), 'source': str(record[1]), 'target': str(record[2])
+                }
+            else:
+                raise TypeError(f"Unsupported record type: {type(record).__name__}")
+            file.write(json.dumps(record_dict))
+            file.write('\n')
+
+    @classmethod
+    def write(cls, node_graph: NodeGraph, file: TextIO) -> None:
+        """
+        Writes the whole node graph.
+
+        :param node_graph: The node graph to write.
+        :type node_graph: NodeGraph
+        :param file: A text file opened for writing.
+        :type file: TextIO
+        """
+        cls.write_records(cls.iter_records(node_graph), file)
+
+    @staticmethod
+    def read(file: TextIO) -> Iterator[GraphRecord]:
+        """
+        Reads records lazily, one line at a time. Empty lines are skipped.
+
+        Edges are read with `Edge.from_dict`, resolving their endpoints among the attributes read before them. They are
+        not registered in the edge lists of their endpoints, so that the attributes can be added to a graph and
+        reconnected there.
+
+        :param file: A text file opened for reading.
+        :type file: TextIO
+        :return: An iterator over nodes, attributes and edges.
+        :rtype: Iterator[GraphRecord]
+        :raises ValueError: If a line is not a valid record, or if an edge references an attribute not read before it.
+        """
+        current_node_item: Optional[Node] = None
+        attribute_items: dict[UUID, Attribute] = {}
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+
+            record_dict: dict[str, Any] = json.loads(line)
+            kind: Optional[str] = record_dict.pop('kind', None)
+            if kind == 'node':
+                current_node_item = Node.from_dict(record_dict)
+                yield current_node_item
+            elif kind == 'attribute':
+                attr_item: Attribute = Attribute.from_dict(record_dict)
+                attribute_items[attr_item.uuid] = attr_item
+                if current_node_item is not None and record_dict.get('parent') == str(current_node_item.uuid):
+                    attr_item.parent = current_node_item
+                    current_node_item.attributes.append(attr_item)
+                yield attr_item
+            elif kind == 'edge':
+                yield Edge.from_dict(record_dict, attribute_items)
+            else:
+                raise ValueError(f"Invalid record kind in line {line_number}: {kind}")
+
+    @classmethod
+    def read_node_graph(cls, file: TextIO, storage: GraphStorage = GraphStorage.NETWORKX) -> NodeGraph:
+        """
+        Reads a whole node graph from a stream written by `write`.
+
+        :param file: A text file opened for reading.
+        :type file: TextIO
+        :param storage: The main graph storage of the created node graph.
+        :type storage: GraphStorage
+        :return: The deserialized node graph.
+        :rtype: NodeGraph
+        :raises ValueError: If an edge references an unknown attribute or is invalid.
+        """
+        node_graph: NodeGraph = NodeGraph(storage)
+        node_items: list[Node] = []
+        for record in cls.read(file):
+            if isinstance(record, Node):
+                node_items.append(record)
+            elif isinstance(record, Edge):
+                if node_items:
+                    node_graph.add_node_items(node_items)
+                    node_items = []
+                node_graph.connect_attribute_items(record.source, record.target, record.uuid)
+        node_graph.add_node_items(node_items)
+        return node_graph
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
+import json
+
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.fingerprint import fingerprint
+from flowly.core.node import Node
+if TYPE_CHECKING:
+    from flowly.core.attribute import Attribute
+    from flowly.core.graph_snapshot import GraphSnapshot
+    from flowly.core.node_graph import NodeGraph
+
+
+class GraphPatch:
+    """
+    A structural difference between two states of a node graph, which can be applied to a node graph as a patch.
+
+    A patch lists the removed nodes and edges by UUID, the added nodes and edges in their dictionary form, and the new
+    data of changed, unconnected input and option attributes in the serializable form of the attribute, see
+    `Attribute.serialize_data`. Output data and the data of connected inputs is not part of a patch, as it is derived
+    by evaluation.
+    The serialized form contains only these changes, so saving or sending a patch costs time and space proportional to
+    the edit instead of the graph size.
+
+    Patches between two snapshots of the same node graph are computed from the snapshots' shared structure and only
+    visit the changed parts. Patches between two independent node graphs compare all nodes and edges, and the data by
+    fingerprint.
+
+    Examples:
+        >>> saved = node_graph.snapshot()  # doctest: +SKIP
+        >>> node_item.attributes[0].data = 42  # doctest: +SKIP
+        >>> patch = GraphPatch.from_snapshots(saved, node_graph.snapshot())  # doctest: +SKIP
+        >>> other_node_graph.apply_patch(GraphPatch.from_json(patch.to_json()))  # doctest: +SKIP
+    """
+
+    __slots__ = ('_removed_nodes', '_added_nodes', '_removed_edges', '_added_edges', '_changed_data')
+
+    VERSION: int = 1
+
+    def __init__(
+        self,
+        removed_nodes: Optional[list[str]] = None,
+        added_nodes: Optional[list[dict[str, Any]]] = None,
+        removed_edges: Optional[list[str]] = None,
+        added_edges: Optional[list[dict[str, Any]]] = None,
+        changed_data: Optional[list[tuple[str, Any]]] = None
+    ) -> None:
+        """
+        Initializes a `GraphPatch` instance, empty by default.
+
+        :param removed_nodes: The UUIDs of the removed nodes.
+        :type removed_nodes: Optional[list[str]]
+        :param added_nodes: The dictionaries of the added nodes.
+        :type added_nodes: Optional[list[dict[str, Any]]]
+        :param removed_edges: The UUIDs of the removed edges.
+        :type removed_edges: Optional[list[str]]
+        :param added_edges: The dictionaries of the added edges.
+        :type added_edges: Optional[list[dict[str, Any]]]
+        :param changed_data: Pairs of an attribute UUID and its new data.
+        :type changed_data: Optional[list[tuple[str, Any]]]
+        """
+        self._removed_nodes: list[str] = removed_nodes or []
+        self._added_nodes: list[dict[str, Any]] = added_nodes or []
+        self._removed_edges: list[str] = removed_edges or []
+        self._added_edges: list[dict[str, Any]] = added_edges or []
+        self._changed_data: list[tuple[str, Any]] = changed_data or []
+
+    def __bool__(self) -> bool:
+        """
+        Returns whether the patch contains any change.
+
+        :return: True if the patch is not empty, otherwise False.
+        :rtype: bool
+        """
+        return bool(
+            self._removed_nodes or self._added_nodes or self._removed_edges or self._added_edges or self._changed_data
+        )
+
+    @property
+    def removed_nodes(self) -> list[str]:
+        """
+        Returns the UUIDs of the removed nodes.
+
+        :return: The node UUIDs.
+        :rtype: list[str]
+        """
+        return self._removed_nodes
+
+    @property
+    def added_nodes(self) -> list[dict[str, Any]]:
+        """
+        Returns the dictionaries of the added nodes, including their attributes.
+
+        :return: The node dictionaries.
+        :rtype: list[dict[str, Any]]
+        """
+        return self._added_nodes
+
+    @property
+    def removed_edges(self) -> list[str]:
+        """
+        Returns the UUIDs of the removed edges.
+
+        :return: The edge UUIDs.
+        :rtype: list[str]
+        """
+        return self._removed_edges
+
+    @property
+    def added_edges(self) -> list[dict[str, Any]]:
+        """
+        Returns the dictionaries of the added edges.
+
+        :return: The edge dictionaries.
+        :rtype: list[dict[str, Any]]
+        """
+        return self._added_edges
+
+    @property
+    def changed_data(self) -> list[tuple[str, Any]]:
+        """
+        Returns the new data of the changed input and option attributes of nodes present in both states.
+
+        :return: Pairs of an attribute UUID and its new data.
+        :rtype: list[tuple[str, Any]]
+        """
+        return self._changed_data
+
+    @classmethod
+    def from_snapshots(cls, old: GraphSnapshot, new: GraphSnapshot) -> GraphPatch:
+        """
+        Creates the patch from one snapshot of a node graph to a later or earlier one. Only the parts of the snapshots
+        that are not shared are visited. Data is compared by identity, so data assigned again counts as changed.
+
+        :param old: The snapshot of the state the patch applies to.
+        :type old: GraphSnapshot
+        :param new: The snapshot of the state the patch leads to.
+        :type new: GraphSnapshot
+        :return: The patch.
+        :rtype: GraphPatch
+        """
+        patch: GraphPatch = cls()
+        added_attribute_items: set[Attribute] = set()
+        for removed_node_item, added_node_item in old.diff_node_items(new):
+            if removed_node_item is not None:
+                patch._removed_nodes.append(str(removed_node_item.uuid))
+            else:
+                patch._added_nodes.append(added_node_item.to_dict())
+                added_attribute_items.update(added_node_item.attributes)
+
+        for removed_edge_item, added_edge_item in old.diff_edge_items(new):
+            if removed_edge_item is not None:
+                patch._removed_edges.append(str(removed_edge_item.uuid))
+            if added_edge_item is not None:
+                patch._added_edges.append(added_edge_item.to_dict())
+
+        patch._changed_data.extend(
+            (str(attr_item.uuid), attr_item.serialize_data(data))
+            for attr_item, data in old.diff_data(new) if attr_item not in added_attribute_items
+        )
+        return patch
+
+    @classmethod
+    def from_node_graphs(cls, old: NodeGraph, new: NodeGraph) -> GraphPatch:
+        """
+        Creates the patch from one node graph to another, e.g. to a deserialized copy. Nodes and edges are matched by
+        UUID, and the data of input and option attributes is compared by fingerprint. This visits both graphs fully.
+
+        :param old: The node graph the patch applies to.
+        :type old: NodeGraph
+        :param new: The node graph the patch leads to.
+        :type new: NodeGraph
+        :return: The patch.
+        :rtype: GraphPatch
+        """
+        patch: GraphPatch = cls()
+        for node_item in old.node_items:
+            if new.get_node_item_by_uuid(node_item.id) is None:
+                patch._removed_nodes.append(str(node_item.uuid))
+        for node_item in new.node_items:
+            old_node_item: Optional[Node] = old.get_node_item_by_uuid(node_item.id)
+            if old_node_item is None:
+                patch._added_nodes.append(node_item.to_dict())
+                continue
+            for attr_item in node_item.attributes:
+                if attr_item.flag is AttributeFlags.OUTPUT or attr_item.has_edge():
+                    continue  # Outputs and connected inputs hold data derived by evaluation
+                old_attr_item: Optional[Attribute] = old.get_attribute_item_by_uuid(attr_item.id)
+                if old_attr_item is None or not cls._is_same_data(old_attr_item.data, attr_item.data):
+                    patch._changed_data.append((str(attr_item.uuid), attr_item.serialize_data(attr_item.data)))
+
+        for edge_item in old.edge_items:
+            if new.get_edge_item_by_uuid(edge_item.id) is None:
+                patch._removed_edges.append(str(edge_item.uuid))
+        for edge_item in new.edge_items:
+            if old.get_edge_item_by_uuid(edge_item.id) is None:
+                patch._added_edges.append(edge_item.to_dict())
+        return patch
+
+    @staticmethod
+    def _is_same_data(old_data: Any, new_data: Any) -> bool:
+        """Returns whether two data values are the same object or have equal fingerprints."""
+        if old_data is new_data:
+            return True
+        old_fingerprint: Optional[str] = fingerprint(old_data)
+        return old_fingerprint is not None and old_fingerprint == fingerprint(new_data)
+
+    def apply(self, node_graph: NodeGraph) -> None:
+        """
+        Applies the patch to a node graph in the state the patch was created from: removes the edges and nodes, adds
+        the nodes and edges, and sets the changed data. The affected node_items become dirty.
+
+        :param node_graph: The node graph to change.
+        :type node_graph: NodeGraph
+        :raises ValueError: If the patch does not match the node graph, e.g. it references a missing attribute.
+        """
+        for edge_uuid in self._removed_edges:
+            if node_graph.get_edge_item_by_uuid(UUID(edge_uuid)) is None:
+                raise ValueError(f"Patch removes a missing edge: {edge_uuid}")
+            node_graph.remove_edge_item_by_uuid(UUID(edge_uuid))
+        for node_uuid in self._removed_nodes:
+            node_item: Optional[Node] = node_graph.get_node_item_by_uuid(UUID(node_uuid))
+            if node_item is None:
+                raise ValueError(f"Patch removes a missing node: {node_uuid}")
+            node_graph.remove_node_item(node_item)
+
+        node_graph.add_node_items(Node.from_dict(node_data) for node_data in self._added_nodes)
+        for edge_data in self._added_edges:
+            try:
+                node_graph.connect_attribute_items(
+                    node_graph.get_attribute_item_by_uuid(UUID(edge_data['source'])),
+                    node_graph.get_attribute_item_by_uuid(UUID(edge_data['target'])),
+                    UUID(edge_data['uuid'])
+                )
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Invalid edge data: {edge_data}") from e
+
+        for attribute_uuid, data in self._changed_data:
+            attr_item: Optional[Attribute] = node_graph.get_attribute_item_by_uuid(UUID(attribute_uuid))
+            if attr_item is None:
+                raise ValueError(f"Patch changes the data of a missing attribute: {attribute_uuid}")
+            attr_item.data = data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GraphPatch:
+        """
+        Creates a patch from its dictionary form.
+
+        :param data: A dictionary created by `to_dict`.
+        :type data: dict[str, Any]
+        :return: The patch.
+        :rtype: GraphPatch
+        :raises ValueError: If the dictionary has an unsupported version.
+        """
+        if data.get('version') != cls.VERSION:
+            raise ValueError(f"Unsupported patch version: {data.get('version')}")
+        return cls(
+            removed_nodes=list(data.get('removed_nodes', [])),
+            added_nodes=list(data.get('added_nodes', [])),
+            removed_edges=list(data.get('removed_edges', [])),
+            added_edges=list(data.get('added_edges', [])),
+            changed_data=[(attribute_uuid, value) for attribute_uuid, value in data.get('changed_data', [])]
+        )
+
+    @classmethod
+    def from_json(cls, json_str: str) -> GraphPatch:
+        """
+        Creates a patch from its JSON form.
+
+        :param json_str: A JSON string created by `to_json`.
+        :type json_str: str
+        :return: The patch.
+        :rtype: GraphPatch
+        """
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Converts the patch to a dictionary, leaving out the empty parts.
+
+        :return: The dictionary form of the patch.
+        :rtype: dict[str, Any]
+        """
+        data: dict[str, Any] = {'version': self.VERSION}
+        for key, value in (
+            ('removed_nodes', self._removed_nodes), ('added_nodes', self._added_nodes),
+            ('removed_edges', self._removed_edges), ('added_edges', self._added_edges),
+            ('changed_data', [list(change) for change in self._changed_data])
+        ):
+            if value:
+                data[key] = value
+        return data
+
+    def to_json(self) -> str:
+        """
+        Converts the patch to a compact JSON string without whitespace.
+
+        :return: The JSON form of the patch.
+        :rtype: str
+        """
+        return json.dumps(self.to_dict(), separators=(',', ':'))
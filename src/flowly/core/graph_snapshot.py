@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+from uuid import UUID
+
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.persistent_map import PersistentMap
+if TYPE_CHECKING:
+    from flowly.core.attribute import Attribute
+    from flowly.core.edge import Edge
+    from flowly.core.node import Node
+    from flowly.core.node_graph import NodeGraph
+
+
+class _LazyData:
+    """The recorded data of an attribute whose data loader is still pending."""
+
+    __slots__ = ('loader',)
+
+    def __init__(self, loader: Callable[[], Any]) -> None:
+        self.loader: Callable[[], Any] = loader
+
+
+class GraphSnapshot:
+    """
+    An immutable, structurally shared snapshot of a node graph's nodes, edges, attribute connections and input data.
+
+    The state is kept in persistent maps: nodes and edges by ID, the edges of every attribute by attribute ID, and the
+    data of every input and option attribute by attribute. Output data is not recorded, as it is derived by
+    evaluating the snapshot. Attributes whose data is still deferred to a data loader are recorded by their loader, so
+    taking a snapshot never loads lazy data, e.g. memory mapped arrays. Each update method returns a new snapshot
+    that copies only the touched trie paths, so a node graph can keep its current snapshot up to date on every mutation
+    and hand it out in O(1).
+
+    A snapshot never changes, so it can be read from another thread, e.g. by a background evaluator, while the node
+    graph is edited, without any locking. Data values are recorded by reference and must not be mutated in place.
+
+    Examples:
+        >>> before = node_graph.snapshot()  # doctest: +SKIP
+        >>> node_graph.remove_node_item(node_item)  # doctest: +SKIP
+        >>> node_item in before.node_items, node_item in node_graph.snapshot().node_items  # doctest: +SKIP
+        (True, False)
+        >>> node_graph.restore(before)  # doctest: +SKIP
+    """
+
+    __slots__ = ('_node_items', '_edge_items', '_connections', '_data', '_next_position')
+
+    def __init__(
+        self,
+        node_items: Optional[PersistentMap] = None,
+        edge_items: Optional[PersistentMap] = None,
+        connections: Optional[PersistentMap] = None,
+        data: Optional[PersistentMap] = None,
+        next_position: int = 0
+    ) -> None:
+        """
+        Initializes a `GraphSnapshot` instance, empty by default.
+
+        :param node_items: The (position, node) pairs by node ID.
+        :type node_items: Optional[PersistentMap]
+        :param edge_items: The edges by edge ID.
+        :type edge_items: Optional[PersistentMap]
+        :param connections: The tuples of connected edges by attribute ID.
+        :type connections: Optional[PersistentMap]
+        :param data: The data of the input and option attributes by attribute.
+        :type data: Optional[PersistentMap]
+        :param next_position: The position given to the next added node, which keeps the nodes in insertion order.
+        :type next_position: int
+        """
+        self._node_items: PersistentMap = node_items if node_items is not None else PersistentMap()
+        self._edge_items: PersistentMap = edge_items if edge_items is not None else PersistentMap()
+        self._connections: PersistentMap = connections if connections is not None else PersistentMap()
+        self._data: PersistentMap = data if data is not None else PersistentMap()
+        self._next_position: int = next_position
+
+    @classmethod
+    def from_node_graph(cls, node_graph: NodeGraph) -> GraphSnapshot:
+        """
+        Creates a snapshot of the current state of a node graph, building every map in a single pass.
+
+        :param node_graph: The node graph to record.
+        :type node_graph: NodeGraph
+        :return: The new snapshot.
+        :rtype: GraphSnapshot
+        """
+        edge_items: list[Edge] = node_graph.edge_items
+        connections: dict[int, tuple[Edge, ...]] = {}
+        for edge_item in edge_items:
+            for attr_item in (edge_item.source, edge_item.target):
+                connections[attr_item.id] = connections.get(attr_item.id, ()) + (edge_item,)
+        return cls(
+            PersistentMap.from_items(
+                (node_item.id, (position, node_item)) for position, node_item in enumerate(node_graph.node_items)
+            ),
+            PersistentMap.from_items((edge_item.id, edge_item) for edge_item in edge_items),
+            PersistentMap.from_items(connections.items()),
+            PersistentMap.from_items(
+                (attr_item, cls._record(attr_item)) for node_item in node_graph.node_items
+                for attr_item in node_item.attributes if attr_item.flag is not AttributeFlags.OUTPUT
+            ),
+            len(node_graph.node_items)
+        )
+
+    @property
+    def node_items(self) -> list[Node]:
+        """
+        Returns the recorded nodes in insertion order.
+
+        :return: The nodes.
+        :rtype: list[Node]
+        """
+        return [node_item for _, node_item in sorted(self._node_items.values(), key=lambda entry: entry[0])]
+
+    @property
+    def edge_items(self) -> list[Edge]:
+        """
+        Returns the recorded edges.
+
+        :return: The edges.
+        :rtype: list[Edge]
+        """
+        return list(self._edge_items.values())
+
+    def get_node_item_by_uuid(self, uuid: UUID | int) -> Optional[Node]:
+        """
+        Returns the recorded node with the UUID, or the UUID's integer value, or None if not found.
+
+        :param uuid: The UUID of the node.
+        :type uuid: UUID | int
+        :return: The node, if any.
+        :rtype: Optional[Node]
+        """
+        entry: Optional[tuple[int, Node]] = self._node_items.get(uuid if isinstance(uuid, int) else uuid.int)
+        return entry[1] if entry is not None else None
+
+    def get_edge_item_by_uuid(self, uuid: UUID | int) -> Optional[Edge]:
+        """
+        Returns the recorded edge with the UUID, or the UUID's integer value, or None if not found.
+
+        :param uuid: The UUID of the edge.
+        :type uuid: UUID | int
+        :return: The edge, if any.
+        :rtype: Optional[Edge]
+        """
+        return self._edge_items.get(uuid if isinstance(uuid, int) else uuid.int)
+
+    def get_edge_items(self, attribute_item: Attribute) -> tuple[Edge, ...]:
+        """
+        Returns the recorded edges connected to an attribute, in connection order.
+
+        :param attribute_item: An attribute of a recorded node.
+        :type attribute_item: Attribute
+        :return: The connected edges.
+        :rtype: tuple[Edge, ...]
+        """
+        return self._connections.get(attribute_item.id, ())
+
+    def get_data(self, attribute_item: Attribute) -> Any:
+        """
+        Returns the recorded data of an input or option attribute.
+
+        :param attribute_item: An input or option attribute of a recorded node.
+        :type attribute_item: Attribute
+        :return: The data at the time of the snapshot.
+        :rtype: Any
+        :raises ValueError: If no data is recorded for the attribute, e.g. because it is an output.
+        """
+        data: Any = self._data.get(attribute_item, PersistentMap.MISSING)
+        if data is PersistentMap.MISSING:
+            raise ValueError(f"No data recorded for attribute {attribute_item}.")
+        return self._resolve(data)
+
+    def get_data_loader(self, attribute_item: Attribute) -> Optional[Callable[[], Any]]:
+        """
+        Returns the recorded data loader of an attribute whose data was not loaded at the time of the snapshot.
+
+        :param attribute_item: An input or option attribute of a recorded node.
+        :type attribute_item: Attribute
+        :return: The data loader, or None if the data itself is recorded.
+        :rtype: Optional[Callable[[], Any]]
+        """
+        data: Any = self._data.get(attribute_item)
+        return data.loader if isinstance(data, _LazyData) else None
+
+    def with_node_item(self, node_item: Node) -> GraphSnapshot:
+        """
+        Returns a snapshot with the node and the data of its input and option attributes added.
+
+        :param node_item: The added node.
+        :type node_item: Node
+        :return: The updated snapshot.
+        :rtype: GraphSnapshot
+        """
+        data: PersistentMap = self._data
+        for attr_item in node_item.attributes:
+            if attr_item.flag is not AttributeFlags.OUTPUT:
+                data = data.set(attr_item, self._record(attr_item))
+        return GraphSnapshot(
+            self._node_items.set(node_item.id, (self._next_position, node_item)), self._edge_items,
+            self._connections, data, self._next_position + 1
+        )
+
+    def without_node_item(self, node_item: Node) -> GraphSnapshot:
+        """
+        Returns a snapshot with the node, its attribute data and its attribute connections removed. The edges of the
+        node must be removed before.
+
+        :param node_item: The removed node.
+        :type node_item: Node
+        :return: The updated snapshot.
+        :rtype: GraphSnapshot
+        """
+        connections: PersistentMap = self._connections
+        data: PersistentMap = self._data
+        for attr_item in node_item.attributes:
+            connections = connections.remove(attr_item.id)
+            data = data.remove(attr_item)
+        return GraphSnapshot(
+            self._node_items.remove(node_item.id), self._edge_items, connections, data, self._next_position
+        )
+
+    def with_edge_item(self, edge_item: Edge) -> GraphSnapshot:
+        """
+        Returns a snapshot with the edge added to the edges and to the connections of both its attributes.
+
+        :param edge_item: The added edge.
+        :type edge_item: Edge
+        :return: The updated snapshot.
+        :rtype: GraphSnapshot
+        """
+        connections: PersistentMap = self._connections
+        for attr_item in (edge_item.source, edge_item.target):
+            connections = connections.set(attr_item.id, connections.get(attr_item.id, ()) + (edge_item,))
+        return GraphSnapshot(
+            self._node_items, self._edge_items.set(edge_item.id, edge_item), connections, self._data,
+            self._next_position
+        )
+
+    def without_edge_item(self, edge_item: Edge) -> GraphSnapshot:
+        """
+        Returns a snapshot with the edge removed from the edges and from the connections of both its attributes.
+
+        :param edge_item: The removed edge.
+        :type edge_item: Edge
+        :return: The updated snapshot.
+        :rtype: GraphSnapshot
+        """
+        connections: PersistentMap = self._connections
+        for attr_item in (edge_item.source, edge_item.target):
+            remaining: tuple[Edge, ...] = tuple(
+                connected_edge_item for connected_edge_item in connections.get(attr_item.id, ())
+                if connected_edge_item != edge_item
+            )
+            connections = connections.set(attr_item.id, remaining) if remaining else connections.remove(attr_item.id)
+        return GraphSnapshot(
+            self._node_items, self._edge_items.remove(edge_item.id), connections, self._data, self._next_position
+        )
+
+    def with_data(self, attribute_item: Attribute, data: Any) -> GraphSnapshot:
+        """
+        Returns a snapshot with new data for an input or option attribute, or this snapshot if the data is already
+        recorded.
+
+        :param attribute_item: The changed attribute.
+        :type attribute_item: Attribute
+        :param data: The new data.
+        :type data: Any
+        :return: The updated snapshot.
+        :rtype: GraphSnapshot
+        """
+        if self._data.get(attribute_item, PersistentMap.MISSING) is data:
+            return self
+        return GraphSnapshot(
+            self._node_items, self._edge_items, self._connections, self._data.set(attribute_item, data),
+            self._next_position
+        )
+
+    def diff_node_items(self, other: GraphSnapshot) -> Iterator[tuple[Optional[Node], Optional[Node]]]:
+        """
+        Yields the nodes removed or added from this snapshot to the other as (removed, None) or (None, added) pairs.
+        Shared parts of both snapshots are skipped.
+
+        :param other: The snapshot to compare with.
+        :type other: GraphSnapshot
+        :return: An iterator over the removed and added nodes.
+        :rtype: Iterator[tuple[Optional[Node], Optional[Node]]]
+        """
+        for _, old_entry, new_entry in self._node_items.diff(other._node_items):
+            if new_entry is PersistentMap.MISSING:
+                yield old_entry[1], None
+            elif old_entry is PersistentMap.MISSING:
+                yield None, new_entry[1]
+
+    def diff_edge_items(self, other: GraphSnapshot) -> Iterator[tuple[Optional[Edge], Optional[Edge]]]:
+        """
+        Yields the edges removed or added from this snapshot to the other as (removed, None) or (None, added) pairs.
+        Shared parts of both snapshots are skipped.
+
+        :param other: The snapshot to compare with.
+        :type other: GraphSnapshot
+        :return: An iterator over the removed and added edges.
+        :rtype: Iterator[tuple[Optional[Edge], Optional[Edge]]]
+        """
+        for _, old_edge_item, new_edge_item in self._edge_items.diff(other._edge_items):
+            yield (
+                None if old_edge_item is PersistentMap.MISSING else old_edge_item,
+                None if new_edge_item is PersistentMap.MISSING else new_edge_item
+            )
+
+    def diff_data_attributes(self, other: GraphSnapshot) -> Iterator[Attribute]:
+        """
+        Yields the attributes whose data is new or changed in the other snapshot, without loading any lazy data.
+        Shared parts of both snapshots are skipped.
+
+        :param other: The snapshot to compare with.
+        :type other: GraphSnapshot
+        :return: An iterator over the attributes.
+        :rtype: Iterator[Attribute]
+        """
+        for attribute_item, _, data in self._data.diff(other._data):
+            if data is not PersistentMap.MISSING:
+                yield attribute_item
+
+    def diff_data(self, other: GraphSnapshot) -> Iterator[tuple[Attribute, Any]]:
+        """
+        Yields the attributes whose data is new or changed in the other snapshot, with the data of the other
+        snapshot. Recorded data loaders are called. Shared parts of both snapshots are skipped.
+
+        :param other: The snapshot to compare with.
+        :type other: GraphSnapshot
+        :return: An iterator over the attributes and their new data.
+        :rtype: Iterator[tuple[Attribute, Any]]
+        """
+        for attribute_item in self.diff_data_attributes(other):
+            yield attribute_item, self._resolve(other._data.get(attribute_item))
+
+    def evaluate(self) -> dict[Attribute, Any]:
+        """
+        Computes all recorded nodes from the recorded data and returns the data of all output attributes. Neither the
+        nodes nor the node graph are changed, so this can run in a background thread while the node graph is edited.
+
+        :return: The computed data by output attribute.
+        :rtype: dict[Attribute, Any]
+        """
+        node_items: list[Node] = self.node_items
+        in_degrees: dict[Node, int] = dict.fromkeys(node_items, 0)
+        for edge_item in self._edge_items.values():
+            in_degrees[edge_item.target.parent] += 1
+
+        results: dict[Attribute, Any] = {}
+        ready: list[Node] = [node_item for node_item in node_items if in_degrees[node_item] == 0]
+        while ready:
+            node_item: Node = ready.pop()
+            inputs: dict[str, Any] = {}
+            for attr_item in node_item.attributes:
+                if attr_item.flag is not AttributeFlags.OUTPUT:
+                    upstream: list[Any] = [
+                        results.get(edge_item.source) for edge_item in self.get_edge_items(attr_item)
+                    ]
+                    if len(upstream) == 1:
+                        inputs[attr_item.name] = upstream[0]
+                    elif upstream:
+                        inputs[attr_item.name] = upstream
+                    else:
+                        inputs[attr_item.name] = self._resolve(self._data.get(attr_item))
+
+            outputs: dict[str, Any] = node_item.compute(inputs)
+            for attr_item in node_item.attributes:
+                if attr_item.flag is AttributeFlags.OUTPUT:
+                    results[attr_item] = outputs.get(attr_item.name)
+                    for edge_item in self.get_edge_items(attr_item):
+                        downstream_node_item: Node = edge_item.target.parent
+                        in_degrees[downstream_node_item] -= 1
+                        if in_degrees[downstream_node_item] == 0:
+                            ready.append(downstream_node_item)
+        return results
+
+    @staticmethod
+    def _record(attribute_item: Attribute) -> Any:
+        """Returns the value to record for the data of attribute_item, keeping a pending data loader unloaded."""
+        loader: Optional[Callable[[], Any]] = attribute_item.data_loader
+        return _LazyData(loader) if loader is not None else attribute_item.data
+
+    @staticmethod
+    def _resolve(data: Any) -> Any:
+        """Returns the recorded data, calling the data loader of lazily recorded data."""
+        return data.loader() if isinstance(data, _LazyData) else data
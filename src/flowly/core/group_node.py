@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import Any, Optional
+from uuid import UUID
+
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.attribute import Attribute
+from flowly.core.edge import Edge
+from flowly.core.fingerprint import fingerprint
+from flowly.core.node import Node
+from flowly.core.node_graph import NodeGraph
+
+
+class GroupNode(Node):
+    """
+    A node wrapping a nested node graph, whose selected inner attributes are exposed as the group's own ports.
+
+    In the enclosing node graph, a group is a single node: its ports are ordinary attributes, and every input port is
+    connected to every output port by the node's internal edges. Cycle checks and scheduling therefore only see one
+    vertex per group, however large the nested graph is. Computing the group writes the input port data to the exposed
+    inner attributes and evaluates the nested graph in pull mode for the exposed outputs, so only the inner nodes
+    affected by changed inputs are recomputed. The nested graph links back to the group as its parent, so editing an
+    inner node, even through an unexposed attribute, marks the group dirty in the enclosing node graph.
+
+    The cache token of a group is a fingerprint of the nested graph's structure and unexposed input data, independent
+    of the inner UUIDs. Groups built from the same template therefore share cached results.
+
+    Examples:
+        >>> group = GroupNode(name="Smooth", inner_graph=inner_graph)  # doctest: +SKIP
+        >>> group.expose(blur.attributes[0], name="image")  # doctest: +SKIP
+        >>> group.expose(blur.attributes[2], name="result")  # doctest: +SKIP
+        >>> node_graph.add_node_item(group)  # doctest: +SKIP
+
+    Inherits:
+       Node: Provides the attributes and serialization of a node.
+    """
+
+    __slots__ = ('_inner_graph', '_ports')
+
+    def __init__(
+        self,
+        uuid: Optional[UUID | int] = None,
+        name: str = "Group",
+        inner_graph: Optional[NodeGraph | dict[str, Any]] = None,
+        ports: Optional[list[list[str]]] = None
+    ) -> None:
+        """
+        Initializes a `GroupNode` instance.
+
+        :param uuid: The unique identifier for the node. If not provided, a new UUID will be generated.
+        :type uuid: Optional[UUID | int]
+        :param name: The name of the node. Defaults to "Group".
+        :type name: str
+        :param inner_graph: The nested node graph, or its dictionary form. Defaults to an empty node graph.
+        :type inner_graph: Optional[NodeGraph | dict[str, Any]]
+        :param ports: Pairs of a port UUID and the UUID of the exposed inner attribute, as stored by `get_options`.
+        :type ports: Optional[list[list[str]]]
+        :raises ValueError: If a port references a missing inner attribute.
+        """
+        super().__init__(uuid=uuid, name=name)
+        if isinstance(inner_graph, dict):
+            inner_graph = NodeGraph.from_dict(inner_graph)
+        self._inner_graph: NodeGraph = inner_graph if inner_graph is not None else NodeGraph()
+        self._inner_graph.parent = self
+        self._ports: dict[int, Attribute] = {}
+
+        for port_uuid, inner_attribute_uuid in ports or []:
+            inner_attribute: Optional[Attribute] = self._inner_graph.get_attribute_item_by_uuid(
+                UUID(inner_attribute_uuid)
+            )
+            if inner_attribute is None:
+                raise ValueError(f"Port references a missing inner attribute: {inner_attribute_uuid}")
+            self._add_port(inner_attribute, inner_attribute.name, UUID(port_uuid))
+
+    @classmethod
+    def collapse(cls, node_graph: NodeGraph, node_items: list[Node], name: str = "Group") -> GroupNode:
+        """
+        Replaces node_items in a node graph by a group node wrapping them. Edges between node_items move into the
+        nested graph, and the inner attributes connected to the rest of the node graph are exposed as ports named
+        "<node name>.<attribute name>", which take over the outer edges. Name clashes get the port index appended.
+
+        :param node_graph: The node graph containing node_items.
+        :type node_graph: NodeGraph
+        :param node_items: The nodes to group.
+        :type node_items: list[Node]
+        :param name: The name of the group node. Defaults to "Group".
+        :type name: str
+        :return: The new group node, added to node_graph.
+        :rtype: GroupNode
+        :raises ValueError: If a node is not part of node_graph, or grouping would create a cyclic dependency.
+        """
+        members: set[Node] = set(node_items)
+        if any(node_item.node_graph is not node_graph for node_item in members):
+            raise ValueError("Cannot group nodes that are not part of the node graph.")
+
+        inner_edge_items: list[Edge] = []
+        incoming_edge_items: list[Edge] = []
+        outgoing_edge_items: list[Edge] = []
+        for edge_item in node_graph.edge_items:
+            source_inside: bool = edge_item.source.parent in members
+            target_inside: bool = edge_item.target.parent in members
+            if source_inside and target_inside:
+                inner_edge_items.append(edge_item)
+            elif target_inside:
+                incoming_edge_items.append(edge_item)
+            elif source_inside:
+                outgoing_edge_items.append(edge_item)
+
+        inner_targets: set[Attribute] = {edge_item.target for edge_item in inner_edge_items}
+        if any(edge_item.target in inner_targets for edge_item in incoming_edge_items):
+            raise ValueError("Cannot group an input fed from both inside and outside the group.")
+
+        # A path leaving the group and entering it again would become a cycle through the group node.
+        visited: set[Node] = set()
+        stack: list[Node] = [edge_item.target.parent for edge_item in outgoing_edge_items]
+        while stack:
+            node_item: Node = stack.pop()
+            if node_item in members:
+                raise ValueError("Grouping the nodes would create a cyclic dependency.")
+            if node_item not in visited:
+                visited.add(node_item)
+                stack.extend(node_graph.get_downstream_node_items(node_item))
+
+        for node_item in node_items:
+            node_graph.remove_node_item(node_item)
+        inner_graph: NodeGraph = NodeGraph()
+        inner_graph.add_node_items(node_items)
+        for edge_item in inner_edge_items:
+            inner_graph.connect_attribute_items(edge_item.source, edge_item.target, edge_item.id)
+
+        group: GroupNode = cls(name=name, inner_graph=inner_graph)
+        ports: dict[Attribute, Attribute] = {}
+        for edge_item in incoming_edge_items + outgoing_edge_items:
+            inner_attribute: Attribute = (
+                edge_item.target if edge_item.target.parent in members else edge_item.source
+            )
+            if inner_attribute not in ports:
+                port_name: str = f"{inner_attribute.parent.name}.{inner_attribute.name}"
+                if any(port.name == port_name for port in group.attributes):
+                    port_name = f"{port_name}.{len(group.attributes)}"
+                ports[inner_attribute] = group.expose(inner_attribute, port_name)
+
+        node_graph.add_node_item(group)
+        for edge_item in incoming_edge_items:
+            node_graph.connect_attribute_items(edge_item.source, ports[edge_item.target], edge_item.id)
+        for edge_item in outgoing_edge_items:
+            node_graph.connect_attribute_items(ports[edge_item.source], edge_item.target, edge_item.id)
+        return group
+
+    def __setstate__(self, state: tuple[Optional[dict[str, Any]], dict[str, Any]]) -> None:
+        """
+        Restores the pickled state and registers the inner nodes with the nested graph again, as pickled nodes drop
+        their node graph reference.
+
+        :param state: The state returned by `__getstate__`.
+        :type state: tuple[Optional[dict[str, Any]], dict[str, Any]]
+        """
+        dict_state, slot_state = state
+        for slot_name, value in {**(dict_state or {}), **slot_state}.items():
+            object.__setattr__(self, slot_name, value)
+        for node_item in self._inner_graph.node_items:
+            node_item.node_graph = self._inner_graph
+
+    @property
+    def inner_graph(self) -> NodeGraph:
+        """
+        Gets the nested node graph.
+
+        :return: The nested node graph.
+        :rtype: NodeGraph
+        """
+        return self._inner_graph
+
+    @property
+    def is_pure(self) -> bool:
+        """
+        Returns whether the group only depends on its inputs, i.e. whether all inner nodes are pure.
+
+        :return: True if all inner nodes are pure, otherwise False.
+        :rtype: bool
+        """
+        return all(node_item.is_pure for node_item in self._inner_graph.node_items)
+
+    def get_inner_attribute(self, port: Attribute) -> Attribute:
+        """
+        Returns the inner attribute exposed by a port of the group.
+
+        :param port: A port attribute of the group.
+        :type port: Attribute
+        :return: The exposed inner attribute.
+        :rtype: Attribute
+        :raises ValueError: If the attribute is not a port of the group.
+        """
+        inner_attribute: Optional[Attribute] = self._ports.get(port.id)
+        if inner_attribute is None:
+            raise ValueError(f"Attribute {port} is not a port of group {self.name}.")
+        return inner_attribute
+
+    def expose(self, inner_attribute: Attribute, name: Optional[str] = None) -> Attribute:
+        """
+        Exposes an attribute of an inner node as a port of the group. The port has the class, flag, data type and
+        options of the inner attribute. Ports must be exposed before the group is added to a node graph.
+
+        :param inner_attribute: An attribute of a node in the nested graph. Inputs and options must not be connected.
+        :type inner_attribute: Attribute
+        :param name: The port name. Defaults to the name of the inner attribute.
+        :type name: Optional[str]
+        :return: The new port attribute.
+        :rtype: Attribute
+        :raises ValueError: If the group is part of a node graph, or the attribute cannot be exposed.
+        """
+        name = name if name is not None else inner_attribute.name
+        if self.node_graph is not None:
+            raise ValueError("Cannot expose ports of a group node that is part of a node graph.")
+        if self._inner_graph.get_attribute_item_by_uuid(inner_attribute.id) is not inner_attribute:
+            raise ValueError(f"Attribute {inner_attribute} is not part of the nested graph.")
+        if inner_attribute.flag is not AttributeFlags.OUTPUT and inner_attribute.has_edge():
+            raise ValueError(f"Cannot expose the connected input {inner_attribute}.")
+        if any(exposed_attribute is inner_attribute for exposed_attribute in self._ports.values()):
+            raise ValueError(f"Attribute {inner_attribute} is already exposed.")
+        if any(attr_item.name == name for attr_item in self.attributes):
+            raise ValueError(f"Group {self.name} already has a port named {name}.")
+        return self._add_port(inner_attribute, name)
+
+    def _add_port(self, inner_attribute: Attribute, name: str, uuid: Optional[UUID] = None) -> Attribute:
+        """Creates a port attribute mirroring inner_attribute and appends it to the attributes."""
+        port: Attribute = type(inner_attribute)(
+            uuid=uuid, name=name, data_type=inner_attribute.data_type, flag=inner_attribute.flag, parent=self,
+            is_multi_edge=inner_attribute.is_multi_edge, **inner_attribute.get_options()
+        )
+        if inner_attribute.flag is not AttributeFlags.OUTPUT:
+            port.data = inner_attribute.data
+        self.attributes.append(port)
+        self._ports[port.id] = inner_attribute
+        return port
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Writes the input and option data to the exposed inner attributes and evaluates the nested graph for the exposed
+        outputs. Inner attributes receiving the same data object as before are left untouched and stay clean.
+
+        :param inputs: The data of all input and option ports, keyed by port name.
+        :type inputs: dict[str, Any]
+        :return: The data of the output ports, keyed by port name.
+        :rtype: dict[str, Any]
+        """
+        outputs: dict[str, Attribute] = {}
+        for port in self.attributes:
+            inner_attribute: Attribute = self._ports[port.id]
+            if port.flag is AttributeFlags.OUTPUT:
+                outputs[port.name] = inner_attribute
+            elif inner_attribute.data is not inputs[port.name]:
+                inner_attribute.data = inputs[port.name]
+
+        self._inner_graph.evaluate(targets=outputs.values())
+        return {name: inner_attribute.data for name, inner_attribute in outputs.items()}
+
+    def get_cache_token(self) -> Optional[str]:
+        """
+        Returns a fingerprint of the nested graph: the classes and cache tokens of the inner nodes, the edges and ports
+        by position, and the data of unexposed, unconnected inputs and options.
+
+        :return: The token, or None if an inner node or its data cannot be fingerprinted.
+        :rtype: Optional[str]
+        """
+        positions: dict[Attribute, tuple[int, int]] = {
+            attr_item: (node_index, attribute_index)
+            for node_index, node_item in enumerate(self._inner_graph.node_items)
+            for attribute_index, attr_item in enumerate(node_item.attributes)
+        }
+        exposed_attributes: set[Attribute] = set(self._ports.values())
+        node_tokens: list[tuple[str, Optional[str]]] = []
+        fixed_data: list[tuple[tuple[int, int], Any]] = []
+        for node_item in self._inner_graph.node_items:
+            node_type: type = type(node_item)
+            node_tokens.append((f"{node_type.__module__}.{node_type.__qualname__}", node_item.get_cache_token()))
+            fixed_data.extend(
+                (positions[attr_item], attr_item.data) for attr_item in node_item.attributes
+                if attr_item.flag is not AttributeFlags.OUTPUT and attr_item not in exposed_attributes
+                and not attr_item.has_edge()
+            )
+        if any(token is None for _, token in node_tokens):
+            return None
+
+        return fingerprint((
+            node_tokens,
+            sorted(
+                (positions[edge_item.source], positions[edge_item.target])
+                for edge_item in self._inner_graph.iter_edge_items()
+            ),
+            [(port.name, positions[self._ports[port.id]]) for port in self.attributes],
+            fixed_data
+        ))
+
+    def get_options(self) -> dict[str, Any]:
+        """
+        Returns the nested graph and the ports as constructor arguments for serialization.
+
+        :return: The dictionary form of the nested graph and the (port UUID, inner attribute UUID) pairs.
+        :rtype: dict[str, Any]
+        """
+        return {
+            'inner_graph': self._inner_graph.to_dict(),
+            'ports': [[str(port.uuid), str(self._ports[port.id].uuid)] for port in self.attributes]
+        }
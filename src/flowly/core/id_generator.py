@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from array import array
+from uuid import uuid1
+import itertools
+import os
+import threading
+import time
+import weakref
+
+from flowly.core.enumerations import IdStrategy
+
+
+class IdGenerator:
+    """
+    Generates the 128-bit integer IDs of entities.
+
+    Entities store their ID as a plain int, which is cheap to create, hash and compare, and only materialize a `UUID`
+    object for serialization. The generator supports several strategies:
+        - `IdStrategy.UUID7`: time-ordered UUIDs of version 7, i.e. a millisecond timestamp, a 12-bit sequence counter
+          and 62 random bits. The random bits are drawn from the operating system in batches. IDs are unique across
+          processes and machines and sort by creation time. This is the default.
+        - `IdStrategy.COUNTER`: a random 64-bit prefix per generator followed by a 64-bit counter. Fastest, and unique
+          across processes with overwhelming probability, but not a valid RFC 4122 UUID.
+        - `IdStrategy.UUID4` and `IdStrategy.UUID1`: the classic random and time-based UUIDs of the standard library.
+
+    Generators are reseeded in child processes after a fork, e.g. in process pool or distributed workers, so a child
+    never repeats the random bits, counter prefix or sequence state inherited from its parent.
+
+    Other schemes can be plugged in by subclassing and overriding `next_id`, and assigning an instance to
+    `BaseEntity.id_generator`.
+
+    Examples:
+        >>> generator = IdGenerator(IdStrategy.COUNTER)
+        >>> generator.next_id() + 1 == generator.next_id()
+        True
+        >>> (IdGenerator().next_id() >> 76) & 0xF
+        7
+    """
+
+    __slots__ = ('_strategy', '_batch_size', '_random_bits', '_random_index', '_last_millisecond', '_sequence',
+                 '_prefix', '_counter', '_lock', '__weakref__')
+
+    def __init__(self, strategy: IdStrategy = IdStrategy.UUID7, batch_size: int = 1024) -> None:
+        """
+        Initializes an `IdGenerator` instance.
+
+        :param strategy: The scheme of the generated IDs.
+        :type strategy: IdStrategy
+        :param batch_size: The number of IDs whose random bits are drawn at once.
+        :type batch_size: int
+        :raises ValueError: If the batch size is smaller than one.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least one.")
+
+        self._strategy: IdStrategy = strategy
+        self._batch_size: int = batch_size
+        self.reseed()
+        _GENERATORS.add(self)
+
+    def reseed(self) -> None:
+        """
+        Discards all random and sequence state and draws a new counter prefix. Called automatically in the child process
+        after a fork.
+        """
+        self._random_bits: array = array('Q')
+        self._random_index: int = 0
+        self._last_millisecond: int = 0
+        self._sequence: int = 0
+        self._prefix: int = int.from_bytes(os.urandom(8), 'big') << 64
+        self._counter: itertools.count = itertools.count()
+        self._lock: threading.Lock = threading.Lock()  # The parent's lock may have been held by another thread
+
+    @property
+    def strategy(self) -> IdStrategy:
+        """
+        Gets or sets the scheme of the generated IDs. Changing it only affects IDs generated afterwards.
+
+        :return: The ID strategy.
+        :rtype: IdStrategy
+        """
+        return self._strategy
+
+    @strategy.setter
+    def strategy(self, value: IdStrategy) -> None:
+        self._strategy = value
+
+    def next_id(self) -> int:
+        """
+        Generates a new ID. Thread-safe.
+
+        :return: The ID as a 128-bit integer, convertible with `UUID(int=...)`.
+        :rtype: int
+        """
+        if self._strategy is IdStrategy.UUID7:
+            return self._next_uuid7()
+        if self._strategy is IdStrategy.COUNTER:
+            return self._prefix | next(self._counter)
+        if self._strategy is IdStrategy.UUID4:
+            return (int.from_bytes(os.urandom(16), 'big') & ~(0xF << 76) & ~(0x3 << 62)) | (0x4 << 76) | (0x2 << 62)
+        return uuid1().int
+
+    def _next_uuid7(self) -> int:
+        """Generates a version 7 UUID, strictly increasing within this generator."""
+        millisecond: int = time.time_ns() // 1_000_000
+        with self._lock:
+            if millisecond > self._last_millisecond:
+                self._last_millisecond = millisecond
+                self._sequence = 0
+            else:
+                self._sequence += 1
+                if self._sequence > 0xFFF:  # Borrow the next millisecond once the sequence is exhausted
+                    self._last_millisecond += 1
+                    self._sequence = 0
+            if self._random_index >= len(self._random_bits):
+                self._random_bits = array('Q')
+                self._random_bits.frombytes(os.urandom(8 * self._batch_size))
+                self._random_index = 0
+            random_bits: int = self._random_bits[self._random_index]
+            self._random_index += 1
+            return (
+                (self._last_millisecond << 80) | ((0x7000 | self._sequence) << 64) |
+                (0x8000000000000000 | (random_bits & 0x3FFFFFFFFFFFFFFF))
+            )
+
+
+def _reseed_generators() -> None:
+    """Reseeds all generators in a forked child process."""
+    for generator in list(_GENERATORS):
+        generator.reseed()
+
+
+_GENERATORS: weakref.WeakSet[IdGenerator] = weakref.WeakSet()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reseed_generators)
+
+ID_GENERATOR: IdGenerator = IdGenerator()
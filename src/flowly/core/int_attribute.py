@@ -23,8 +23,9 @@
 # ************************************************************************
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 from uuid import UUID
+import operator
 
 from flowly.core.enumerations import AttributeFlags
 from flowly.core.attribute import Attribute
@@ -34,18 +35,59 @@ if TYPE_CHECKING:
 
 
 class IntAttribute(Attribute):
+    """
+    An attribute holding a single integer value.
+
+    Assigned data is converted losslessly to an int, so that NumPy scalars are stored as plain Python ints. Lists, as
+    gathered from several connected edges, are kept as they are. Integer data may be passed to integer and float
+    attributes.
+
+    Inherits:
+        Attribute: Provides the data, edge and serialization handling.
+    """
+
+    __slots__ = ()
+
     def __init__(
             self,
-            uuid: Optional[UUID] = None,
+            uuid: Optional[UUID | int] = None,
             name: str = "Attribute",
             data: Any = None,
-            data_type: type = Any,
+            data_type: type = int,
             flag: AttributeFlags = AttributeFlags.INPUT,
             parent: Optional[Node] = None,
             is_multi_edge: bool = True,
-            edges: Optional[list[Edge]] = None
+            edges: Optional[Iterable[Edge]] = None
     ) -> None:
         super().__init__(
             uuid=uuid, name=name, data=data, data_type=data_type, flag=flag, parent=parent, is_multi_edge=is_multi_edge,
             edges=edges
         )
+
+    def _convert_data(self, value: Any) -> Any:
+        """
+        Converts the data to an int.
+
+        :param value: The assigned or loaded data.
+        :type value: Any
+        :return: The converted data, or the data itself if it is None or a list.
+        :rtype: Any
+        :raises ValueError: If the data cannot be converted.
+        """
+        if value is None or isinstance(value, list):
+            return value
+        try:
+            return operator.index(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid integer data: {value!r}") from e
+
+    def is_compatible_with(self, other: Attribute) -> bool:
+        """
+        Checks if the data of this attribute can be passed to another attribute through an edge.
+
+        :param other: The attribute receiving the data.
+        :type other: Attribute
+        :return: True if the other attribute accepts integers, otherwise False.
+        :rtype: bool
+        """
+        return other.data_type in (int, float) or super().is_compatible_with(other)
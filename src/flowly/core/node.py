@@ -22,11 +22,17 @@
 # *                                                                      *
 # ************************************************************************
 
-from typing import Optional
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, ClassVar, Iterator, Optional
 from uuid import UUID
+import json
 
+from flowly.core.enumerations import AttributeFlags, StreamKind
 from flowly.core.base_entity import BaseEntity
 from flowly.core.attribute import Attribute
+from flowly.core.type_registry import TYPE_REGISTRY
+if TYPE_CHECKING:
+    from flowly.core.node_graph import NodeGraph
 
 
 class Node(BaseEntity):
@@ -38,18 +44,34 @@ class Node(BaseEntity):
     nodes through its attributes. This class provides mechanisms for managing the node's attributes and their
     connections.
 
+    Subclasses implement the node's behaviour by overriding `compute`, which maps the values of the input and option
+    attributes to the values of the output attributes. The node graph calls it during evaluation. Subclasses whose
+    results do not only depend on their inputs, e.g. nodes reading files or random generators, set `is_pure` to False to
+    opt out of result caching. Subclasses whose compute function works on NumPy arrays with a leading batch axis set
+    `is_vectorizable` to True, so that batch evaluation computes them once per batch instead of once per row.
+
+    For streaming evaluation, source nodes override `generate` to yield any number of output items, and downstream
+    nodes select how their compute function is applied to the incoming items through `stream_kind` and `window_size`.
+
     Inherits:
        BaseEntity: Provides common functionality for entities within the node-based system.
     """
 
-    __slots__ = ('_name', '_attributes')
+    __slots__ = ('_name', '_attributes', '_node_graph')
+
+    is_pure: ClassVar[bool] = True
+    is_vectorizable: ClassVar[bool] = False
+    stream_kind: ClassVar[StreamKind] = StreamKind.MAP
+    window_size: ClassVar[int] = 1
+
+    _REQUIRED_KEYS: ClassVar[frozenset[str]] = frozenset(('class_name', 'uuid', 'name', 'attributes'))
 
-    def __init__(self, uuid: Optional[UUID] = None, name: str = "Node") -> None:
+    def __init__(self, uuid: Optional[UUID | int] = None, name: str = "Node") -> None:
         """
         Initializes a new instance of the `Node` class.
 
         :param uuid: The unique identifier for the node. If not provided, a new UUID will be generated.
-        :type uuid: Optional[UUID]
+        :type uuid: Optional[UUID | int]
         :param name: The name of the node. Defaults to "Node".
         :type name: str
         """
@@ -57,6 +79,65 @@ class Node(BaseEntity):
 
         self._name: str = name
         self._attributes: list[Attribute] = []
+        self._node_graph: Optional[NodeGraph] = None
+
+    def __getstate__(self) -> tuple[Optional[dict[str, Any]], dict[str, Any]]:
+        """
+        Returns the pickle state of the node without its node graph reference.
+
+        This keeps pickling a node cheap, e.g. when it is sent to a worker process for computation.
+
+        :return: The instance dictionary, if any, and the slot values.
+        :rtype: tuple[Optional[dict[str, Any]], dict[str, Any]]
+        """
+        dict_state, slot_state = super().__getstate__()
+        slot_state['_node_graph'] = None
+        return dict_state, slot_state
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Node:
+        """
+        Creates a `Node` instance including its attributes from a dictionary, dynamically using the class name.
+
+        The node class is instantiated with only `uuid` and `name`, after which its attributes are replaced by the
+        deserialized ones, whose parent is set to the new node.
+
+        :param data: A dictionary containing the node properties.
+        :type data: dict[str, Any]
+        :return: An instance of `Node`.
+        :rtype: Node
+        :raises ValueError: If required fields are missing or invalid.
+        """
+        missing_keys: set[str] = cls._REQUIRED_KEYS.difference(data)
+        if missing_keys:
+            raise ValueError(f"Missing required key: '{sorted(missing_keys)[0]}' in input data.")
+
+        dynamic_class: type = TYPE_REGISTRY.resolve_class(data['class_name'])
+
+        try:
+            uuid: UUID = UUID(data['uuid'])  # Validate UUID
+        except ValueError as e:
+            raise ValueError(f"Invalid UUID: {data['uuid']}") from e
+
+        node: Node = dynamic_class(uuid=uuid, name=data['name'], **data.get('options', {}))
+        attributes: list[Attribute] = [Attribute.from_dict(attribute_data) for attribute_data in data['attributes']]
+        for attribute in attributes:
+            attribute.parent = node
+        node.attributes[:] = attributes
+        return node
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Node:
+        """
+        Creates a `Node` instance from a JSON string.
+
+        :param json_str: A JSON string representing the node.
+        :type json_str: str
+        :return: An instance of `Node`.
+        :rtype: Node
+        """
+        data: dict[str, Any] = json.loads(json_str)
+        return cls.from_dict(data)
 
     @property
     def name(self) -> str:
@@ -81,3 +162,112 @@ class Node(BaseEntity):
         :rtype: list[Attribute]
         """
         return self._attributes
+
+    @property
+    def node_graph(self) -> Optional[NodeGraph]:
+        """
+        Gets or sets the node graph the node is registered in. It is managed by the node graph.
+
+        :return: The owning node graph, if any.
+        :rtype: Optional[NodeGraph]
+        """
+        return self._node_graph
+
+    @node_graph.setter
+    def node_graph(self, value: Optional[NodeGraph]) -> None:
+        self._node_graph = value
+
+    @property
+    def internal_edges(self) -> list[tuple[Attribute, Attribute]]:
+        """
+        Gets the internal dependency edges of the node.
+
+        Every input or option attribute is connected to every output attribute, as the node's outputs are computed from
+        its inputs and options. These edges are used by the node graph for cycle detection.
+
+        :return: A list of (source attribute, target attribute) pairs.
+        :rtype: list[tuple[Attribute, Attribute]]
+        """
+        sources: list[Attribute] = [attr for attr in self._attributes if attr.flag is not AttributeFlags.OUTPUT]
+        targets: list[Attribute] = [attr for attr in self._attributes if attr.flag is AttributeFlags.OUTPUT]
+        return [(source, target) for source in sources for target in targets]
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Computes the output values of the node from its input and option values.
+
+        The default implementation produces no outputs. Subclasses override this method and should only depend on
+        `inputs`, so that the node graph can skip the computation while the inputs are unchanged. It may also be
+        overridden as a coroutine function for asynchronous evaluation with `NodeGraph.evaluate_async`.
+
+        :param inputs: The data of all input and option attributes, keyed by attribute name.
+        :type inputs: dict[str, Any]
+        :return: The data for the output attributes, keyed by attribute name. Missing outputs are left unchanged.
+        :rtype: dict[str, Any]
+        """
+        return {}
+
+    def generate(self, inputs: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """
+        Yields the output items of a source node in streaming evaluation, see `NodeGraph.stream`.
+
+        The default implementation yields the result of `compute` once. Source nodes of unbounded streams, e.g. sensor
+        readers, override this method to yield one output dictionary per record.
+
+        :param inputs: The data of all input and option attributes, keyed by attribute name.
+        :type inputs: dict[str, Any]
+        :return: An iterator over the data for the output attributes, keyed by attribute name.
+        :rtype: Iterator[dict[str, Any]]
+        """
+        yield self.compute(inputs)
+
+    def get_options(self) -> dict[str, Any]:
+        """
+        Returns the JSON serializable constructor arguments of a subclass, e.g. the nested graph of a group node. These
+        are stored as `options` by `to_dict` and passed to the constructor by `from_dict`.
+
+        :return: The additional constructor arguments by name. Empty for the base class.
+        :rtype: dict[str, Any]
+        """
+        return {}
+
+    def get_cache_token(self) -> Optional[str]:
+        """
+        Returns a string identifying the behaviour of the node beyond its class, which becomes part of its cache keys.
+        Nodes of the same class whose results differ for equal inputs, e.g. group nodes with different nested graphs,
+        must return different tokens.
+
+        :return: The token, empty for the base class, or None if the node must not be cached.
+        :rtype: Optional[str]
+        """
+        return ''
+
+    def to_dict(self, include_attributes: bool = True) -> dict[str, Any]:
+        """
+        Converts the node and its attributes to a dictionary representation.
+
+        :param include_attributes: Whether to include the attribute dictionaries. If False, the attribute list is left
+                                   empty, e.g. to serialize the attributes as separate records.
+        :type include_attributes: bool
+        :return: A dictionary containing the node's properties.
+        :rtype: dict[str, Any]
+        """
+        base_dict = super().to_dict()  # Get the dictionary from BaseEntity
+        node_dict = {
+            'class_name': f"{type(self).__module__}.{type(self).__name__}",  # Full class name
+            'name': self._name,
+            'attributes': [attribute.to_dict() for attribute in self._attributes] if include_attributes else [],
+        }
+        options: dict[str, Any] = self.get_options()
+        if options:
+            node_dict['options'] = options
+        return {**base_dict, **node_dict}  # Merge dictionaries
+
+    def to_json(self) -> str:
+        """
+        Converts the node to a JSON string.
+
+        :return: A JSON representation of the node.
+        :rtype: str
+        """
+        return json.dumps(self.to_dict())
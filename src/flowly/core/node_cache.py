@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Optional
+from collections import OrderedDict
+from functools import cache
+from pathlib import Path
+from types import CodeType
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+from flowly.core.fingerprint import fingerprint
+if TYPE_CHECKING:
+    from flowly.core.node import Node
+
+
+class NodeCache:
+    """
+    A memoization cache for node results, keyed on a fingerprint of the node's input and option data.
+
+    Results are kept in memory in least recently used order. The memory tier is bounded by a maximum number of entries
+    and optionally by an estimated size in bytes, evicting the least recently used results first. If a directory is
+    given, every result is also written to it as a pickle file, so results survive process restarts. A result found on
+    disk is promoted back into memory.
+
+    Entries are keyed on the node's class, a hash of its `compute` code, its cache token and input fingerprint, not on
+    the node's UUID, so nodes of the same class with equal inputs share results. The code hash keeps results on disk
+    from being reused after `compute` was changed; changes to functions called by `compute` are not detected, so nodes
+    depending on such code should include a version in their cache token. Nodes whose class sets `is_pure` to False
+    are never cached. Cached output values are shared between evaluations and must not be mutated.
+
+    Examples:
+        >>> node_graph.cache = NodeCache(max_entries=10_000, max_bytes=512 * 1024 ** 2)  # doctest: +SKIP
+        >>> node_graph.evaluate()  # doctest: +SKIP
+        >>> node_graph.cache.hits, node_graph.cache.misses  # doctest: +SKIP
+        (0, 42)
+    """
+
+    __slots__ = ('_max_entries', '_max_bytes', '_directory', '_entries', '_size_bytes', '_hits', '_misses')
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        directory: Optional[str | os.PathLike] = None
+    ) -> None:
+        """
+        Initializes a `NodeCache` instance.
+
+        :param max_entries: The maximum number of results kept in memory. Defaults to 1024.
+        :type max_entries: int
+        :param max_bytes: The maximum estimated size of all results kept in memory. Unbounded if None.
+        :type max_bytes: Optional[int]
+        :param directory: A directory for the persistent on-disk tier. It is created if needed. Disabled if None.
+        :type directory: Optional[str | os.PathLike]
+        :raises ValueError: If `max_entries` is smaller than one.
+        """
+        if max_entries < 1:
+            raise ValueError("The maximum number of entries must be at least one.")
+
+        self._max_entries: int = max_entries
+        self._max_bytes: Optional[int] = max_bytes
+        self._directory: Optional[Path] = Path(directory) if directory is not None else None
+        self._entries: OrderedDict[str, tuple[dict[str, Any], int]] = OrderedDict()
+        self._size_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of results kept in memory.
+
+        :return: The number of in-memory entries.
+        :rtype: int
+        """
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        """
+        Gets the number of lookups answered from the memory or disk tier.
+
+        :return: The hit count.
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Gets the number of lookups that required a computation.
+
+        :return: The miss count.
+        :rtype: int
+        """
+        return self._misses
+
+    @property
+    def size_bytes(self) -> int:
+        """
+        Gets the estimated size of all results kept in memory.
+
+        :return: The estimated size in bytes.
+        :rtype: int
+        """
+        return self._size_bytes
+
+    @staticmethod
+    def make_key(node_item: Node, inputs: dict[str, Any]) -> Optional[str]:
+        """
+        Creates the cache key for computing node_item with the given inputs.
+
+        :param node_item: The node to be computed.
+        :type node_item: Node
+        :param inputs: The input and option data of the node, keyed by attribute name.
+        :type inputs: dict[str, Any]
+        :return: The key, or None if the node is impure, has no cache token or its inputs cannot be fingerprinted.
+        :rtype: Optional[str]
+        """
+        if not node_item.is_pure:
+            return None
+
+        cache_token: Optional[str] = node_item.get_cache_token()
+        inputs_fingerprint: Optional[str] = fingerprint(inputs)
+        if cache_token is None or inputs_fingerprint is None:
+            return None
+        node_type: type = type(node_item)
+        prefix: str = f"{node_type.__module__}.{node_type.__qualname__}-{NodeCache._get_code_hash(node_type)}"
+        if cache_token:
+            return f"{prefix}-{cache_token}-{inputs_fingerprint}"
+        return f"{prefix}-{inputs_fingerprint}"
+
+    @staticmethod
+    @cache
+    def _get_code_hash(node_type: type) -> str:
+        """Hashes the bytecode, names and constants of the compute function of node_type, including nested functions."""
+        hasher = hashlib.blake2b(digest_size=8)
+        code: Optional[CodeType] = getattr(getattr(node_type.compute, '__func__', node_type.compute), '__code__', None)
+        if code is not None:
+            _update_code_hash(hasher, code)
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Looks up the outputs stored for the key and updates the hit and miss counters.
+
+        :param key: A key created by `make_key`.
+        :type key: str
+        :return: The cached outputs, or None on a miss.
+        :rtype: Optional[dict[str, Any]]
+        """
+        entry: Optional[tuple[dict[str, Any], int]] = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+        outputs: Optional[dict[str, Any]] = self._load(key)
+        if outputs is not None:
+            self._store(key, outputs)
+            self._hits += 1
+            return outputs
+
+        self._misses += 1
+        return None
+
+    def put(self, key: str, outputs: dict[str, Any]) -> None:
+        """
+        Stores the outputs for the key in memory and, if enabled, on disk.
+
+        :param key: A key created by `make_key`.
+        :type key: str
+        :param outputs: The computed outputs of the node.
+        :type outputs: dict[str, Any]
+        """
+        self._store(key, outputs)
+        if self._directory is not None:
+            self._dump(key, outputs)
+
+    def clear(self, include_disk: bool = False) -> None:
+        """
+        Removes all in-memory results and resets the counters.
+
+        :param include_disk: Whether to delete the results of the on-disk tier as well.
+        :type include_disk: bool
+        """
+        self._entries.clear()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        if include_disk and self._directory is not None:
+            for path in self._directory.glob('*.pickle'):
+                path.unlink(missing_ok=True)
+
+    def _store(self, key: str, outputs: dict[str, Any]) -> None:
+        """Adds the outputs to the memory tier and evicts least recently used entries beyond the bounds."""
+        previous: Optional[tuple[dict[str, Any], int]] = self._entries.pop(key, None)
+        if previous is not None:
+            self._size_bytes -= previous[1]
+
+        size: int = self._estimate_size(outputs)
+        self._entries[key] = (outputs, size)
+        self._size_bytes += size
+
+        while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._size_bytes > self._max_bytes and len(self._entries) > 1):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size_bytes -= evicted_size
+
+    @staticmethod
+    def _estimate_size(outputs: dict[str, Any]) -> int:
+        """Estimates the memory held by the outputs, using the buffer size of arrays where available."""
+        return sum(getattr(value, 'nbytes', None) or sys.getsizeof(value) for value in outputs.values())
+
+    def _load(self, key: str) -> Optional[dict[str, Any]]:
+        """Reads the outputs for the key from the on-disk tier, ignoring missing or unreadable files."""
+        if self._directory is None:
+            return None
+        try:
+            with open(self._directory / f"{key}.pickle", 'rb') as file:
+                return pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+    def _dump(self, key: str, outputs: dict[str, Any]) -> None:
+        """Writes the outputs atomically to the on-disk tier, skipping outputs that cannot be pickled."""
+        try:
+            data: bytes = pickle.dumps(outputs, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, self._directory / f"{key}.pickle")
+
+
+def _update_code_hash(hasher: Any, code: CodeType) -> None:
+    """Feeds a code object and the code objects nested in its constants into hasher."""
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode())
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            _update_code_hash(hasher, constant)
+        else:
+            hasher.update((fingerprint(constant) or repr(type(constant))).encode())
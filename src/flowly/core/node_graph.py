@@ -23,16 +23,34 @@
 # ************************************************************************
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional
+from uuid import UUID
+from functools import partial
 import logging
+import json
 
 import networkx as nx
 from flowly.core.attribute import AttributeFlags
+from flowly.core.node import Node
+from flowly.core.edge import Edge
+from flowly.core.enumerations import GraphStorage
+from flowly.core.array_di_graph import ArrayDiGraph
+from flowly.core.topological_order import TopologicalOrder
+from flowly.core.async_scheduler import AsyncScheduler
+from flowly.core.batch_evaluator import BatchEvaluator
+from flowly.core.compiled_graph import CompiledGraph
+from flowly.core.execution_plan import ExecutionPlan
+from flowly.core.graph_snapshot import GraphSnapshot
+from flowly.core.stream_runner import StreamRunner
+from flowly.core.node_cache import NodeCache
+from flowly.core.profiler import Profiler, profiled
 
 if TYPE_CHECKING:
     from flowly.core.base_entity import BaseEntity
     from flowly.core.attribute import Attribute
-    from flowly.core.node import Node
+    from flowly.core.distributed_scheduler import DistributedScheduler
+    from flowly.core.graph_patch import GraphPatch
+    from flowly.core.parallel_scheduler import ParallelScheduler
 
 
 # Configure logging with timestamp and more context
@@ -40,59 +58,161 @@ logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s -
 
 
 class NodeGraph:
-    def __init__(self) -> None:
+    def __init__(self, storage: GraphStorage = GraphStorage.NETWORKX) -> None:
+        """
+        Creates an empty node graph. The storage selects the main graph backend: a networkx DiGraph, or a compact
+        ArrayDiGraph with integer adjacency arrays for very large graphs. Both provide the same interface.
+        """
         self._node_items: list[Node] = []
-        self._main_graph: nx.DiGraph = nx.DiGraph()
+        self._node_items_by_id: dict[int, Node] = {}
+        self._attribute_items_by_id: dict[int, Attribute] = {}
+        self._edge_items_by_id: dict[int, Edge] = {}
+        self._main_graph: nx.DiGraph | ArrayDiGraph = ArrayDiGraph() if storage is GraphStorage.ARRAY else nx.DiGraph()
+        self._topological_order: TopologicalOrder = TopologicalOrder(self._main_graph)
+        self._dirty_node_items: set[Node] = set()
+        self._topology_version: int = 0
+        self._execution_plan: Optional[ExecutionPlan] = None
+        self._compiled_graph: Optional[CompiledGraph] = None
+        self._cache: Optional[NodeCache] = None
+        self._profiler: Optional[Profiler] = None
+        self._snapshot: Optional[GraphSnapshot] = None
+        self._parent: Optional[Node] = None
 
     @property
     def node_items(self) -> list[Node]:
         return self._node_items
 
     @property
-    def main_graph(self) -> nx.DiGraph:
+    def parent(self) -> Optional[Node]:
+        """
+        Returns the group node_item whose nested graph this is, if any. Invalidating anything in this node graph also
+        marks the parent dirty in its own node graph.
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: Optional[Node]) -> None:
+        self._parent = value
+
+    @property
+    def topology_version(self) -> int:
+        """Returns a counter incremented by every change of the node_items or edges, for validating cached plans."""
+        return self._topology_version
+
+    @property
+    def edge_items(self) -> list[Edge]:
+        return list(self._edge_items_by_id.values())
+
+    def iter_edge_items(self) -> Iterator[Edge]:
+        """Iterates over the edge_items without copying them into a list. The graph must not change meanwhile."""
+        return iter(self._edge_items_by_id.values())
+
+    @property
+    def main_graph(self) -> nx.DiGraph | ArrayDiGraph:
         return self._main_graph
 
+    @property
+    def dirty_node_items(self) -> set[Node]:
+        return self._dirty_node_items
+
+    @property
+    def cache(self) -> Optional[NodeCache]:
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: Optional[NodeCache]) -> None:
+        self._cache = value
+
+    @property
+    def profiler(self) -> Optional[Profiler]:
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, value: Optional[Profiler]) -> None:
+        self._profiler = value
+
+    @profiled
     def add_node_item(self, node_item: Node) -> None:
-        """Adds the node_item to the items list and its internal graph to the main graph."""
+        """Adds the node_item to the items list and its attributes and internal edges to the main graph in place."""
         self._node_items.append(node_item)
-        self._main_graph: nx.DiGraph = nx.compose(self._main_graph, node_item.internal_graph)
+        self._main_graph.add_nodes_from(node_item.attributes)
+        self._main_graph.add_edges_from(node_item.internal_edges)
+        self._add_to_topological_order(node_item)
+        self._add_to_indexes(node_item)
+        node_item.node_graph = self
+        self._dirty_node_items.add(node_item)
+        self._on_topology_changed()
+
+    @profiled
+    def add_node_items(self, node_items: Iterable[Node]) -> None:
+        """Adds several node_items at once, merging all their attributes and internal edges in a single pass."""
+        node_items: list[Node] = list(node_items)
+        self._node_items.extend(node_items)
+        self._main_graph.add_nodes_from(attr_item for node_item in node_items for attr_item in node_item.attributes)
+        self._main_graph.add_edges_from(edge for node_item in node_items for edge in node_item.internal_edges)
+        for node_item in node_items:
+            self._add_to_topological_order(node_item)
+            self._add_to_indexes(node_item)
+            node_item.node_graph = self
+        self._dirty_node_items.update(node_items)
+        self._on_topology_changed()
+
+    @profiled
+    def remove_node_item(self, node_item: Node) -> None:
+        """Removes the node_item and only its attribute vertices, including all incident edges, from the main graph."""
+        for downstream_node_item in self.get_downstream_node_items(node_item):
+            self.mark_node_item_dirty(downstream_node_item)
+
+        for attr_item in node_item.attributes:
+            for edge_item in list(attr_item.edges):
+                if edge_item.id in self._edge_items_by_id:
+                    self._remove_from_attribute_items(edge_item)
+            self._attribute_items_by_id.pop(attr_item.id, None)
+        self._node_items_by_id.pop(node_item.id, None)
+        if self._snapshot is not None:
+            self._snapshot = self._snapshot.without_node_item(node_item)
+
+        self._node_items.remove(node_item)
+        self._main_graph.remove_nodes_from(node_item.attributes)
+        self._topological_order.remove_vertices(node_item.attributes)
+        node_item.node_graph = None
+        self._dirty_node_items.discard(node_item)
+        self._on_topology_changed()
+
+    def _add_to_indexes(self, node_item: Node) -> None:
+        """Registers node_item and its attribute_items in the ID indexes."""
+        self._node_items_by_id[node_item.id] = node_item
+        for attr_item in node_item.attributes:
+            self._attribute_items_by_id[attr_item.id] = attr_item
+        if self._snapshot is not None:
+            self._snapshot = self._snapshot.with_node_item(node_item)
+
+    def get_node_item_by_uuid(self, uuid: UUID | int) -> Optional[Node]:
+        """Retrieve node item by its UUID or the UUID's integer value in constant time, or None if not found."""
+        return self._node_items_by_id.get(uuid if isinstance(uuid, int) else uuid.int)
+
+    def get_attribute_item_by_uuid(self, uuid: UUID | int) -> Optional[Attribute]:
+        """Retrieve attribute item by its UUID or the UUID's integer value in constant time, or None if not found."""
+        return self._attribute_items_by_id.get(uuid if isinstance(uuid, int) else uuid.int)
+
+    def get_edge_item_by_uuid(self, uuid: UUID | int) -> Optional[Edge]:
+        """Retrieve edge item by its UUID or the UUID's integer value in constant time, or None if not found."""
+        return self._edge_items_by_id.get(uuid if isinstance(uuid, int) else uuid.int)
+
+    def _add_to_topological_order(self, node_item: Node) -> None:
+        """Appends the attributes of node_item to the topological order, placing its outputs behind its inputs."""
+        self._topological_order.add_vertices(
+            sorted(node_item.attributes, key=lambda attr_item: attr_item.flag is AttributeFlags.OUTPUT)
+        )
 
     @staticmethod
     def get_attribute_item_by_id(node_item: Node, attribute_id: int) -> Optional[Attribute]:
         """Retrieve attribute item by its ID, or return None if not found."""
-        if 0 <= attribute_id < len(node_item.attribute_items):
-            return node_item.attribute_items[attribute_id]
+        if 0 <= attribute_id < len(node_item.attributes):
+            return node_item.attributes[attribute_id]
         return None
 
-    # def add_node_group_item(self, node_items: list[Node]) -> nx.Graph:
-    #     attribute_items: list[BaseEntity] = []
-    #     for node in node_items:
-    #         attribute_items.extend(node.attribute_items)
-    #
-    #     inner_items: list[BaseEntity] = attribute_items + node_items
-    #     outer_items: list[BaseEntity] = [item for item in self.nodes if item not in inner_items]
-    #
-    #     temp_graph: nx.DiGraph = self.copy()
-    #     temp_graph.remove_edges_from(
-    #         (item, neighbour, data)
-    #         for item, neighbour in self.adj.items()
-    #         if item in inner_items
-    #         for neighbour, data in neighbour.items()
-    #         if neighbour in outer_items
-    #     )
-    #     temp_graph.remove_edges_from(
-    #         (item, neighbour, data)
-    #         for item, neighbour in self.adj.items()
-    #         if item in outer_items
-    #         for neighbour, data in neighbour.items()
-    #         if neighbour in inner_items
-    #     )
-    #
-    #     return temp_graph
-    #
-    #     # sub_graph: nx.Graph = self.subgraph(node_items + inner_items)
-    #     # return sub_graph
-    #
+    @profiled
     def validate_connection(self, out_attribute_item: Optional[Attribute],
                             in_attribute_item: Optional[Attribute]) -> Optional[str]:
         """
@@ -117,11 +237,19 @@ class NodeGraph:
         if out_attribute_item.flag is in_attribute_item.flag:
             return "Cannot connect inputs to inputs or outputs to outputs."
 
-        if (out_attribute_item.data_type != in_attribute_item.data_type and
-                not (out_attribute_item.data_type == Any or in_attribute_item.data_type == Any)):
+        if self._main_graph.has_edge(out_attribute_item, in_attribute_item):
+            return "Attribute items are already connected."
+
+        if not out_attribute_item.is_multi_edge and out_attribute_item.has_edge():
+            return "Output attribute item does not allow multiple edges."
+
+        if not in_attribute_item.is_multi_edge and in_attribute_item.has_edge():
+            return "Input attribute item does not allow multiple edges."
+
+        if not out_attribute_item.is_compatible_with(in_attribute_item):
             return "Cannot connect attribute items with incompatible data types."
 
-        if nx.has_path(self._main_graph, in_attribute_item, out_attribute_item):
+        if self._topological_order.creates_cycle(out_attribute_item, in_attribute_item):
             return "Cyclic dependency found."
 
         return None
@@ -137,11 +265,373 @@ class NodeGraph:
             return False
         return True
 
+    @profiled
     def add_edge_item(self, out_node_item: Node, out_attribute_id: int,
-                      in_node_item: Node, in_attribute_id: int) -> None:
-        """Attempts to add an edge between two node attribute_items."""
+                      in_node_item: Node, in_attribute_id: int) -> Optional[Edge]:
+        """Attempts to add an edge between two node attribute_items. Returns the new edge item, or None if invalid."""
         out_attr_item: Optional[Attribute] = self.get_attribute_item_by_id(out_node_item, out_attribute_id)
         in_attr_item: Optional[Attribute] = self.get_attribute_item_by_id(in_node_item, in_attribute_id)
 
         if self.can_connect(out_attr_item, in_attr_item):
-            self._main_graph.add_edge(out_attr_item, in_attr_item)
+            return self._connect_attribute_items(out_attr_item, in_attr_item)
+        return None
+
+    def connect_attribute_items(self, out_attribute_item: Attribute, in_attribute_item: Attribute,
+                                edge_uuid: Optional[UUID | int] = None) -> Edge:
+        """
+        Adds an edge between two attribute_items, raising a ValueError with the validation message if it is invalid.
+        The edge item gets edge_uuid, e.g. when restoring a saved graph, or a new UUID.
+        """
+        message: Optional[str] = self.validate_connection(out_attribute_item, in_attribute_item)
+        if message:
+            raise ValueError(f"Invalid edge {out_attribute_item} -> {in_attribute_item}: {message}")
+        return self._connect_attribute_items(out_attribute_item, in_attribute_item, edge_uuid)
+
+    def _connect_attribute_items(self, out_attribute_item: Attribute, in_attribute_item: Attribute,
+                                 edge_uuid: Optional[UUID | int] = None) -> Edge:
+        """Adds an already validated edge to the main graph, topological order, both attribute_items and index."""
+        edge_item: Edge = Edge(uuid=edge_uuid, source=out_attribute_item, target=in_attribute_item)
+        self._add_edge_item(edge_item)
+        return edge_item
+
+    def _add_edge_item(self, edge_item: Edge) -> None:
+        """Adds an already validated edge item to the main graph, topological order, its attribute_items and index."""
+        self._topological_order.add_edge(edge_item.source, edge_item.target)
+        self._main_graph.add_edge(edge_item.source, edge_item.target)
+
+        edge_item.source.connect_edge(edge_item)
+        edge_item.target.connect_edge(edge_item)
+        self._edge_items_by_id[edge_item.id] = edge_item
+        if self._snapshot is not None:
+            self._snapshot = self._snapshot.with_edge_item(edge_item)
+
+        self.mark_attribute_item_dirty(edge_item.target)
+        self._on_topology_changed()
+
+    @profiled
+    def remove_edge_item(self, out_node_item: Node, out_attribute_id: int,
+                         in_node_item: Node, in_attribute_id: int) -> None:
+        """Removes the edge between two node attribute_items, if it exists. The topological order stays valid."""
+        out_attr_item: Optional[Attribute] = self.get_attribute_item_by_id(out_node_item, out_attribute_id)
+        in_attr_item: Optional[Attribute] = self.get_attribute_item_by_id(in_node_item, in_attribute_id)
+
+        if in_attr_item is not None:
+            for edge_item in in_attr_item.edges:
+                if edge_item.source is out_attr_item:
+                    self.remove_edge_item_by_uuid(edge_item.id)
+                    break
+
+    def remove_edge_item_by_uuid(self, uuid: UUID | int) -> None:
+        """Removes the edge item with the given UUID, or the UUID's integer value, if it exists."""
+        edge_item: Optional[Edge] = self._edge_items_by_id.get(uuid if isinstance(uuid, int) else uuid.int)
+        if edge_item is not None:
+            self._remove_from_attribute_items(edge_item)
+            self._main_graph.remove_edge(edge_item.source, edge_item.target)
+            self.mark_attribute_item_dirty(edge_item.target)
+            self._on_topology_changed()
+
+    def _remove_from_attribute_items(self, edge_item: Edge) -> None:
+        """Disconnects edge_item from both attribute_items and removes it from the index."""
+        edge_item.source.disconnect_edge(edge_item)
+        edge_item.target.disconnect_edge(edge_item)
+        del self._edge_items_by_id[edge_item.id]
+        if self._snapshot is not None:
+            self._snapshot = self._snapshot.without_edge_item(edge_item)
+            if not edge_item.target.has_edge() and edge_item.target.is_data_loaded:
+                self._snapshot = self._snapshot.with_data(edge_item.target, edge_item.target.data)
+
+    def get_downstream_node_items(self, node_item: Node) -> Iterator[Node]:
+        """Yields the node_items consuming an output of node_item, once per connecting edge."""
+        for attr_item in node_item.attributes:
+            if attr_item.flag is AttributeFlags.OUTPUT:
+                for successor in self._main_graph.successors(attr_item):
+                    yield successor.parent
+
+    def get_upstream_node_items(self, node_item: Node) -> Iterator[Node]:
+        """Yields the node_items feeding an input or option of node_item, once per connecting edge."""
+        for _, upstream_attr_items in self.get_execution_plan().get_input_slots(node_item):
+            for upstream_attr_item in upstream_attr_items:
+                yield upstream_attr_item.parent
+
+    def get_required_node_items(self, targets: Iterable[Attribute]) -> list[Node]:
+        """
+        Returns the dirty node_items that must be computed to bring the targets up to date, in topological order: the
+        node_items owning the targets and their dirty ancestors. The walk stops at clean node_items, as the dirty set is
+        closed downstream and everything upstream of a clean node_item is clean as well.
+        """
+        required_node_items: set[Node] = set()
+        stack: list[Node] = [attr_item.parent for attr_item in targets]
+        while stack:
+            node_item: Node = stack.pop()
+            if node_item in self._dirty_node_items and node_item not in required_node_items:
+                required_node_items.add(node_item)
+                stack.extend(self.get_upstream_node_items(node_item))
+        return sorted(required_node_items, key=self.get_execution_plan().positions.__getitem__)
+
+    def mark_node_item_dirty(self, node_item: Node) -> None:
+        """
+        Marks node_item and its whole downstream cone as dirty.
+        The dirty set is always closed downstream, so the walk stops at node_items that are already dirty.
+        """
+        if node_item in self._dirty_node_items:
+            return
+
+        stack: list[Node] = [node_item]
+        while stack:
+            current_node_item: Node = stack.pop()
+            if current_node_item not in self._dirty_node_items:
+                self._dirty_node_items.add(current_node_item)
+                stack.extend(self.get_downstream_node_items(current_node_item))
+        self._mark_parent_dirty()
+
+    def _mark_parent_dirty(self) -> None:
+        """Marks the parent group node_item dirty in its node graph, as its result depends on this node graph."""
+        if self._parent is not None and self._parent.node_graph is not None:
+            self._parent.node_graph.mark_node_item_dirty(self._parent)
+
+    def mark_attribute_item_dirty(self, attribute_item: Attribute) -> None:
+        """
+        Marks everything downstream of attribute_item as dirty. Changing an input or option invalidates its own
+        node_item, while changing an output only invalidates the node_items consuming it.
+        """
+        if attribute_item.parent in self._dirty_node_items:
+            return
+
+        if attribute_item.flag is AttributeFlags.OUTPUT:
+            for successor in self._main_graph.successors(attribute_item):
+                self.mark_node_item_dirty(successor.parent)
+        else:
+            self.mark_node_item_dirty(attribute_item.parent)
+
+    def on_attribute_item_data_changed(self, attribute_item: Attribute) -> None:
+        """
+        Called when the data of attribute_item is set. Records the data of unconnected inputs and options in the
+        current snapshot, if snapshots are tracked, and marks everything downstream of attribute_item as dirty. Data
+        pulled through edges during evaluation is derived and not recorded.
+        """
+        if (self._snapshot is not None and attribute_item.flag is not AttributeFlags.OUTPUT
+                and not attribute_item.has_edge()):
+            self._snapshot = self._snapshot.with_data(attribute_item, attribute_item.data)
+        self.mark_attribute_item_dirty(attribute_item)
+
+    def snapshot(self) -> GraphSnapshot:
+        """
+        Returns an immutable snapshot of the node_items, edges and input data, see `GraphSnapshot`. The first call
+        records the whole graph. From then on, every mutation updates the current snapshot by path copying, so later
+        calls are O(1).
+        """
+        if self._snapshot is None:
+            self._snapshot = GraphSnapshot.from_node_graph(self)
+        return self._snapshot
+
+    def restore(self, snapshot: GraphSnapshot) -> None:
+        """
+        Changes the node graph back or forward to the state of snapshot, e.g. for undo and redo. Only the node_items,
+        edges and data that differ from the current snapshot are touched, and the affected node_items become dirty.
+        The node_items keep their identity, so snapshot must have been taken of this node graph.
+        """
+        current: GraphSnapshot = self.snapshot()
+        node_changes: list[tuple[Optional[Node], Optional[Node]]] = list(current.diff_node_items(snapshot))
+        edge_changes: list[tuple[Optional[Edge], Optional[Edge]]] = list(current.diff_edge_items(snapshot))
+        data_changes: list[Attribute] = list(current.diff_data_attributes(snapshot))
+
+        self._snapshot = None
+        for removed_edge_item, _ in edge_changes:
+            if removed_edge_item is not None:
+                self.remove_edge_item_by_uuid(removed_edge_item.id)
+        for removed_node_item, _ in node_changes:
+            if removed_node_item is not None:
+                self.remove_node_item(removed_node_item)
+        self.add_node_items(added_node_item for _, added_node_item in node_changes if added_node_item is not None)
+        for _, added_edge_item in edge_changes:
+            if added_edge_item is not None:
+                self._add_edge_item(added_edge_item)
+        for attr_item in data_changes:
+            loader: Optional[Callable[[], Any]] = snapshot.get_data_loader(attr_item)
+            if loader is not None:
+                attr_item.set_data_loader(loader)
+                self.mark_attribute_item_dirty(attr_item)
+            else:
+                attr_item.data = snapshot.get_data(attr_item)
+
+        if node_changes:
+            self._node_items = snapshot.node_items
+        self._snapshot = snapshot
+
+    def _on_topology_changed(self) -> None:
+        """
+        Increments the topology version, which invalidates the cached execution plan and compiled graph, and marks the
+        parent group node_item dirty.
+        """
+        self._topology_version += 1
+        self._mark_parent_dirty()
+
+    def get_execution_plan(self) -> ExecutionPlan:
+        """Returns the execution plan of the current topology, building it only if the topology version changed."""
+        if self._execution_plan is None or self._execution_plan.topology_version != self._topology_version:
+            self._execution_plan = ExecutionPlan(self)
+        return self._execution_plan
+
+    def get_sorted_node_items(self) -> list[Node]:
+        """Returns all node_items in topological order. The order is cached until the topology changes."""
+        return list(self.get_execution_plan().node_items)
+
+    def get_sorted_dirty_node_items(self) -> list[Node]:
+        """Returns the dirty node_items in topological order."""
+        return sorted(self._dirty_node_items, key=self.get_execution_plan().positions.__getitem__)
+
+    def get_input_data(self, node_item: Node) -> dict[str, Any]:
+        """
+        Pulls the data of all connected outputs into the input and option attribute_items of node_item and returns
+        their data by name. An attribute_item fed by several edges receives a list of the upstream data.
+        """
+        inputs: dict[str, Any] = {}
+        for attr_item, upstream_attr_items in self.get_execution_plan().get_input_slots(node_item):
+            if len(upstream_attr_items) == 1:
+                attr_item.data = upstream_attr_items[0].data
+            elif upstream_attr_items:
+                attr_item.data = [upstream_attr_item.data for upstream_attr_item in upstream_attr_items]
+            inputs[attr_item.name] = attr_item.data
+        return inputs
+
+    def set_output_data(self, node_item: Node, outputs: dict[str, Any]) -> None:
+        """Writes the computed outputs to the matching output attribute_items of node_item and marks it clean."""
+        output_slots: dict[str, Attribute] = self.get_execution_plan().get_output_slots(node_item)
+        for name, data in outputs.items():
+            if name in output_slots:
+                output_slots[name].data = data
+        self._dirty_node_items.discard(node_item)
+
+    def defer_output_data(self, node_item: Node, outputs: dict[str, Any]) -> None:
+        """
+        Hands the computed outputs to the matching output attribute_items of node_item as data loaders and marks it
+        clean. Nothing is written or invalidated, so this suits intermediate results whose consumers were already
+        computed from them, e.g. inside a fused function of a `CompiledGraph`.
+        """
+        output_slots: dict[str, Attribute] = self.get_execution_plan().get_output_slots(node_item)
+        for name in outputs:
+            if name in output_slots:
+                output_slots[name].set_data_loader(partial(outputs.__getitem__, name))
+        self._dirty_node_items.discard(node_item)
+
+    def get_cache_key(self, node_item: Node, inputs: dict[str, Any]) -> Optional[str]:
+        """Returns the cache key of node_item for the inputs, or None without a cache or if node_item is uncacheable."""
+        return NodeCache.make_key(node_item, inputs) if self._cache is not None else None
+
+    def evaluate_node_item(self, node_item: Node) -> None:
+        """Computes node_item from its inputs or reuses a cached result, stores its outputs and marks it clean."""
+        inputs: dict[str, Any] = self.get_input_data(node_item)
+        cache_key: Optional[str] = self.get_cache_key(node_item, inputs)
+        outputs: Optional[dict[str, Any]] = self._cache.get(cache_key) if cache_key is not None else None
+        if outputs is None:
+            if self._profiler is None:
+                outputs = node_item.compute(inputs)
+            else:
+                with self._profiler.measure('node', node_item.name, node_item.uuid):
+                    outputs = node_item.compute(inputs)
+            if cache_key is not None:
+                self._cache.put(cache_key, outputs)
+        self.set_output_data(node_item, outputs)
+
+    def evaluate(
+        self, scheduler: Optional[ParallelScheduler | DistributedScheduler] = None,
+        targets: Optional[Iterable[Attribute]] = None
+    ) -> None:
+        """
+        Recomputes only the dirty node_items, in cached topological order. Clean node_items keep their outputs.
+        If a scheduler is given, independent dirty node_items are computed concurrently by it instead, on threads or
+        processes with a `ParallelScheduler`, or on partitioned worker processes with a `DistributedScheduler`.
+        If targets are given, only the dirty node_items they depend on are computed (pull mode), everything else stays
+        dirty, see `get_required_node_items`.
+        """
+        node_items: list[Node] = (
+            self.get_required_node_items(targets) if targets is not None else self.get_sorted_dirty_node_items()
+        )
+        if scheduler is not None:
+            scheduler.run(self, node_items)
+            return
+
+        for node_item in node_items:
+            self.evaluate_node_item(node_item)
+
+    async def evaluate_async(
+        self, scheduler: Optional[AsyncScheduler] = None, targets: Optional[Iterable[Attribute]] = None
+    ) -> None:
+        """
+        Recomputes the dirty node_items on the running event loop without blocking it. Compute functions may be
+        coroutines, and independent node_items are awaited concurrently. Targets restrict the evaluation like in
+        `evaluate`.
+        """
+        node_items: Optional[list[Node]] = self.get_required_node_items(targets) if targets is not None else None
+        await (scheduler or AsyncScheduler()).run(self, node_items)
+
+    def evaluate_batch(self, batch_data: dict[Attribute, Any]) -> dict[Attribute, Any]:
+        """
+        Evaluates all node_items once for many input rows, given as arrays with a leading batch axis keyed by
+        unconnected input or option attribute_items. Vectorizable node_items run once per batch, the others once per
+        row. Returns the data of all output attribute_items without changing the node graph, see `BatchEvaluator`.
+        """
+        return BatchEvaluator().run(self, batch_data)
+
+    def stream(self, runner: Optional[StreamRunner] = None) -> Iterator[tuple[Node, dict[str, Any]]]:
+        """
+        Evaluates the node graph as a streaming pipeline and yields the output items of the sink node_items, see
+        `StreamRunner`. The streamed items are never stored in the attribute_items, and the dirty state is unchanged.
+        Raises a ValueError if a node_item joins streams that passed different filter or window node_items.
+        """
+        return (runner or StreamRunner()).run(self)
+
+    def apply_patch(self, patch: GraphPatch) -> None:
+        """
+        Applies a structural diff to the node graph, see `GraphPatch`. Raises a ValueError if the patch does not match.
+        """
+        patch.apply(self)
+
+    def compile(self) -> CompiledGraph:
+        """
+        Returns the node graph compiled into fused functions, see `CompiledGraph`. The compiled graph is cached until
+        the topology changes.
+        """
+        if self._compiled_graph is None or self._compiled_graph.topology_version != self._topology_version:
+            self._compiled_graph = CompiledGraph(self)
+        return self._compiled_graph
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], storage: GraphStorage = GraphStorage.NETWORKX) -> NodeGraph:
+        """
+        Creates a node graph from a dictionary in a single pass. Classes and data types are resolved once through the
+        type registry, and the edge items are reconnected to their attribute_items by UUID.
+        Raises a ValueError if the data is incomplete or contains an invalid connection.
+        """
+        if 'nodes' not in data or 'edges' not in data:
+            raise ValueError("Dictionary must contain a 'nodes' and an 'edges' key.")
+
+        node_graph: NodeGraph = cls(storage)
+        node_graph.add_node_items(Node.from_dict(node_data) for node_data in data['nodes'])
+        for edge_data in data['edges']:
+            try:
+                node_graph.connect_attribute_items(
+                    node_graph.get_attribute_item_by_uuid(UUID(edge_data['source'])),
+                    node_graph.get_attribute_item_by_uuid(UUID(edge_data['target'])),
+                    UUID(edge_data['uuid'])
+                )
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Invalid edge data: {edge_data}") from e
+        return node_graph
+
+    @classmethod
+    def from_json(cls, json_str: str, storage: GraphStorage = GraphStorage.NETWORKX) -> NodeGraph:
+        """Creates a node graph from a JSON string."""
+        data: dict[str, Any] = json.loads(json_str)
+        return cls.from_dict(data, storage)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the node graph to a dictionary with all node_items, their attribute_items and the edges."""
+        return {
+            'nodes': [node_item.to_dict() for node_item in self._node_items],
+            'edges': [edge_item.to_dict() for edge_item in self._edge_items_by_id.values()],
+        }
+
+    def to_json(self) -> str:
+        """Converts the node graph to a JSON string."""
+        return json.dumps(self.to_dict())
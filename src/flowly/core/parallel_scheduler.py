@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from flowly.core.enumerations import ExecutorMode
+from flowly.core.profiler import Profiler
+if TYPE_CHECKING:
+    from flowly.core.node import Node
+    from flowly.core.node_graph import NodeGraph
+
+
+def _compute_node_item(node_item: Node, inputs: dict[str, Any]) -> dict[str, Any]:
+    """Runs the compute function of node_item. Defined on module level, so that it can be sent to worker processes."""
+    return node_item.compute(inputs)
+
+
+class ParallelScheduler:
+    """
+    Evaluates the dirty nodes of a node graph concurrently on a `concurrent.futures` executor.
+
+    The scheduler keeps a ready queue of dirty nodes whose upstream nodes are all resolved. Ready nodes are dispatched
+    to the executor as long as fewer than `max_workers` computations are in flight, and every finished node releases
+    the nodes depending on it. Only the compute functions run on the executor: gathering inputs and storing outputs
+    happens on the calling thread, so the node graph is never mutated concurrently. Nodes with a result in the node
+    graph's cache are resolved without being dispatched.
+
+    Two executor modes are supported:
+        - `ExecutorMode.THREAD` for nodes doing I/O or releasing the GIL, e.g. NumPy heavy nodes.
+        - `ExecutorMode.PROCESS` for CPU bound pure Python nodes. The nodes and their inputs and outputs must be
+          picklable, and the compute function runs on a copy of the node.
+
+    Examples:
+        >>> scheduler = ParallelScheduler(ExecutorMode.THREAD, max_workers=4)
+        >>> node_graph.evaluate(scheduler=scheduler)  # doctest: +SKIP
+    """
+
+    __slots__ = ('_mode', '_max_workers', '_executor')
+
+    def __init__(
+        self,
+        mode: ExecutorMode = ExecutorMode.THREAD,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Initializes a `ParallelScheduler` instance.
+
+        :param mode: The kind of executor to create for each run. Ignored if `executor` is given.
+        :type mode: ExecutorMode
+        :param max_workers: The maximum number of concurrently computed nodes. Defaults to the executor's default.
+        :type max_workers: Optional[int]
+        :param executor: An existing executor to dispatch to. It is not shut down by the scheduler.
+        :type executor: Optional[Executor]
+        :raises ValueError: If `max_workers` is smaller than one.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("The maximum number of workers must be at least one.")
+
+        self._mode: ExecutorMode = mode
+        self._max_workers: Optional[int] = max_workers
+        self._executor: Optional[Executor] = executor
+
+    @property
+    def mode(self) -> ExecutorMode:
+        """
+        Gets the executor mode.
+
+        :return: The executor mode.
+        :rtype: ExecutorMode
+        """
+        return self._mode
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        """
+        Gets the maximum number of concurrently computed nodes.
+
+        :return: The maximum concurrency, or None for the executor's default.
+        :rtype: Optional[int]
+        """
+        return self._max_workers
+
+    def _create_executor(self) -> Executor:
+        """Creates a new executor matching the configured mode."""
+        if self._mode is ExecutorMode.PROCESS:
+            return ProcessPoolExecutor(max_workers=self._max_workers)
+        return ThreadPoolExecutor(max_workers=self._max_workers)
+
+    def run(self, node_graph: NodeGraph, node_items: Optional[Iterable[Node]] = None) -> None:
+        """
+        Computes all dirty nodes of the node graph, running independent nodes concurrently.
+
+        :param node_graph: The node graph to evaluate.
+        :type node_graph: NodeGraph
+        :param node_items: The dirty nodes to compute, which must include their dirty upstream nodes. Defaults to all
+                           dirty nodes.
+        :type node_items: Optional[Iterable[Node]]
+        :raises Exception: Re-raises the first exception of a compute function after in-flight nodes have finished.
+        """
+        dirty_node_items: list[Node] = list(node_items if node_items is not None else node_graph.dirty_node_items)
+        if self._executor is not None:
+            self._run(node_graph, dirty_node_items, self._executor)
+        else:
+            with self._create_executor() as executor:
+                self._run(node_graph, dirty_node_items, executor)
+
+    def _run(self, node_graph: NodeGraph, dirty_node_items: list[Node], executor: Executor) -> None:
+        """Dispatches ready nodes to the executor until all given dirty nodes are resolved."""
+        pending_counts: dict[Node, int] = dict.fromkeys(dirty_node_items, 0)
+        for node_item in dirty_node_items:
+            for downstream_node_item in node_graph.get_downstream_node_items(node_item):
+                if downstream_node_item in pending_counts:
+                    pending_counts[downstream_node_item] += 1
+
+        ready: deque[Node] = deque(node_item for node_item, count in pending_counts.items() if count == 0)
+        in_flight: dict[Future, tuple[Node, Optional[str]]] = {}
+        profiler: Optional[Profiler] = node_graph.profiler
+        max_in_flight: int = self._max_workers or max(len(dirty_node_items), 1)
+
+        def resolve(resolved_node_item: Node, outputs: dict[str, Any]) -> None:
+            node_graph.set_output_data(resolved_node_item, outputs)
+            for downstream_node_item in node_graph.get_downstream_node_items(resolved_node_item):
+                if downstream_node_item in pending_counts:
+                    pending_counts[downstream_node_item] -= 1
+                    if pending_counts[downstream_node_item] == 0:
+                        ready.append(downstream_node_item)
+
+        while ready or in_flight:
+            while ready and len(in_flight) < max_in_flight:
+                node_item: Node = ready.popleft()
+                inputs: dict[str, Any] = node_graph.get_input_data(node_item)
+                cache_key: Optional[str] = node_graph.get_cache_key(node_item, inputs)
+                cached_outputs: Optional[dict[str, Any]] = (
+                    node_graph.cache.get(cache_key) if cache_key is not None else None
+                )
+                if cached_outputs is not None:
+                    resolve(node_item, cached_outputs)
+                elif profiler is None:
+                    in_flight[executor.submit(_compute_node_item, node_item, inputs)] = (node_item, cache_key)
+                else:
+                    in_flight[executor.submit(Profiler.measure_call, _compute_node_item, node_item, inputs)] = (
+                        node_item, cache_key
+                    )
+
+            if not in_flight:
+                continue
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                node_item, cache_key = in_flight.pop(future)
+                error: Optional[BaseException] = future.exception()
+                if error is not None:
+                    for pending_future in in_flight:
+                        pending_future.cancel()
+                    wait(in_flight)
+                    raise error
+
+                outputs: dict[str, Any] = future.result()
+                if profiler is not None:
+                    outputs, sample = outputs
+                    profiler.add_sample('node', node_item.name, node_item.uuid, sample)
+                if cache_key is not None:
+                    node_graph.cache.put(cache_key, outputs)
+                resolve(node_item, outputs)
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import Any, ClassVar, Iterator, Optional
+
+_BITS: int = 5
+_MASK: int = (1 << _BITS) - 1
+_HASH_BITS: int = 64
+
+# A leaf is a tuple of (hash, key, value), a child is a _BitmapNode or a _CollisionNode.
+_Leaf = tuple[int, Any, Any]
+
+
+class _BitmapNode:
+    """An inner trie node holding up to 32 leaves or children, compressed by a bitmap of the occupied slots."""
+
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap: int, entries: tuple[Any, ...]) -> None:
+        self.bitmap: int = bitmap
+        self.entries: tuple[Any, ...] = entries
+
+
+class _CollisionNode:
+    """A trie node holding the leaves of different keys whose hashes are equal in all bits."""
+
+    __slots__ = ('entries',)
+
+    def __init__(self, entries: tuple[_Leaf, ...]) -> None:
+        self.entries: tuple[_Leaf, ...] = entries
+
+
+class PersistentMap:
+    """
+    An immutable mapping with structural sharing, implemented as a hash array mapped trie.
+
+    Every update returns a new map that shares all untouched trie nodes with the original, so `set` and `remove` copy
+    only the path to the changed key, i.e. O(log32 n) nodes. Keeping an old version is therefore free, which makes the
+    map suitable for cheap snapshots. Since maps are never mutated, they can be read from any thread without locking.
+
+    `diff` compares two versions of the same map and skips every shared subtree, so its cost depends on the number of
+    changes rather than on the size of the map.
+
+    Examples:
+        >>> first = PersistentMap().set('a', 1).set('b', 2)
+        >>> second = first.set('a', 3).remove('b')
+        >>> first.get('a'), second.get('a'), 'b' in second, len(first)
+        (1, 3, False, 2)
+        >>> sorted(first.diff(second), key=str)
+        [('a', 1, 3), ('b', 2, <missing>)]
+    """
+
+    __slots__ = ('_root', '_size')
+
+    MISSING: ClassVar[Any] = type('Missing', (), {'__repr__': lambda self: '<missing>'})()
+
+    def __init__(self, _root: Optional[_BitmapNode] = None, _size: int = 0) -> None:
+        """
+        Initializes an empty `PersistentMap`. The arguments are internal and used by the update methods.
+        """
+        self._root: _BitmapNode = _root if _root is not None else _BitmapNode(0, ())
+        self._size: int = _size
+
+    @classmethod
+    def from_items(cls, items: Iterator[tuple[Any, Any]]) -> PersistentMap:
+        """
+        Creates a map from key-value pairs in one pass, without copying paths for every pair. Later pairs replace
+        earlier ones with the same key.
+
+        :param items: The key-value pairs.
+        :type items: Iterator[tuple[Any, Any]]
+        :return: The new map.
+        :rtype: PersistentMap
+        """
+        unique_items: dict[Any, Any] = dict(items)
+        if not unique_items:
+            return cls()
+        leaves: list[_Leaf] = [(hash(key) & ((1 << _HASH_BITS) - 1), key, value) for key, value in unique_items.items()]
+        return cls(cls._build(leaves, 0), len(leaves))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of keys in the map.
+
+        :return: The number of keys.
+        :rtype: int
+        """
+        return self._size
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Checks if the key is in the map.
+
+        :param key: The key to look up.
+        :type key: Any
+        :return: True if the key is in the map, otherwise False.
+        :rtype: bool
+        """
+        return self.get(key, self.MISSING) is not self.MISSING
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over the keys in hash order.
+
+        :return: An iterator over the keys.
+        :rtype: Iterator[Any]
+        """
+        return (key for _, key, _ in self._iter_leaves(self._root))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Returns the value of the key, or the default if the key is not in the map.
+
+        :param key: The key to look up.
+        :type key: Any
+        :param default: The value returned for a missing key. Defaults to None.
+        :type default: Any
+        :return: The value of the key or the default.
+        :rtype: Any
+        """
+        key_hash: int = hash(key) & ((1 << _HASH_BITS) - 1)
+        node: Any = self._root
+        shift: int = 0
+        while True:
+            if isinstance(node, _CollisionNode):
+                for _, entry_key, entry_value in node.entries:
+                    if entry_key == key:
+                        return entry_value
+                return default
+
+            bit: int = 1 << ((key_hash >> shift) & _MASK)
+            if not node.bitmap & bit:
+                return default
+            entry: Any = node.entries[(node.bitmap & (bit - 1)).bit_count()]
+            if isinstance(entry, tuple):
+                return entry[2] if entry[1] == key else default
+            node = entry
+            shift += _BITS
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """
+        Iterates over the key-value pairs in hash order.
+
+        :return: An iterator over the key-value pairs.
+        :rtype: Iterator[tuple[Any, Any]]
+        """
+        return ((key, value) for _, key, value in self._iter_leaves(self._root))
+
+    def values(self) -> Iterator[Any]:
+        """
+        Iterates over the values in hash order.
+
+        :return: An iterator over the values.
+        :rtype: Iterator[Any]
+        """
+        return (value for _, _, value in self._iter_leaves(self._root))
+
+    def set(self, key: Any, value: Any) -> PersistentMap:
+        """
+        Returns a map in which the key has the value, or this map itself if the key already has the very same value.
+
+        :param key: The key to set.
+        :type key: Any
+        :param value: The new value.
+        :type value: Any
+        :return: The updated map.
+        :rtype: PersistentMap
+        """
+        leaf: _Leaf = (hash(key) & ((1 << _HASH_BITS) - 1), key, value)
+        root, added = self._set(self._root, leaf, 0)
+        if root is self._root:
+            return self
+        return PersistentMap(root, self._size + added)
+
+    def remove(self, key: Any) -> PersistentMap:
+        """
+        Returns a map without the key. Returns this map itself if the key is not in the map.
+
+        :param key: The key to remove.
+        :type key: Any
+        :return: The updated map.
+        :rtype: PersistentMap
+        """
+        root: Any = self._remove(self._root, hash(key) & ((1 << _HASH_BITS) - 1), key, 0)
+        if root is self._root:
+            return self
+        if root is None:
+            return PersistentMap()
+        if not isinstance(root, _BitmapNode):
+            root = _BitmapNode(1 << (root[0] & _MASK), (root,))
+        return PersistentMap(root, self._size - 1)
+
+    def diff(self, other: PersistentMap) -> Iterator[tuple[Any, Any, Any]]:
+        """
+        Yields the differences from this map to the other as (key, old value, new value) tuples. An added or removed
+        key has `MISSING` as its old or new value. Values are compared by identity, and subtrees shared by both maps are
+        skipped without visiting them.
+
+        :param other: The map to compare with.
+        :type other: PersistentMap
+        :return: An iterator over the changed keys with their old and new values.
+        :rtype: Iterator[tuple[Any, Any, Any]]
+        """
+        return self._diff(self._root, other._root)
+
+    @classmethod
+    def _set(cls, node: Any, leaf: _Leaf, shift: int) -> tuple[Any, bool]:
+        """Returns the copy of node with the leaf inserted, and whether a new key was added."""
+        if isinstance(node, _CollisionNode):
+            for index, entry in enumerate(node.entries):
+                if entry[1] == leaf[1]:
+                    if entry[2] is leaf[2]:
+                        return node, False
+                    return _CollisionNode(node.entries[:index] + (leaf,) + node.entries[index + 1:]), False
+            return _CollisionNode(node.entries + (leaf,)), True
+
+        bit: int = 1 << ((leaf[0] >> shift) & _MASK)
+        index: int = (node.bitmap & (bit - 1)).bit_count()
+        if not node.bitmap & bit:
+            return _BitmapNode(node.bitmap | bit, node.entries[:index] + (leaf,) + node.entries[index:]), True
+
+        entry: Any = node.entries[index]
+        added: bool
+        if isinstance(entry, tuple):
+            if entry[1] == leaf[1]:
+                if entry[2] is leaf[2]:
+                    return node, False
+                child, added = leaf, False
+            else:
+                child, added = cls._merge(entry, leaf, shift + _BITS), True
+        else:
+            child, added = cls._set(entry, leaf, shift + _BITS)
+            if child is entry:
+                return node, False
+        return _BitmapNode(node.bitmap, node.entries[:index] + (child,) + node.entries[index + 1:]), added
+
+    @classmethod
+    def _build(cls, leaves: list[_Leaf], shift: int) -> Any:
+        """Returns a bitmap node holding the leaves of distinct keys, whose hashes are equal below the shift."""
+        if shift >= _HASH_BITS:
+            return _CollisionNode(tuple(leaves))
+
+        slots: dict[int, list[_Leaf]] = {}
+        for leaf in leaves:
+            slots.setdefault((leaf[0] >> shift) & _MASK, []).append(leaf)
+        bitmap: int = 0
+        entries: list[Any] = []
+        for slot in sorted(slots):
+            bitmap |= 1 << slot
+            slot_leaves: list[_Leaf] = slots[slot]
+            entries.append(slot_leaves[0] if len(slot_leaves) == 1 else cls._build(slot_leaves, shift + _BITS))
+        return _BitmapNode(bitmap, tuple(entries))
+
+    @classmethod
+    def _merge(cls, first: _Leaf, second: _Leaf, shift: int) -> Any:
+        """Returns a node holding two leaves of different keys, whose hashes are equal below the shift."""
+        if shift >= _HASH_BITS:
+            return _CollisionNode((first, second))
+
+        first_slot: int = (first[0] >> shift) & _MASK
+        second_slot: int = (second[0] >> shift) & _MASK
+        if first_slot == second_slot:
+            return _BitmapNode(1 << first_slot, (cls._merge(first, second, shift + _BITS),))
+        entries: tuple[_Leaf, _Leaf] = (first, second) if first_slot < second_slot else (second, first)
+        return _BitmapNode((1 << first_slot) | (1 << second_slot), entries)
+
+    @classmethod
+    def _remove(cls, node: Any, key_hash: int, key: Any, shift: int) -> Any:
+        """
+        Returns the copy of node without the key, node itself if the key is missing, None if the copy is empty, or the
+        single remaining leaf, which the parent inlines.
+        """
+        if isinstance(node, _CollisionNode):
+            entries: tuple[_Leaf, ...] = tuple(entry for entry in node.entries if entry[1] != key)
+            if len(entries) == len(node.entries):
+                return node
+            return entries[0] if len(entries) == 1 else _CollisionNode(entries)
+
+        bit: int = 1 << ((key_hash >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return node
+
+        index: int = (node.bitmap & (bit - 1)).bit_count()
+        entry: Any = node.entries[index]
+        if isinstance(entry, tuple):
+            if entry[1] != key:
+                return node
+            child: Any = None
+        else:
+            child = cls._remove(entry, key_hash, key, shift + _BITS)
+            if child is entry:
+                return node
+
+        if child is not None:
+            if len(node.entries) == 1 and isinstance(child, tuple):
+                return child
+            return _BitmapNode(node.bitmap, node.entries[:index] + (child,) + node.entries[index + 1:])
+
+        entries = node.entries[:index] + node.entries[index + 1:]
+        if not entries:
+            return None
+        if len(entries) == 1 and isinstance(entries[0], tuple):
+            return entries[0]
+        return _BitmapNode(node.bitmap & ~bit, entries)
+
+    @classmethod
+    def _iter_leaves(cls, entry: Any) -> Iterator[_Leaf]:
+        """Yields all leaves below entry, which is a leaf or a node."""
+        if isinstance(entry, tuple):
+            yield entry
+        else:
+            for child in entry.entries:
+                yield from cls._iter_leaves(child)
+
+    @classmethod
+    def _diff(cls, old: Any, new: Any) -> Iterator[tuple[Any, Any, Any]]:
+        """Yields the differences between two entries, recursing in parallel where both are bitmap nodes."""
+        if old is new:
+            return
+
+        if isinstance(old, _BitmapNode) and isinstance(new, _BitmapNode):
+            for slot in range(1 << _BITS):
+                bit: int = 1 << slot
+                old_entry: Any = (
+                    old.entries[(old.bitmap & (bit - 1)).bit_count()] if old.bitmap & bit else None
+                )
+                new_entry: Any = (
+                    new.entries[(new.bitmap & (bit - 1)).bit_count()] if new.bitmap & bit else None
+                )
+                if old_entry is None:
+                    if new_entry is not None:
+                        for _, key, value in cls._iter_leaves(new_entry):
+                            yield key, cls.MISSING, value
+                elif new_entry is None:
+                    for _, key, value in cls._iter_leaves(old_entry):
+                        yield key, value, cls.MISSING
+                else:
+                    yield from cls._diff(old_entry, new_entry)
+            return
+
+        old_items: dict[Any, Any] = {key: value for _, key, value in cls._iter_leaves(old)}
+        new_items: dict[Any, Any] = {key: value for _, key, value in cls._iter_leaves(new)}
+        for key, value in old_items.items():
+            new_value: Any = new_items.get(key, cls.MISSING)
+            if new_value is not value:
+                yield key, value, new_value
+        for key, value in new_items.items():
+            if key not in old_items:
+                yield key, cls.MISSING, value
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import Any, Callable, Iterator, Optional, TypeVar
+from contextlib import contextmanager
+from uuid import UUID
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+Sample = tuple[int, int, int, int, int]
+Method = TypeVar('Method', bound=Callable[..., Any])
+
+
+def profiled(method: Method) -> Method:
+    """
+    Decorates a node graph method, so that its calls are measured while the node graph has a profiler. Without a
+    profiler, the only overhead is a single attribute check.
+    """
+    name: str = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        profiler: Optional[Profiler] = self._profiler
+        if profiler is None:
+            return method(self, *args, **kwargs)
+        with profiler.measure('graph', name):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class Profiler:
+    """
+    Records call counts, wall and CPU times and memory deltas of node computations and node graph operations.
+
+    A profiler is opt-in: it is attached to a node graph through `NodeGraph.profiler`, and all instrumented code paths
+    only check for its presence otherwise. The node graph measures the mutation methods `add_node_item(s)`,
+    `remove_node_item`, `add_edge_item`, `remove_edge_item` and `validate_connection` under the category `graph`, and
+    every node computation of `evaluate`, `evaluate_async` and the schedulers under the category `node`.
+
+    Every measurement is kept as an event with its start, so the results can be exported both as a table aggregated per
+    name and as a Chrome trace event file, which trace viewers such as Perfetto or chrome://tracing show as a timeline
+    per thread or process. CPU times are measured per thread. Memory deltas are measured with `tracemalloc` if
+    `trace_memory` is set, which slows down all allocations while profiling, and only for computations in the calling
+    process.
+
+    Examples:
+        >>> node_graph.profiler = Profiler()  # doctest: +SKIP
+        >>> node_graph.evaluate()  # doctest: +SKIP
+        >>> print(node_graph.profiler.format_table())  # doctest: +SKIP
+        >>> node_graph.profiler.write_chrome_trace('evaluation.json')  # doctest: +SKIP
+    """
+
+    __slots__ = ('_trace_memory', '_events', '_lock')
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        """
+        Initializes a `Profiler` instance.
+
+        :param trace_memory: Whether to measure memory deltas. Starts `tracemalloc` if it is not running yet.
+        :type trace_memory: bool
+        """
+        self._trace_memory: bool = trace_memory
+        self._events: list[tuple[str, str, Optional[UUID], Sample, int]] = []
+        self._lock: threading.Lock = threading.Lock()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @property
+    def trace_memory(self) -> bool:
+        """
+        Returns whether memory deltas are measured.
+
+        :return: True if memory is traced, otherwise False.
+        :rtype: bool
+        """
+        return self._trace_memory
+
+    @property
+    def event_count(self) -> int:
+        """
+        Returns the number of recorded measurements.
+
+        :return: The number of events.
+        :rtype: int
+        """
+        return len(self._events)
+
+    @contextmanager
+    def measure(self, category: str, name: str, uuid: Optional[UUID] = None) -> Iterator[None]:
+        """
+        Measures the enclosed code on the calling thread.
+
+        :param category: The category of the measurement, e.g. `node` or `graph`.
+        :type category: str
+        :param name: The name of the measured operation or node.
+        :type name: str
+        :param uuid: The UUID of the measured node, distinguishing nodes with equal names.
+        :type uuid: Optional[UUID]
+        """
+        memory: int = tracemalloc.get_traced_memory()[0] if self._trace_memory else 0
+        start: int = time.perf_counter_ns()
+        cpu_start: int = time.thread_time_ns()
+        try:
+            yield
+        finally:
+            sample: Sample = (
+                start, time.perf_counter_ns() - start, time.thread_time_ns() - cpu_start, os.getpid(),
+                threading.get_ident()
+            )
+            memory = tracemalloc.get_traced_memory()[0] - memory if self._trace_memory else 0
+            self.add_sample(category, name, uuid, sample, memory)
+
+    @staticmethod
+    def measure_call(function: Callable[..., Any], *args: Any) -> tuple[Any, Sample]:
+        """
+        Calls a function and measures it. Being a static method, it can be sent to worker threads and processes, and
+        the returned sample is recorded with `add_sample` by the caller.
+
+        :param function: The function to call.
+        :type function: Callable[..., Any]
+        :param args: The arguments of the function.
+        :type args: Any
+        :return: The result of the function and the sample of start, wall time, CPU time, process and thread id.
+        :rtype: tuple[Any, Sample]
+        """
+        start: int = time.perf_counter_ns()
+        cpu_start: int = time.thread_time_ns()
+        result: Any = function(*args)
+        return result, (
+            start, time.perf_counter_ns() - start, time.thread_time_ns() - cpu_start, os.getpid(), threading.get_ident()
+        )
+
+    def add_sample(
+        self, category: str, name: str, uuid: Optional[UUID], sample: Sample, memory: int = 0
+    ) -> None:
+        """
+        Records a measurement. Thread-safe.
+
+        :param category: The category of the measurement.
+        :type category: str
+        :param name: The name of the measured operation or node.
+        :type name: str
+        :param uuid: The UUID of the measured node, if any.
+        :type uuid: Optional[UUID]
+        :param sample: The start in nanoseconds, the wall and CPU time in nanoseconds, the process and the thread id.
+        :type sample: Sample
+        :param memory: The memory delta in bytes.
+        :type memory: int
+        """
+        with self._lock:
+            self._events.append((category, name, uuid, sample, memory))
+
+    def clear(self) -> None:
+        """Removes all recorded measurements."""
+        with self._lock:
+            self._events.clear()
+
+    def get_table(self) -> list[dict[str, Any]]:
+        """
+        Aggregates the measurements per category, name and UUID, sorted by descending total wall time.
+
+        :return: One row per measured operation or node with the call count and the total wall time, CPU time and
+                 memory delta. Times are given in seconds, memory in bytes.
+        :rtype: list[dict[str, Any]]
+        """
+        rows: dict[tuple[str, str, Optional[UUID]], dict[str, Any]] = {}
+        with self._lock:
+            events: list[tuple[str, str, Optional[UUID], Sample, int]] = list(self._events)
+        for category, name, uuid, (_, wall_time, cpu_time, _, _), memory in events:
+            row: Optional[dict[str, Any]] = rows.get((category, name, uuid))
+            if row is None:
+                row = rows[category, name, uuid] = {
+                    'category': category, 'name': name, 'uuid': str(uuid) if uuid else None, 'count': 0,
+                    'wall_time': 0.0, 'cpu_time': 0.0, 'memory_delta': 0
+                }
+            row['count'] += 1
+            row['wall_time'] += wall_time / 1e9
+            row['cpu_time'] += cpu_time / 1e9
+            row['memory_delta'] += memory
+        return sorted(rows.values(), key=lambda row: row['wall_time'], reverse=True)
+
+    def format_table(self) -> str:
+        """
+        Formats the aggregated measurements as a plain text table.
+
+        :return: The table with a header line.
+        :rtype: str
+        """
+        lines: list[str] = [
+            f"{'category':<10} {'name':<32} {'count':>8} {'wall [ms]':>12} {'cpu [ms]':>12} {'mean [us]':>12} "
+            f"{'memory [B]':>12}"
+        ]
+        for row in self.get_table():
+            lines.append(
+                f"{row['category']:<10} {row['name'][:32]:<32} {row['count']:>8} {row['wall_time'] * 1e3:>12.3f} "
+                f"{row['cpu_time'] * 1e3:>12.3f} {row['wall_time'] / row['count'] * 1e6:>12.1f} "
+                f"{row['memory_delta']:>12}"
+            )
+        return '\n'.join(lines)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Converts the measurements to the Chrome trace event format, one complete event per measurement.
+
+        :return: A JSON serializable trace with timestamps and durations in microseconds.
+        :rtype: dict[str, Any]
+        """
+        with self._lock:
+            events: list[tuple[str, str, Optional[UUID], Sample, int]] = list(self._events)
+        return {
+            'traceEvents': [
+                {
+                    'name': name, 'cat': category, 'ph': 'X', 'ts': start / 1e3, 'dur': wall_time / 1e3, 'pid': pid,
+                    'tid': tid, 'args': {'uuid': str(uuid) if uuid else None, 'cpu_time_us': cpu_time / 1e3,
+                                         'memory_delta': memory}
+                }
+                for category, name, uuid, (start, wall_time, cpu_time, pid, tid), memory in events
+            ],
+            'displayTimeUnit': 'ms',
+        }
+
+    def write_chrome_trace(self, path: str | os.PathLike) -> None:
+        """
+        Writes the measurements as a Chrome trace event JSON file.
+
+        :param path: The path of the file to create or overwrite.
+        :type path: str | os.PathLike
+        """
+        with open(path, 'w') as file:
+            json.dump(self.to_chrome_trace(), file)
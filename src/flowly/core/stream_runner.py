@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+from collections import deque
+import queue
+import threading
+
+from flowly.core.enumerations import AttributeFlags, StreamKind
+if TYPE_CHECKING:
+    from flowly.core.edge import Edge
+    from flowly.core.node import Node
+    from flowly.core.node_graph import NodeGraph
+
+_END: object = object()
+
+
+class _Stopped(Exception):
+    """Raised inside a node thread to unwind it once the stream was stopped."""
+
+
+class StreamRunner:
+    """
+    Evaluates a node graph as a streaming pipeline, in which items flow through the nodes one after another.
+
+    Every node runs in its own thread and every edge gets a bounded queue, so a fast producer blocks as soon as a slow
+    consumer falls behind (backpressure), and no stream is ever stored in `Attribute.data`. Items are sent in chunks of
+    up to `chunk_size` items, which reduces the synchronization overhead for small items at the cost of latency.
+
+    Nodes without connected inputs are sources and yield their items from `Node.generate`. All other nodes receive
+    one item from each incoming edge at a time, while unconnected inputs keep their current data, and apply their
+    compute function according to their `stream_kind`:
+        - `StreamKind.MAP` computes one output item per input item.
+        - `StreamKind.FILTER` computes one output item per input item and drops it if the result is empty.
+        - `StreamKind.WINDOW` computes one output item per `window_size` input items, passing the streamed inputs as
+          lists. A final incomplete window is computed as well.
+
+    Items of different incoming edges are joined by position. This requires that all incoming streams of a node passed
+    the same filter and window nodes, otherwise a dropped or aggregated item on one branch would pair later items with
+    the wrong partners, or stall the bounded queue of the other branch. Such graphs are rejected before streaming.
+
+    The stream ends once all sources are exhausted. The items of sink nodes, i.e. nodes without connected outputs, are
+    yielded to the caller. Closing the returned generator stops all node threads.
+
+    Examples:
+        >>> for node_item, outputs in StreamRunner(chunk_size=1).run(node_graph):  # doctest: +SKIP
+        ...     print(node_item.name, outputs)
+    """
+
+    __slots__ = ('_chunk_size', '_max_queue_size', '_poll_interval')
+
+    def __init__(self, chunk_size: int = 32, max_queue_size: int = 8, poll_interval: float = 0.1) -> None:
+        """
+        Initializes a `StreamRunner` instance.
+
+        :param chunk_size: The maximum number of items sent along an edge at once. Use 1 for the lowest latency.
+        :type chunk_size: int
+        :param max_queue_size: The maximum number of chunks waiting on an edge before its producer blocks.
+        :type max_queue_size: int
+        :param poll_interval: The interval in seconds in which blocked node threads check whether to stop.
+        :type poll_interval: float
+        :raises ValueError: If the chunk size or queue size is smaller than one.
+        """
+        if chunk_size < 1 or max_queue_size < 1:
+            raise ValueError("Chunk size and queue size must be at least one.")
+
+        self._chunk_size: int = chunk_size
+        self._max_queue_size: int = max_queue_size
+        self._poll_interval: float = poll_interval
+
+    @property
+    def chunk_size(self) -> int:
+        """
+        Gets the maximum number of items sent along an edge at once.
+
+        :return: The chunk size.
+        :rtype: int
+        """
+        return self._chunk_size
+
+    @property
+    def max_queue_size(self) -> int:
+        """
+        Gets the maximum number of chunks waiting on an edge.
+
+        :return: The queue size.
+        :rtype: int
+        """
+        return self._max_queue_size
+
+    def run(self, node_graph: NodeGraph) -> Iterator[tuple[Node, dict[str, Any]]]:
+        """
+        Streams the node graph, yielding the output items of the sink nodes as they arrive.
+
+        :param node_graph: The node graph to stream.
+        :type node_graph: NodeGraph
+        :return: An iterator over pairs of a sink node and one of its output items.
+        :rtype: Iterator[tuple[Node, dict[str, Any]]]
+        :raises ValueError: If a node joins streams that passed different filter or window nodes.
+        :raises Exception: Re-raises the first exception of a node, after stopping all node threads.
+        """
+        self._validate(node_graph)
+        return self._stream(node_graph)
+
+    @staticmethod
+    def _validate(node_graph: NodeGraph) -> None:
+        """Raises a ValueError if the incoming streams of a node cannot be joined by position."""
+        reducers: dict[Node, frozenset[Node]] = {}
+        for node_item in node_graph.get_sorted_node_items():
+            branches: set[frozenset[Node]] = set()
+            for attr_item in node_item.attributes:
+                if attr_item.flag is not AttributeFlags.OUTPUT:
+                    for edge_item in attr_item.edges:
+                        upstream_node_item: Node = edge_item.source.parent
+                        branch: frozenset[Node] = reducers[upstream_node_item]
+                        if upstream_node_item.stream_kind is not StreamKind.MAP:
+                            branch |= {upstream_node_item}
+                        branches.add(branch)
+            if len(branches) > 1:
+                raise ValueError(
+                    f"Node {node_item.name} joins streams that passed different filter or window nodes, "
+                    f"so their items cannot be paired by position."
+                )
+            reducers[node_item] = branches.pop() if branches else frozenset()
+
+    def _stream(self, node_graph: NodeGraph) -> Iterator[tuple[Node, dict[str, Any]]]:
+        """Runs the node threads and yields the output items of the sink nodes, see `run`."""
+        edge_queues: dict[Edge, queue.Queue] = {
+            edge_item: queue.Queue(self._max_queue_size) for edge_item in node_graph.edge_items
+        }
+        results: queue.Queue = queue.Queue(self._max_queue_size)
+        stop: threading.Event = threading.Event()
+        threads: list[threading.Thread] = [
+            threading.Thread(
+                target=self._run_node_item, args=(node_item, edge_queues, results, stop),
+                name=f"flowly-stream-{node_item.name}", daemon=True
+            )
+            for node_item in node_graph.get_sorted_node_items()
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            running_count: int = len(threads)
+            while running_count:
+                message: Any = results.get()
+                if message is _END:
+                    running_count -= 1
+                elif isinstance(message, BaseException):
+                    raise message
+                else:
+                    yield from message
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def _run_node_item(
+        self, node_item: Node, edge_queues: dict[Edge, queue.Queue], results: queue.Queue, stop: threading.Event
+    ) -> None:
+        """Processes the items of node_item in its own thread and reports its end or failure to the results queue."""
+        try:
+            constants: dict[str, Any] = {}
+            input_queues: list[tuple[str, list[queue.Queue]]] = []
+            output_queues: list[tuple[str, Any, list[queue.Queue]]] = []
+            for attr_item in node_item.attributes:
+                if attr_item.flag is AttributeFlags.OUTPUT:
+                    if attr_item.has_edge():
+                        output_queues.append(
+                            (attr_item.name, attr_item.data, [edge_queues[edge] for edge in attr_item.edges])
+                        )
+                elif attr_item.has_edge():
+                    input_queues.append((attr_item.name, [edge_queues[edge] for edge in attr_item.edges]))
+                else:
+                    constants[attr_item.name] = attr_item.data
+
+            if input_queues:
+                items: Iterable[dict[str, Any]] = self._process(
+                    node_item, self._read_inputs(constants, input_queues, stop), [name for name, _ in input_queues]
+                )
+            else:
+                items: Iterable[dict[str, Any]] = node_item.generate(constants)
+
+            chunk: list[dict[str, Any]] = []
+            for outputs in items:
+                chunk.append(outputs)
+                if len(chunk) >= self._chunk_size:
+                    self._send(node_item, chunk, output_queues, results, stop)
+                    chunk = []
+            if chunk:
+                self._send(node_item, chunk, output_queues, results, stop)
+
+            for _, _, queues in output_queues:
+                for output_queue in queues:
+                    self._put(output_queue, _END, stop)
+            self._put(results, _END, stop)
+        except _Stopped:
+            pass
+        except BaseException as e:
+            try:
+                self._put(results, e, stop)
+            except _Stopped:
+                pass
+
+    def _read_inputs(
+        self, constants: dict[str, Any], input_queues: list[tuple[str, list[queue.Queue]]], stop: threading.Event
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yields the inputs of a node one item at a time, combining the next item of every incoming edge with the
+        constant inputs. An input fed by several edges receives a list. Ends as soon as any incoming edge ends.
+        """
+        buffers: dict[queue.Queue, deque] = {
+            input_queue: deque() for _, queues in input_queues for input_queue in queues
+        }
+        while True:
+            inputs: dict[str, Any] = dict(constants)
+            for name, queues in input_queues:
+                values: list[Any] = []
+                for input_queue in queues:
+                    buffer: deque = buffers[input_queue]
+                    if not buffer:
+                        chunk: Any = self._get(input_queue, stop)
+                        if chunk is _END:
+                            self._drain(buffers, input_queue, stop)
+                            return
+                        buffer.extend(chunk)
+                    values.append(buffer.popleft())
+                inputs[name] = values[0] if len(values) == 1 else values
+            yield inputs
+
+    def _drain(self, buffers: dict[queue.Queue, deque], ended_queue: queue.Queue, stop: threading.Event) -> None:
+        """Discards the remaining items of all incoming edges but the ended one, so that their producers can finish."""
+        for input_queue in buffers:
+            if input_queue is not ended_queue:
+                while self._get(input_queue, stop) is not _END:
+                    pass
+
+    @staticmethod
+    def _process(
+        node_item: Node, rows: Iterator[dict[str, Any]], streamed_names: list[str]
+    ) -> Iterator[dict[str, Any]]:
+        """Applies the compute function of node_item to the input items according to its stream kind."""
+        if node_item.stream_kind is StreamKind.WINDOW:
+            window: list[dict[str, Any]] = []
+            for inputs in rows:
+                window.append(inputs)
+                if len(window) >= node_item.window_size:
+                    yield node_item.compute(StreamRunner._merge_window(window, streamed_names))
+                    window = []
+            if window:
+                yield node_item.compute(StreamRunner._merge_window(window, streamed_names))
+        elif node_item.stream_kind is StreamKind.FILTER:
+            for inputs in rows:
+                outputs: dict[str, Any] = node_item.compute(inputs)
+                if outputs:
+                    yield outputs
+        else:
+            for inputs in rows:
+                yield node_item.compute(inputs)
+
+    @staticmethod
+    def _merge_window(window: list[dict[str, Any]], streamed_names: list[str]) -> dict[str, Any]:
+        """Merges the inputs of a window, turning every streamed input into the list of its values."""
+        inputs: dict[str, Any] = dict(window[0])
+        for name in streamed_names:
+            inputs[name] = [item[name] for item in window]
+        return inputs
+
+    def _send(
+        self,
+        node_item: Node,
+        chunk: list[dict[str, Any]],
+        output_queues: list[tuple[str, Any, list[queue.Queue]]],
+        results: queue.Queue,
+        stop: threading.Event
+    ) -> None:
+        """Sends a chunk of output items along all outgoing edges, or to the results queue for sink nodes."""
+        if not output_queues:
+            self._put(results, [(node_item, outputs) for outputs in chunk], stop)
+            return
+
+        for name, default, queues in output_queues:
+            values: list[Any] = [outputs.get(name, default) for outputs in chunk]
+            for output_queue in queues:
+                self._put(output_queue, values, stop)
+
+    def _put(self, target_queue: queue.Queue, item: Any, stop: threading.Event) -> None:
+        """Puts an item into a bounded queue, blocking until there is space or the stream is stopped."""
+        while not stop.is_set():
+            try:
+                target_queue.put(item, timeout=self._poll_interval)
+                return
+            except queue.Full:
+                pass
+        raise _Stopped()
+
+    def _get(self, source_queue: queue.Queue, stop: threading.Event) -> Any:
+        """Gets an item from a queue, blocking until one is available or the stream is stopped."""
+        while not stop.is_set():
+            try:
+                return source_queue.get(timeout=self._poll_interval)
+            except queue.Empty:
+                pass
+        raise _Stopped()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Hashable, Iterable, Optional
+
+import networkx as nx
+if TYPE_CHECKING:
+    from flowly.core.array_di_graph import ArrayDiGraph
+
+
+class TopologicalOrder:
+    """
+    Maintains a topological order of a directed acyclic graph under edge insertions.
+
+    The order is kept incrementally with the dynamic topological sort algorithm of Pearce and Kelly. Every vertex is
+    assigned an integer index, such that each edge points from a lower to a higher index. A cycle check for a new edge
+    `source -> target` only has to search the vertices whose indices lie between the indices of `target` and `source`,
+    and when the edge already respects the order no search is needed at all. Inserting an edge that violates the order
+    only reorders this affected region.
+
+    Removing edges or vertices never invalidates a topological order, so removals only have to forget the vertices.
+
+    Examples:
+        >>> graph = nx.DiGraph()
+        >>> order = TopologicalOrder(graph)
+        >>> graph.add_nodes_from(['a', 'b'])
+        >>> order.add_vertices(['a', 'b'])
+        >>> order.add_edge('b', 'a')
+        >>> graph.add_edge('b', 'a')
+        >>> order.creates_cycle('a', 'b')
+        True
+    """
+
+    __slots__ = ('_graph', '_order', '_next_index')
+
+    def __init__(self, graph: nx.DiGraph | ArrayDiGraph) -> None:
+        """
+        Initializes a `TopologicalOrder` instance for the given graph.
+
+        Vertices already contained in the graph are ordered once with a full topological sort.
+
+        :param graph: The graph whose vertices are ordered. It is read, but never modified.
+        :type graph: nx.DiGraph | ArrayDiGraph
+        :raises ValueError: If the graph contains a cycle.
+        """
+        self._graph: nx.DiGraph | ArrayDiGraph = graph
+        self._order: dict[Hashable, int] = {}
+        self._next_index: int = 0
+        self._sort_existing_vertices()
+
+    def _sort_existing_vertices(self) -> None:
+        """Orders all vertices of the graph with Kahn's algorithm, using only successor and predecessor queries."""
+        in_degrees: dict[Hashable, int] = {
+            vertex: sum(1 for _ in self._graph.predecessors(vertex)) for vertex in self._graph
+        }
+        ready: list[Hashable] = [vertex for vertex, in_degree in in_degrees.items() if in_degree == 0]
+        while ready:
+            vertex: Hashable = ready.pop()
+            self.add_vertices((vertex,))
+            for successor in self._graph.successors(vertex):
+                in_degrees[successor] -= 1
+                if in_degrees[successor] == 0:
+                    ready.append(successor)
+
+        if len(self._order) != len(in_degrees):
+            raise ValueError("Cyclic dependency found.")
+
+    def __contains__(self, vertex: Hashable) -> bool:
+        """
+        Checks if the vertex is part of the order.
+
+        :param vertex: The vertex to check.
+        :type vertex: Hashable
+        :return: True if the vertex has an index, otherwise False.
+        :rtype: bool
+        """
+        return vertex in self._order
+
+    def index_of(self, vertex: Hashable) -> int:
+        """
+        Returns the current index of the vertex. Indices are only meaningful relative to each other.
+
+        :param vertex: The vertex to look up.
+        :type vertex: Hashable
+        :return: The position of the vertex in the topological order.
+        :rtype: int
+        """
+        return self._order[vertex]
+
+    def add_vertices(self, vertices: Iterable[Hashable]) -> None:
+        """
+        Appends new vertices to the end of the order, preserving the iteration order of `vertices`.
+
+        :param vertices: The vertices to add.
+        :type vertices: Iterable[Hashable]
+        """
+        for vertex in vertices:
+            if vertex not in self._order:
+                self._order[vertex] = self._next_index
+                self._next_index += 1
+
+    def remove_vertices(self, vertices: Iterable[Hashable]) -> None:
+        """
+        Removes vertices from the order.
+
+        :param vertices: The vertices to remove.
+        :type vertices: Iterable[Hashable]
+        """
+        for vertex in vertices:
+            self._order.pop(vertex, None)
+
+    def creates_cycle(self, source: Hashable, target: Hashable) -> bool:
+        """
+        Checks if inserting the edge `source -> target` would create a cycle.
+
+        :param source: The source vertex of the new edge.
+        :type source: Hashable
+        :param target: The target vertex of the new edge.
+        :type target: Hashable
+        :return: True if `target` already reaches `source`, otherwise False.
+        :rtype: bool
+        """
+        if source == target:
+            return True
+        if self._order[source] < self._order[target]:
+            return False
+        return self._search_forward(target, source) is None
+
+    def add_edge(self, source: Hashable, target: Hashable) -> None:
+        """
+        Updates the order for the new edge `source -> target`. Must be called before the edge is added to the graph.
+
+        :param source: The source vertex of the new edge.
+        :type source: Hashable
+        :param target: The target vertex of the new edge.
+        :type target: Hashable
+        :raises ValueError: If the edge would create a cycle.
+        """
+        if source == target:
+            raise ValueError("Cyclic dependency found.")
+
+        lower_bound: int = self._order[target]
+        if self._order[source] < lower_bound:
+            return
+
+        forward: Optional[list[Hashable]] = self._search_forward(target, source)
+        if forward is None:
+            raise ValueError("Cyclic dependency found.")
+        backward: list[Hashable] = self._search_backward(source, lower_bound)
+        self._reorder(backward, forward)
+
+    def _search_forward(self, start: Hashable, stop: Hashable) -> Optional[list[Hashable]]:
+        """Collects the vertices reachable from start up to the index of stop, or returns None if stop is reached."""
+        upper_bound: int = self._order[stop]
+        visited: set[Hashable] = {start}
+        stack: list[Hashable] = [start]
+        while stack:
+            for successor in self._graph.successors(stack.pop()):
+                if successor == stop:
+                    return None
+                if successor not in visited and self._order[successor] < upper_bound:
+                    visited.add(successor)
+                    stack.append(successor)
+        return list(visited)
+
+    def _search_backward(self, start: Hashable, lower_bound: int) -> list[Hashable]:
+        """Collects the vertices reaching start whose indices are greater than lower_bound."""
+        visited: set[Hashable] = {start}
+        stack: list[Hashable] = [start]
+        while stack:
+            for predecessor in self._graph.predecessors(stack.pop()):
+                if predecessor not in visited and self._order[predecessor] > lower_bound:
+                    visited.add(predecessor)
+                    stack.append(predecessor)
+        return list(visited)
+
+    def _reorder(self, backward: list[Hashable], forward: list[Hashable]) -> None:
+        """Moves all backward vertices in front of all forward vertices, reusing the indices of the affected region."""
+        backward.sort(key=self._order.__getitem__)
+        forward.sort(key=self._order.__getitem__)
+        vertices: list[Hashable] = backward + forward
+        indices: list[int] = sorted(self._order[vertex] for vertex in vertices)
+        for vertex, index in zip(vertices, indices):
+            self._order[vertex] = index
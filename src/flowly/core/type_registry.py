@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ************************************************************************
+# * Copyright (c) 2024 Ronny Scharf-W. <ronny.scharf08@gmail.com>        *
+# *                                                                      *
+# * This program is free software; you can redistribute it and/or modify *
+# * it under the terms of the GNU Lesser General Public License (LGPL)   *
+# * as published by the Free Software Foundation; either version 2 of    *
+# * the License, or (at your option) any later version.                  *
+# * for detail see the LICENSE text file.                                *
+# *                                                                      *
+# * This program is distributed in the hope that it will be useful,      *
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of       *
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the         *
+# * GNU Library General Public License for more details.                 *
+# *                                                                      *
+# * You should have received a copy of the GNU Library General Public    *
+# * License along with this program; if not, write to the Free Software  *
+# * Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307  *
+# * USA                                                                  *
+# *                                                                      *
+# ************************************************************************
+
+
+from __future__ import annotations
+from typing import Any, Optional
+import builtins
+import importlib
+
+
+class TypeRegistry:
+    """
+    Resolves serialized class and data type names to Python types, caching every resolution.
+
+    Deserialization looks up the same few names for thousands of entities. The registry imports each module and
+    resolves each name only once, and it never evaluates strings as code. Data types are written by name: builtins and
+    `Any` by their plain name, all other types by their qualified name `module.QualName`. Types can also be registered
+    explicitly under a custom name.
+
+    Examples:
+        >>> registry = TypeRegistry()
+        >>> registry.resolve_data_type('int')
+        <class 'int'>
+        >>> registry.get_data_type_name(Any)
+        'Any'
+        >>> registry.resolve_class('flowly.core.attribute.Attribute').__name__
+        'Attribute'
+    """
+
+    __slots__ = ('_classes', '_data_types', '_data_type_names')
+
+    def __init__(self) -> None:
+        """
+        Initializes a `TypeRegistry` instance with the builtin types and `Any` pre-registered.
+        """
+        self._classes: dict[str, type] = {}
+        self._data_types: dict[str, Any] = {'Any': Any, 'None': type(None), 'NoneType': type(None)}
+        self._data_type_names: dict[Any, str] = {Any: 'Any', type(None): 'None'}
+
+        for name, value in vars(builtins).items():
+            if isinstance(value, type) and not issubclass(value, BaseException):
+                self._data_types[name] = value
+                self._data_type_names.setdefault(value, name)
+
+    def register_data_type(self, data_type: Any, name: Optional[str] = None) -> None:
+        """
+        Registers a data type under a name, which is used for serialization from then on.
+
+        :param data_type: The data type to register.
+        :type data_type: Any
+        :param name: The serialized name. Defaults to the qualified name of the type.
+        :type name: Optional[str]
+        """
+        name = name or f"{data_type.__module__}.{data_type.__qualname__}"
+        self._data_types[name] = data_type
+        self._data_type_names[data_type] = name
+
+    def resolve_class(self, class_name: str) -> type:
+        """
+        Resolves a qualified class name of the form `module.QualName`.
+
+        :param class_name: The qualified class name.
+        :type class_name: str
+        :return: The resolved class.
+        :rtype: type
+        :raises ValueError: If the module or class cannot be found.
+        """
+        resolved_class: Optional[type] = self._classes.get(class_name)
+        if resolved_class is None:
+            resolved_class = self._import(class_name)
+            self._classes[class_name] = resolved_class
+        return resolved_class
+
+    def resolve_data_type(self, data_type_name: Optional[str]) -> Any:
+        """
+        Resolves a serialized data type name. A missing name resolves to `Any`.
+
+        :param data_type_name: The plain or qualified name of the data type.
+        :type data_type_name: Optional[str]
+        :return: The resolved data type.
+        :rtype: Any
+        :raises ValueError: If the data type cannot be found.
+        """
+        if data_type_name is None:
+            return Any
+
+        data_type: Any = self._data_types.get(data_type_name)
+        if data_type is None:
+            if '.' not in data_type_name:
+                raise ValueError(f"Invalid data type: {data_type_name}")
+            data_type = self._import(data_type_name)
+            self._data_types[data_type_name] = data_type
+        return data_type
+
+    def get_data_type_name(self, data_type: Any) -> Optional[str]:
+        """
+        Returns the name under which a data type is serialized.
+
+        :param data_type: The data type.
+        :type data_type: Any
+        :return: The registered name, or the qualified name for unregistered types. None if no type is given.
+        :rtype: Optional[str]
+        """
+        if data_type is None:
+            return None
+
+        name: Optional[str] = self._data_type_names.get(data_type)
+        if name is None:
+            name = f"{data_type.__module__}.{data_type.__qualname__}"
+            self._data_type_names[data_type] = name
+        return name
+
+    @staticmethod
+    def _import(qualified_name: str) -> Any:
+        """Imports the module part of a qualified name and resolves the remaining attribute path in it."""
+        parts: list[str] = qualified_name.split('.')
+        for split_index in range(len(parts) - 1, 0, -1):
+            module_name: str = '.'.join(parts[:split_index])
+            try:
+                resolved: Any = importlib.import_module(module_name)
+            except ImportError:
+                continue
+            try:
+                for part in parts[split_index:]:
+                    resolved = getattr(resolved, part)
+            except AttributeError as e:
+                raise ValueError(f"Could not import class {qualified_name}: {e}")
+            return resolved
+        raise ValueError(f"Could not import class {qualified_name}: No module found.")
+
+
+# The registry shared by all entities for (de-)serialization
+TYPE_REGISTRY: TypeRegistry = TypeRegistry()
@@ -0,0 +1,27 @@
+from typing import Any, Optional
+from uuid import UUID
+
+from flowly.core.attribute import Attribute
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.node import Node
+from flowly.core.node_graph import NodeGraph
+
+
+class Add(Node):
+    def __init__(self, uuid: Optional[UUID | int] = None, name: str = "Add") -> None:
+        super().__init__(uuid=uuid, name=name)
+        for attribute_name, flag in (('a', AttributeFlags.INPUT), ('b', AttributeFlags.INPUT),
+                                     ('out', AttributeFlags.OUTPUT)):
+            self.attributes.append(Attribute(name=attribute_name, data=0, data_type=int, flag=flag, parent=self))
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return {'out': inputs['a'] + inputs['b']}
+
+
+def create_chain(length: int) -> tuple[NodeGraph, list[Add]]:
+    node_graph: NodeGraph = NodeGraph()
+    node_items: list[Add] = [Add(name=str(index)) for index in range(length)]
+    node_graph.add_node_items(node_items)
+    for upstream_node_item, downstream_node_item in zip(node_items, node_items[1:]):
+        node_graph.connect_attribute_items(upstream_node_item.attributes[2], downstream_node_item.attributes[0])
+    return node_graph, node_items
@@ -0,0 +1,66 @@
+import random
+
+import networkx as nx
+import pytest
+
+from flowly.core.array_di_graph import ArrayDiGraph
+from flowly.core.enumerations import GraphStorage
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+def test_matches_networkx_after_random_edits() -> None:
+    random_generator: random.Random = random.Random(7)
+    graph: ArrayDiGraph = ArrayDiGraph()
+    reference: nx.DiGraph = nx.DiGraph()
+    for _ in range(2000):
+        source, target = random_generator.randrange(30), random_generator.randrange(30)
+        operation: float = random_generator.random()
+        if operation < 0.6:
+            graph.add_edge(source, target)
+            reference.add_edge(source, target)
+        elif operation < 0.9 and reference.has_edge(source, target):
+            graph.remove_edge(source, target)
+            reference.remove_edge(source, target)
+        elif operation >= 0.9 and source in reference:
+            graph.remove_node(source)
+            reference.remove_node(source)
+
+    assert graph.number_of_edges() == reference.number_of_edges()
+    assert set(graph.edges) == set(reference.edges)
+    for vertex in reference:
+        assert list(graph.successors(vertex)) == list(reference.successors(vertex))
+        assert list(graph.predecessors(vertex)) == list(reference.predecessors(vertex))
+
+
+def test_duplicate_and_missing_edges() -> None:
+    graph: ArrayDiGraph = ArrayDiGraph([('a', 'b'), ('a', 'b')])
+
+    assert graph.number_of_edges() == 1 and graph.has_edge('a', 'b') and not graph.has_edge('b', 'a')
+    with pytest.raises(nx.NetworkXError):
+        graph.remove_edge('b', 'a')
+
+
+def test_array_storage_keeps_the_connection_order_of_inputs() -> None:
+    node_graph: NodeGraph = NodeGraph(GraphStorage.ARRAY)
+    node_items: list[Add] = [Add(name=str(index)) for index in range(3)]
+    node_graph.add_node_items(node_items)
+    node_graph.connect_attribute_items(node_items[2].attributes[2], node_items[0].attributes[0])
+    node_graph.connect_attribute_items(node_items[1].attributes[2], node_items[0].attributes[0])
+    node_items[1].attributes[2].data = 1
+    node_items[2].attributes[2].data = 2
+
+    assert node_graph.get_input_data(node_items[0])['a'] == [2, 1]
+
+
+def test_array_storage_evaluates_like_networkx() -> None:
+    node_graph, node_items = create_chain(4)
+    array_graph: NodeGraph = NodeGraph.from_json(node_graph.to_json(), GraphStorage.ARRAY)
+    node_items[0].attributes[1].data = 2
+    array_graph.node_items[0].attributes[1].data = 2
+
+    node_graph.evaluate()
+    array_graph.evaluate()
+
+    assert array_graph.node_items[3].attributes[2].data == node_items[3].attributes[2].data == 2
@@ -0,0 +1,84 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from flowly.core.async_scheduler import AsyncScheduler
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+class AsyncAdd(Add):
+    barrier: asyncio.Barrier | None = None
+
+    async def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        if AsyncAdd.barrier is not None:
+            await asyncio.wait_for(AsyncAdd.barrier.wait(), timeout=5)
+        return {'out': inputs['a'] + inputs['b']}
+
+
+class FailingAdd(Add):
+    async def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        raise RuntimeError("compute failed")
+
+
+def create_fork(source: Add, left: Add, right: Add) -> NodeGraph:
+    node_graph: NodeGraph = NodeGraph()
+    node_graph.add_node_items([source, left, right])
+    node_graph.connect_attribute_items(source.attributes[2], left.attributes[0])
+    node_graph.connect_attribute_items(source.attributes[2], right.attributes[0])
+    return node_graph
+
+
+def test_coroutine_and_regular_compute_functions_are_mixed() -> None:
+    node_graph, node_items = create_chain(2)
+    async_node_item: AsyncAdd = AsyncAdd(name='async')
+    node_graph.add_node_item(async_node_item)
+    node_graph.connect_attribute_items(node_items[1].attributes[2], async_node_item.attributes[0])
+    node_items[0].attributes[0].data = 2
+    async_node_item.attributes[1].data = 1
+
+    asyncio.run(node_graph.evaluate_async())
+
+    assert async_node_item.attributes[2].data == 3 and not node_graph.dirty_node_items
+
+
+def test_independent_coroutines_are_awaited_concurrently() -> None:
+    source, left, right = Add(name='source'), AsyncAdd(name='left'), AsyncAdd(name='right')
+    node_graph: NodeGraph = create_fork(source, left, right)
+
+    async def evaluate() -> None:
+        AsyncAdd.barrier = asyncio.Barrier(2)
+        try:
+            await node_graph.evaluate_async(AsyncScheduler(max_concurrency=2))
+        finally:
+            AsyncAdd.barrier = None
+
+    asyncio.run(evaluate())
+
+    assert not node_graph.dirty_node_items
+
+
+def test_failure_cancels_only_the_downstream_nodes() -> None:
+    source, failing, right = Add(name='source'), FailingAdd(name='failing'), Add(name='right')
+    node_graph: NodeGraph = create_fork(source, failing, right)
+    sink: Add = Add(name='sink')
+    node_graph.add_node_item(sink)
+    node_graph.connect_attribute_items(failing.attributes[2], sink.attributes[0])
+    right.attributes[1].data = 4
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(node_graph.evaluate_async())
+
+    assert node_graph.dirty_node_items == {failing, sink}
+    assert right.attributes[2].data == 4
+
+
+def test_targets_restrict_the_evaluation() -> None:
+    source, left, right = Add(name='source'), Add(name='left'), Add(name='right')
+    node_graph: NodeGraph = create_fork(source, left, right)
+
+    asyncio.run(node_graph.evaluate_async(targets=[left.attributes[2]]))
+
+    assert node_graph.dirty_node_items == {right}
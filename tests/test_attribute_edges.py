@@ -0,0 +1,47 @@
+import pytest
+
+from flowly.core.attribute import Attribute
+from flowly.core.edge import Edge
+
+
+def test_edges_keep_insertion_order() -> None:
+    attribute: Attribute = Attribute()
+    edges: list[Edge] = [Edge() for _ in range(5)]
+
+    attribute.connect_edges(edges[:3])
+    attribute.connect_edge(edges[3])
+    attribute.disconnect_edge(edges[1])
+    attribute.connect_edge(edges[4])
+
+    assert list(attribute.edges) == [edges[0], edges[2], edges[3], edges[4]] and attribute.edge_count == 4
+    assert attribute.is_edge_connected(edges[2]) and not attribute.is_edge_connected(edges[1])
+
+
+def test_invalid_connections_are_rejected() -> None:
+    attribute: Attribute = Attribute()
+    edge: Edge = Edge()
+    attribute.connect_edge(edge)
+
+    with pytest.raises(ValueError):
+        attribute.connect_edge(edge)
+    with pytest.raises(ValueError):
+        attribute.disconnect_edge(Edge())
+    with pytest.raises(ValueError):
+        Attribute(is_multi_edge=False, edges=[edge]).connect_edge(Edge())
+
+
+def test_bulk_changes_are_all_or_nothing() -> None:
+    attribute: Attribute = Attribute()
+    edges: list[Edge] = [Edge() for _ in range(3)]
+    attribute.connect_edge(edges[0])
+
+    with pytest.raises(ValueError):
+        attribute.connect_edges([edges[1], edges[0]])
+    with pytest.raises(ValueError):
+        attribute.disconnect_edges([edges[0], edges[2]])
+    with pytest.raises(ValueError):
+        Attribute(is_multi_edge=False).connect_edges(edges[1:])
+
+    assert list(attribute.edges) == [edges[0]]
+    attribute.disconnect_edges([edges[0]])
+    assert not attribute.has_edge()
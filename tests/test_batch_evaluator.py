@@ -0,0 +1,63 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from flowly.core.attribute import Attribute
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+class CountingAdd(Add):
+    calls: int = 0
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        CountingAdd.calls += 1
+        return super().compute(inputs)
+
+
+class VectorizedAdd(CountingAdd):
+    is_vectorizable = True
+
+
+def create_graph(node_type: type) -> tuple[NodeGraph, list[Add]]:
+    node_graph: NodeGraph = NodeGraph()
+    node_items: list[Add] = [Add(name='source'), node_type(name='middle'), Add(name='constant')]
+    node_graph.add_node_items(node_items)
+    node_graph.connect_attribute_items(node_items[0].attributes[2], node_items[1].attributes[0])
+    node_items[1].attributes[1].data = 10
+    node_items[2].attributes[0].data = 5
+    CountingAdd.calls = 0
+    return node_graph, node_items
+
+
+@pytest.mark.parametrize(('node_type', 'calls'), [(CountingAdd, 4), (VectorizedAdd, 1)])
+def test_rows_are_computed_per_row_or_vectorized(node_type: type, calls: int) -> None:
+    node_graph, node_items = create_graph(node_type)
+
+    outputs: dict[Attribute, Any] = node_graph.evaluate_batch({node_items[0].attributes[0]: np.arange(4)})
+
+    assert np.array_equal(outputs[node_items[1].attributes[2]], [10, 11, 12, 13])
+    assert outputs[node_items[2].attributes[2]] == 5
+    assert CountingAdd.calls == calls
+
+
+def test_batch_evaluation_leaves_the_node_graph_untouched() -> None:
+    node_graph, node_items = create_chain(2)
+    dirty_node_items: set = set(node_graph.dirty_node_items)
+
+    node_graph.evaluate_batch({node_items[0].attributes[0]: np.arange(3)})
+
+    assert node_graph.dirty_node_items == dirty_node_items and node_items[1].attributes[2].data == 0
+
+
+def test_invalid_batch_data_is_rejected() -> None:
+    node_graph, node_items = create_chain(2)
+
+    with pytest.raises(ValueError):
+        node_graph.evaluate_batch({node_items[1].attributes[0]: np.arange(3)})
+    with pytest.raises(ValueError):
+        node_graph.evaluate_batch({node_items[0].attributes[0]: np.arange(3), node_items[0].attributes[1]: np.arange(2)})
+    with pytest.raises(ValueError):
+        node_graph.evaluate_batch({Add().attributes[0]: np.arange(3)})
@@ -0,0 +1,31 @@
+from flowly.benchmark.__main__ import main
+from flowly.benchmark.benchmark_suite import BenchmarkResults, BenchmarkSuite
+
+
+def test_compare_ignores_changes_below_the_noise_floor() -> None:
+    baseline: BenchmarkResults = {'chain/100/evaluate': {'time': 0.0001, 'peak_memory': 1000}}
+    results: BenchmarkResults = {'chain/100/evaluate': {'time': 0.0009, 'peak_memory': 2000}}
+
+    rows: list[dict] = BenchmarkSuite.compare(results, baseline)
+
+    assert [row['ratio'] > 1.2 for row in rows] == [True, True]
+    assert not any(row['regression'] for row in rows)
+    assert all(row['regression'] for row in BenchmarkSuite.compare(results, baseline, min_deltas={}))
+
+
+def test_compare_reports_large_slowdowns() -> None:
+    baseline: BenchmarkResults = {'chain/100/evaluate': {'time': 0.1}, 'chain/100/missing': {'time': 0.1}}
+    results: BenchmarkResults = {'chain/100/evaluate': {'time': 0.2}, 'chain/100/new': {'time': 0.1}}
+
+    rows: list[dict] = BenchmarkSuite.compare(results, baseline)
+
+    assert [(row['key'], row['regression']) for row in rows] == [('chain/100/evaluate', True)]
+
+
+def test_main_compares_against_a_saved_baseline(tmp_path) -> None:
+    baseline_path: str = str(tmp_path / 'baseline.json')
+    arguments: list[str] = ['--sizes', '10', '--generators', 'chain', '--repeat', '1', '--no-memory']
+
+    assert main([*arguments, '--output', baseline_path]) == 0
+    assert len(BenchmarkSuite.load(baseline_path)) == len(BenchmarkSuite.STAGES)
+    assert main([*arguments, '--baseline', baseline_path]) == 0
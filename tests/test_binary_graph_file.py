@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import numpy as np
+
+from flowly.core.binary_graph_file import BinaryGraphFile
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import create_chain
+
+
+def test_round_trip_keeps_structure_and_data(tmp_path: Path) -> None:
+    node_graph, node_items = create_chain(3)
+    node_items[0].attributes[1].data = np.arange(1000, dtype=np.float32)
+    node_items[1].attributes[1].data = b'\x00\x01'
+    node_items[2].attributes[1].data = {'a': [1, 2.5, None, True]}
+    path: Path = tmp_path / 'graph.flowly'
+
+    BinaryGraphFile.write(node_graph, path)
+    loaded_graph: NodeGraph = BinaryGraphFile.read(path)
+
+    assert [node_item.name for node_item in loaded_graph.node_items] == ['0', '1', '2']
+    assert sorted(edge_item.id for edge_item in loaded_graph.edge_items) == sorted(
+        edge_item.id for edge_item in node_graph.edge_items
+    )
+    loaded_node_items = loaded_graph.node_items
+    assert not loaded_node_items[0].attributes[1].is_data_loaded
+    assert np.array_equal(loaded_node_items[0].attributes[1].data, np.arange(1000, dtype=np.float32))
+    assert bytes(loaded_node_items[1].attributes[1].data) == b'\x00\x01'
+    assert loaded_node_items[2].attributes[1].data == {'a': [1, 2.5, None, True]}
+
+
+def test_non_json_types_are_preserved(tmp_path: Path) -> None:
+    node_graph, node_items = create_chain(3)
+    node_items[0].attributes[1].data = (1, 2)
+    node_items[1].attributes[1].data = {1: 'x'}
+    node_items[2].attributes[1].data = [(1, 2), {'key': (3,)}]
+    path: Path = tmp_path / 'graph.flowly'
+
+    BinaryGraphFile.write(node_graph, path)
+    loaded_node_items = BinaryGraphFile.read(path).node_items
+
+    assert loaded_node_items[0].attributes[1].data == (1, 2)
+    assert loaded_node_items[1].attributes[1].data == {1: 'x'}
+    assert loaded_node_items[2].attributes[1].data == [(1, 2), {'key': (3,)}]
+
+
+def test_write_back_to_the_file_read_from(tmp_path: Path) -> None:
+    node_graph, node_items = create_chain(2)
+    array: np.ndarray = np.random.default_rng(0).random(100_000)
+    node_items[0].attributes[1].data = array
+    path: Path = tmp_path / 'graph.flowly'
+    BinaryGraphFile.write(node_graph, path)
+    size: int = path.stat().st_size
+
+    loaded_graph: NodeGraph = BinaryGraphFile.read(path)
+    loaded_graph.node_items[1].attributes[1].data = 7
+    BinaryGraphFile.write(loaded_graph, path)
+    reloaded_graph: NodeGraph = BinaryGraphFile.read(path)
+
+    assert path.stat().st_size >= size
+    assert np.array_equal(reloaded_graph.node_items[0].attributes[1].data, array)
+    assert reloaded_graph.node_items[1].attributes[1].data == 7
+    assert np.array_equal(loaded_graph.node_items[0].attributes[1].data, array)
+    assert [child.name for child in tmp_path.iterdir()] == ['graph.flowly']
@@ -0,0 +1,55 @@
+from graph_nodes import create_chain
+
+
+def test_run_marks_all_group_members_clean() -> None:
+    node_graph, node_items = create_chain(4)
+    node_items[0].attributes[1].data = 1
+
+    node_graph.compile().run()
+
+    assert not node_graph.dirty_node_items
+    assert [node_item.attributes[2].data for node_item in node_items] == [1, 1, 1, 1]
+
+
+def test_edit_then_evaluate_after_compile() -> None:
+    node_graph, node_items = create_chain(4)
+    node_items[0].attributes[1].data = 1
+    node_graph.compile().run()
+
+    node_items[0].attributes[1].data = 5
+    node_graph.evaluate()
+
+    assert [node_item.attributes[2].data for node_item in node_items] == [5, 5, 5, 5]
+
+
+def test_edit_then_run_after_compile() -> None:
+    node_graph, node_items = create_chain(4)
+    compiled_graph = node_graph.compile()
+    compiled_graph.run()
+
+    node_items[0].attributes[1].data = 5
+    compiled_graph.run()
+
+    assert [node_item.attributes[2].data for node_item in node_items] == [5, 5, 5, 5]
+
+
+def test_run_defers_intermediate_outputs() -> None:
+    node_graph, node_items = create_chain(3)
+    node_items[0].attributes[1].data = 2
+
+    node_graph.compile().run()
+
+    assert [node_item.attributes[2].is_data_loaded for node_item in node_items] == [False, False, True]
+    assert node_items[1].attributes[2].data == 2
+
+
+def test_root_only_edit_then_evaluate_after_compile() -> None:
+    node_graph, node_items = create_chain(3)
+    node_items[0].attributes[1].data = 2
+    node_graph.compile().run()
+
+    node_items[2].attributes[1].data = 10
+    node_graph.evaluate()
+
+    assert node_graph.dirty_node_items == set()
+    assert node_items[2].attributes[2].data == 12
@@ -0,0 +1,141 @@
+import os
+from typing import Any, Optional
+from uuid import UUID
+
+import numpy as np
+import pytest
+
+from flowly.core.array_attribute import ArrayAttribute
+from flowly.core.distributed_scheduler import DistributedScheduler
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.group_node import GroupNode
+from flowly.core.node import Node
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+class Scale(Node):
+    def __init__(self, uuid: Optional[UUID | int] = None, name: str = "Scale") -> None:
+        super().__init__(uuid=uuid, name=name)
+        self.attributes.append(ArrayAttribute(name='values', dtype=np.float64, parent=self))
+        self.attributes.append(ArrayAttribute(name='out', dtype=np.float64, flag=AttributeFlags.OUTPUT, parent=self))
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return {'out': inputs['values'] * 2}
+
+
+class Fail(Add):
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        raise KeyError('fail')
+
+
+def create_forks(length: int) -> tuple[NodeGraph, list[list[Add]], Add]:
+    node_graph: NodeGraph = NodeGraph()
+    chains: list[list[Add]] = [[Add(name=f'{index}.{position}') for position in range(length)] for index in range(2)]
+    join: Add = Add(name='join')
+    node_graph.add_node_items([node_item for chain in chains for node_item in chain] + [join])
+    for index, chain in enumerate(chains):
+        chain[0].attributes[1].data = index + 1
+        for upstream_node_item, downstream_node_item in zip(chain, chain[1:]):
+            node_graph.connect_attribute_items(upstream_node_item.attributes[2], downstream_node_item.attributes[0])
+        node_graph.connect_attribute_items(chain[-1].attributes[2], join.attributes[index])
+    return node_graph, chains, join
+
+
+def test_worker_count_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        DistributedScheduler(worker_count=0)
+
+
+def test_partition_covers_nodes_in_order() -> None:
+    node_graph, chains, join = create_forks(3)
+    node_items: list[Node] = [node_item for chain in chains for node_item in chain] + [join]
+
+    parts: list[list[Node]] = DistributedScheduler.partition(node_graph, node_items, 2)
+
+    assert len(parts) == 2
+    assert sorted(node_item.name for part in parts for node_item in part) == sorted(
+        node_item.name for node_item in node_items
+    )
+    for part in parts:
+        assert part == sorted(part, key=node_items.index)
+    assert sorted(len(part) for part in parts) == [3, 4]
+    assert sorted(chain[0] in part and chain[-1] in part for chain in chains for part in parts) == [
+        False, False, True, True
+    ]
+
+
+def test_partition_never_returns_empty_parts() -> None:
+    node_graph, node_items = create_chain(2)
+
+    parts: list[list[Node]] = DistributedScheduler.partition(node_graph, node_items, 4)
+
+    assert sorted(parts, key=lambda part: part[0].name) == [[node_items[0]], [node_items[1]]]
+    assert DistributedScheduler.partition(node_graph, [], 4) == []
+
+
+def test_run_matches_sequential_evaluation() -> None:
+    node_graph, chains, join = create_forks(3)
+    expected_graph, expected_chains, expected_join = create_forks(3)
+    expected_graph.evaluate()
+
+    node_graph.evaluate(scheduler=DistributedScheduler(worker_count=2))
+
+    assert join.attributes[2].data == expected_join.attributes[2].data == 3
+    assert [[node_item.attributes[2].data for node_item in chain] for chain in chains] == [
+        [node_item.attributes[2].data for node_item in chain] for chain in expected_chains
+    ]
+    assert not node_graph.dirty_node_items
+
+
+def test_run_recomputes_only_dirty_nodes() -> None:
+    node_graph, chains, join = create_forks(2)
+    node_graph.evaluate(scheduler=DistributedScheduler(worker_count=2))
+
+    chains[1][0].attributes[1].data = 10
+    assert node_graph.dirty_node_items == {*chains[1], join}
+    node_graph.evaluate(scheduler=DistributedScheduler(worker_count=2))
+
+    assert join.attributes[2].data == 11
+    assert not node_graph.dirty_node_items
+
+
+def test_large_arrays_pass_through_shared_memory() -> None:
+    node_graph: NodeGraph = NodeGraph()
+    node_items: list[Scale] = [Scale(name=str(index)) for index in range(3)]
+    node_graph.add_node_items(node_items)
+    node_graph.connect_attribute_items(node_items[0].attributes[1], node_items[1].attributes[0])
+    node_graph.connect_attribute_items(node_items[0].attributes[1], node_items[2].attributes[0])
+    node_items[0].attributes[0].data = np.arange(100_000, dtype=np.float64)
+    segments_before: set[str] = set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+
+    node_graph.evaluate(scheduler=DistributedScheduler(worker_count=2, shared_memory_threshold=1024))
+
+    for node_item in node_items[1:]:
+        np.testing.assert_array_equal(node_item.attributes[1].data, np.arange(100_000) * 4.0)
+    if os.path.isdir('/dev/shm'):
+        assert set(os.listdir('/dev/shm')) <= segments_before
+
+
+def test_group_node_inner_state_is_synced() -> None:
+    node_graph, node_items = create_chain(4)
+    group: GroupNode = GroupNode.collapse(node_graph, node_items[1:3])
+    node_items[0].attributes[1].data = 3
+
+    node_graph.evaluate(scheduler=DistributedScheduler(worker_count=2))
+
+    assert node_items[3].attributes[2].data == 3
+    assert node_items[2].attributes[2].data == 3
+    assert not group.inner_graph.dirty_node_items
+    assert not node_graph.dirty_node_items
+
+
+def test_compute_error_is_reraised() -> None:
+    node_graph, node_items = create_chain(2)
+    fail: Fail = Fail(name='fail')
+    node_graph.add_node_item(fail)
+    node_graph.connect_attribute_items(node_items[1].attributes[2], fail.attributes[0])
+
+    with pytest.raises(KeyError):
+        node_graph.evaluate(scheduler=DistributedScheduler(worker_count=2))
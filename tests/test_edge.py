@@ -0,0 +1,54 @@
+import pickle
+from uuid import UUID, uuid4
+
+import pytest
+
+from flowly.core.edge import Edge
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+def test_connect_registers_the_edge_on_both_attributes_and_the_index() -> None:
+    node_graph: NodeGraph = NodeGraph()
+    node_items: list[Add] = [Add(name='0'), Add(name='1')]
+    node_graph.add_node_items(node_items)
+    edge_uuid: UUID = uuid4()
+
+    edge_item: Edge = node_graph.connect_attribute_items(node_items[0].attributes[2], node_items[1].attributes[0],
+                                                         edge_uuid)
+
+    assert (edge_item.uuid, edge_item.source, edge_item.target) == (
+        edge_uuid, node_items[0].attributes[2], node_items[1].attributes[0]
+    )
+    assert list(node_items[0].attributes[2].edges) == list(node_items[1].attributes[0].edges) == [edge_item]
+    assert node_graph.get_edge_item_by_uuid(edge_uuid) is node_graph.get_edge_item_by_uuid(edge_uuid.int) is edge_item
+
+
+def test_remove_edge_item_unregisters_it() -> None:
+    node_graph, node_items = create_chain(3)
+    edge_item: Edge = node_graph.edge_items[0]
+
+    node_graph.remove_edge_item(node_items[0], 2, node_items[1], 0)
+
+    assert node_graph.get_edge_item_by_uuid(edge_item.uuid) is None and len(node_graph.edge_items) == 1
+    assert not node_items[0].attributes[2].has_edge() and not node_items[1].attributes[0].has_edge()
+    assert not node_graph.main_graph.has_edge(edge_item.source, edge_item.target)
+
+
+def test_invalid_connections_raise() -> None:
+    node_graph, node_items = create_chain(2)
+
+    with pytest.raises(ValueError):
+        node_graph.connect_attribute_items(node_items[0].attributes[2], node_items[1].attributes[0])
+    with pytest.raises(ValueError):
+        node_graph.connect_attribute_items(node_items[1].attributes[0], node_items[0].attributes[0])
+
+
+def test_pickled_edges_drop_their_endpoints() -> None:
+    node_graph, _ = create_chain(2)
+
+    edge_item: Edge = pickle.loads(pickle.dumps(node_graph.edge_items[0]))
+
+    assert edge_item.uuid == node_graph.edge_items[0].uuid
+    assert edge_item.source is None and edge_item.target is None
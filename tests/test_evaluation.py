@@ -0,0 +1,74 @@
+from typing import Any
+
+from flowly.core.node import Node
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+class RecordingAdd(Add):
+    computed: list[str] = []
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        RecordingAdd.computed.append(self.name)
+        return super().compute(inputs)
+
+
+def create_diamond() -> tuple[NodeGraph, list[RecordingAdd]]:
+    node_graph: NodeGraph = NodeGraph()
+    node_items: list[RecordingAdd] = [RecordingAdd(name=name) for name in ('sink', 'left', 'right', 'source')]
+    node_graph.add_node_items(node_items)
+    sink, left, right, source = node_items
+    node_graph.connect_attribute_items(source.attributes[2], left.attributes[0])
+    node_graph.connect_attribute_items(source.attributes[2], right.attributes[0])
+    node_graph.connect_attribute_items(left.attributes[2], sink.attributes[0])
+    node_graph.connect_attribute_items(right.attributes[2], sink.attributes[1])
+    RecordingAdd.computed.clear()
+    return node_graph, node_items
+
+
+def test_evaluate_computes_in_topological_order() -> None:
+    node_graph, node_items = create_diamond()
+    node_items[3].attributes[0].data = 2
+    node_items[1].attributes[1].data = 1
+
+    node_graph.evaluate()
+
+    assert RecordingAdd.computed[0] == 'source' and RecordingAdd.computed[-1] == 'sink'
+    assert node_items[0].attributes[2].data == 5 and not node_graph.dirty_node_items
+
+
+def test_only_the_downstream_cone_is_recomputed() -> None:
+    node_graph, node_items = create_diamond()
+    node_graph.evaluate()
+    RecordingAdd.computed.clear()
+
+    node_items[2].attributes[1].data = 4
+
+    assert node_graph.dirty_node_items == {node_items[2], node_items[0]}
+    node_graph.evaluate()
+    assert RecordingAdd.computed == ['right', 'sink'] and node_items[0].attributes[2].data == 4
+
+
+def test_changing_an_output_dirties_only_its_consumers() -> None:
+    node_graph, node_items = create_chain(3)
+    node_graph.evaluate()
+
+    node_items[0].attributes[2].data = 7
+
+    assert node_graph.dirty_node_items == {node_items[1], node_items[2]}
+
+
+def test_dirty_set_stays_closed_downstream_on_connect_and_disconnect() -> None:
+    node_graph, node_items = create_chain(3)
+    node_graph.evaluate()
+    extra: Node = Add(name='extra')
+    node_graph.add_node_item(extra)
+    node_graph.evaluate()
+
+    node_graph.connect_attribute_items(extra.attributes[2], node_items[1].attributes[1])
+
+    assert node_graph.dirty_node_items == {node_items[1], node_items[2]}
+    node_graph.evaluate()
+    node_graph.remove_edge_item_by_uuid(next(iter(node_items[1].attributes[1].edges)).uuid)
+    assert node_graph.dirty_node_items == {node_items[1], node_items[2]}
@@ -0,0 +1,49 @@
+from flowly.core.execution_plan import ExecutionPlan
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+def test_plan_is_reused_until_the_topology_changes() -> None:
+    node_graph, node_items = create_chain(3)
+    execution_plan: ExecutionPlan = node_graph.get_execution_plan()
+    topology_version: int = node_graph.topology_version
+
+    node_items[0].attributes[1].data = 2
+    node_graph.evaluate()
+
+    assert node_graph.get_execution_plan() is execution_plan and node_graph.topology_version == topology_version
+
+    node_graph.add_node_item(Add(name='added'))
+
+    assert node_graph.topology_version > topology_version
+    assert node_graph.get_execution_plan() is not execution_plan
+    assert execution_plan.topology_version == topology_version
+
+
+def test_edge_changes_invalidate_the_plan() -> None:
+    node_graph, node_items = create_chain(3)
+    execution_plan: ExecutionPlan = node_graph.get_execution_plan()
+
+    node_graph.remove_edge_item(node_items[1], 2, node_items[2], 0)
+
+    assert node_graph.get_execution_plan() is not execution_plan
+    assert node_graph.get_execution_plan().get_input_slots(node_items[2])[0] == (node_items[2].attributes[0], ())
+
+
+def test_plan_lists_node_items_in_topological_order_with_their_slots() -> None:
+    node_graph: NodeGraph = NodeGraph()
+    node_items: list[Add] = [Add(name=str(index)) for index in range(3)]
+    node_graph.add_node_items(node_items)
+    node_graph.connect_attribute_items(node_items[2].attributes[2], node_items[0].attributes[1])
+    node_graph.connect_attribute_items(node_items[0].attributes[2], node_items[1].attributes[0])
+
+    execution_plan: ExecutionPlan = node_graph.get_execution_plan()
+
+    positions: dict = execution_plan.positions
+    assert positions[node_items[2]] < positions[node_items[0]] < positions[node_items[1]]
+    assert execution_plan.node_items == sorted(node_items, key=positions.__getitem__)
+    assert execution_plan.get_input_slots(node_items[0])[1] == (
+        node_items[0].attributes[1], (node_items[2].attributes[2],)
+    )
+    assert execution_plan.get_output_slots(node_items[0]) == {'out': node_items[0].attributes[2]}
@@ -0,0 +1,77 @@
+from typing import Any
+
+import pytest
+
+from flowly.core.attribute import Attribute
+from flowly.core.graph_history import GraphHistory
+from flowly.core.graph_snapshot import GraphSnapshot
+
+from graph_nodes import Add, create_chain
+
+
+def test_undo_and_redo_restore_data_nodes_and_edges() -> None:
+    node_graph, node_items = create_chain(3)
+    history: GraphHistory = GraphHistory(node_graph)
+
+    history.record()
+    node_items[0].attributes[1].data = 5
+    history.record()
+    node_graph.remove_node_item(node_items[1])
+    history.record()
+    added: Add = Add(name='added')
+    node_graph.add_node_item(added)
+    node_graph.connect_attribute_items(node_items[0].attributes[2], added.attributes[0])
+
+    assert history.undo() and history.undo()
+    assert node_graph.node_items == node_items and len(node_graph.edge_items) == 2
+    node_graph.evaluate()
+    assert node_items[2].attributes[2].data == 5
+
+    assert history.undo() and not history.undo()
+    node_graph.evaluate()
+    assert node_items[2].attributes[2].data == 0
+
+    assert history.redo() and history.redo() and history.redo() and not history.redo()
+    assert [node_item.name for node_item in node_graph.node_items] == ['0', '2', 'added']
+    node_graph.evaluate()
+    assert added.attributes[2].data == 5
+
+
+def test_recording_discards_the_redo_steps() -> None:
+    node_graph, node_items = create_chain(2)
+    history: GraphHistory = GraphHistory(node_graph, max_size=2)
+    for value in range(1, 4):
+        history.record()
+        node_items[0].attributes[1].data = value
+
+    history.undo()
+    history.record()
+
+    assert not history.can_redo
+    assert history.undo() and history.undo() and not history.undo()
+    assert node_items[0].attributes[1].data == 1
+    with pytest.raises(ValueError):
+        GraphHistory(node_graph, max_size=0)
+
+
+def test_snapshots_are_immutable_and_evaluate_independently() -> None:
+    node_graph, node_items = create_chain(2)
+    node_items[0].attributes[1].data = 3
+    snapshot: GraphSnapshot = node_graph.snapshot()
+
+    node_items[0].attributes[1].data = 4
+    node_graph.remove_node_item(node_items[1])
+
+    results: dict[Attribute, Any] = snapshot.evaluate()
+    assert snapshot.node_items == node_items and snapshot.get_data(node_items[0].attributes[1]) == 3
+    assert results[node_items[1].attributes[2]] == 3
+    assert node_items[0].attributes[1].data == 4 and node_items[1].attributes[2].data == 0
+
+
+def test_unchanged_graph_returns_the_same_snapshot() -> None:
+    node_graph, _ = create_chain(2)
+
+    snapshot: GraphSnapshot = node_graph.snapshot()
+    node_graph.evaluate()
+
+    assert node_graph.snapshot() is snapshot
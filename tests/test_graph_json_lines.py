@@ -0,0 +1,71 @@
+import io
+import json
+
+import pytest
+
+from flowly.core.edge import Edge
+from flowly.core.enumerations import GraphStorage
+from flowly.core.graph_json_lines import GraphJsonLines
+from flowly.core.node import Node
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import create_chain
+
+
+def write(node_graph: NodeGraph) -> io.StringIO:
+    file: io.StringIO = io.StringIO()
+    GraphJsonLines.write(node_graph, file)
+    file.seek(0)
+    return file
+
+
+def test_round_trip_keeps_nodes_edges_and_data() -> None:
+    node_graph, node_items = create_chain(3)
+    node_items[0].attributes[1].data = 4
+
+    copied_graph: NodeGraph = GraphJsonLines.read_node_graph(write(node_graph), GraphStorage.ARRAY)
+    copied_graph.evaluate()
+
+    assert [edge_item.uuid for edge_item in copied_graph.edge_items] == [
+        edge_item.uuid for edge_item in node_graph.edge_items
+    ]
+    assert copied_graph.node_items[2].attributes[2].data == 4
+
+
+def test_writes_one_entity_per_line() -> None:
+    node_graph, _ = create_chain(2)
+
+    kinds: list[str] = [json.loads(line)['kind'] for line in write(node_graph)]
+
+    assert kinds == ['node', 'attribute', 'attribute', 'attribute'] * 2 + ['edge']
+
+
+def test_read_yields_edges_with_resolved_endpoints() -> None:
+    node_graph, node_items = create_chain(2)
+
+    edge_items: list[Edge] = [record for record in GraphJsonLines.read(write(node_graph)) if isinstance(record, Edge)]
+
+    assert len(edge_items) == 1
+    assert edge_items[0].source.uuid == node_items[0].attributes[2].uuid
+    assert edge_items[0].target.uuid == node_items[1].attributes[0].uuid
+
+
+def test_filtered_stream_can_be_written_again() -> None:
+    node_graph, _ = create_chain(3)
+    filtered: io.StringIO = io.StringIO()
+
+    GraphJsonLines.write_records((record for record in GraphJsonLines.read(write(node_graph))
+                                  if isinstance(record, Node)), filtered)
+    filtered.seek(0)
+
+    assert [node_item.name for node_item in GraphJsonLines.read_node_graph(filtered).node_items] == ['0', '1', '2']
+
+
+def test_invalid_records_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        list(GraphJsonLines.read(io.StringIO('{"kind": "unknown"}\n')))
+    with pytest.raises(ValueError):
+        list(GraphJsonLines.read(io.StringIO(json.dumps({
+            'kind': 'edge', 'uuid': '00000000-0000-0000-0000-000000000001',
+            'source': '00000000-0000-0000-0000-000000000002', 'target': '00000000-0000-0000-0000-000000000003'
+        }))))
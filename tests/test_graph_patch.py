@@ -0,0 +1,99 @@
+from typing import Any, Optional
+from uuid import UUID
+
+import numpy as np
+import pytest
+
+from flowly.core.array_attribute import ArrayAttribute
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.graph_patch import GraphPatch
+from flowly.core.graph_snapshot import GraphSnapshot
+from flowly.core.node import Node
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+class Scale(Node):
+    def __init__(self, uuid: Optional[UUID | int] = None, name: str = "Scale") -> None:
+        super().__init__(uuid=uuid, name=name)
+        self.attributes.append(ArrayAttribute(name='values', dtype=np.float64, parent=self))
+        self.attributes.append(ArrayAttribute(name='out', dtype=np.float64, flag=AttributeFlags.OUTPUT, parent=self))
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return {'out': inputs['values'] * 2}
+
+
+def test_snapshot_patch_applies_to_a_copy() -> None:
+    node_graph, node_items = create_chain(3)
+    copied_graph: NodeGraph = NodeGraph.from_json(node_graph.to_json())
+    before: GraphSnapshot = node_graph.snapshot()
+
+    node_items[0].attributes[1].data = 5
+    node_graph.remove_node_item(node_items[2])
+    added_node_item: Add = Add(name='added')
+    node_graph.add_node_item(added_node_item)
+    node_graph.connect_attribute_items(node_items[1].attributes[2], added_node_item.attributes[1])
+    patch: GraphPatch = GraphPatch.from_snapshots(before, node_graph.snapshot())
+
+    copied_graph.apply_patch(GraphPatch.from_json(patch.to_json()))
+    copied_graph.evaluate()
+    node_graph.evaluate()
+
+    assert [node_item.name for node_item in copied_graph.node_items] == ['0', '1', 'added']
+    assert copied_graph.node_items[2].attributes[2].data == added_node_item.attributes[2].data == 5
+    assert GraphPatch.from_node_graphs(copied_graph, node_graph).to_dict() == {'version': GraphPatch.VERSION}
+
+
+def test_reverse_patch_restores_the_old_state() -> None:
+    node_graph, node_items = create_chain(3)
+    copied_graph: NodeGraph = NodeGraph.from_json(node_graph.to_json())
+    before: GraphSnapshot = node_graph.snapshot()
+    node_items[2].attributes[1].data = 3
+    node_graph.remove_edge_item_by_uuid(node_graph.edge_items[0].id)
+    after: GraphSnapshot = node_graph.snapshot()
+
+    copied_graph.apply_patch(GraphPatch.from_snapshots(before, after))
+    copied_graph.apply_patch(GraphPatch.from_snapshots(after, before))
+
+    assert len(copied_graph.edge_items) == 2
+    assert copied_graph.node_items[2].attributes[1].data == 0
+
+
+def test_array_data_is_serialized() -> None:
+    node_graph: NodeGraph = NodeGraph()
+    node_item: Scale = Scale()
+    node_graph.add_node_item(node_item)
+    copied_graph: NodeGraph = NodeGraph.from_json(node_graph.to_json())
+    before: GraphSnapshot = node_graph.snapshot()
+
+    node_item.attributes[0].data = np.array([1.0, 2.0])
+    copied_graph.apply_patch(GraphPatch.from_json(GraphPatch.from_snapshots(before, node_graph.snapshot()).to_json()))
+    copied_graph.evaluate()
+
+    assert np.array_equal(copied_graph.node_items[0].attributes[1].data, [2.0, 4.0])
+
+
+def test_node_graph_patch_skips_connected_inputs() -> None:
+    node_graph, node_items = create_chain(3)
+    copied_graph: NodeGraph = NodeGraph.from_json(node_graph.to_json())
+    node_items[0].attributes[0].data = 1
+    node_graph.evaluate()
+
+    patch: GraphPatch = GraphPatch.from_node_graphs(copied_graph, node_graph)
+
+    assert patch.changed_data == [(str(node_items[0].attributes[0].uuid), 1)]
+
+
+def test_apply_rejects_missing_nodes_and_edges() -> None:
+    node_graph, _ = create_chain(2)
+    missing_uuid: str = str(Add().uuid)
+
+    with pytest.raises(ValueError):
+        GraphPatch(removed_edges=[missing_uuid]).apply(node_graph)
+    with pytest.raises(ValueError):
+        GraphPatch(removed_nodes=[missing_uuid]).apply(node_graph)
+    with pytest.raises(ValueError):
+        GraphPatch(changed_data=[(missing_uuid, 1)]).apply(node_graph)
+    with pytest.raises(ValueError):
+        GraphPatch.from_dict({'version': GraphPatch.VERSION + 1})
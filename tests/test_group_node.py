@@ -0,0 +1,112 @@
+import pickle
+
+import pytest
+
+from flowly.core.group_node import GroupNode
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+def test_collapse_replaces_members_and_keeps_result() -> None:
+    node_graph, node_items = create_chain(4)
+    node_items[0].attributes[1].data = 1
+    node_items[2].attributes[1].data = 10
+    node_graph.evaluate()
+    expected: int = node_items[3].attributes[2].data
+
+    group: GroupNode = GroupNode.collapse(node_graph, node_items[1:3], name='Group')
+    node_graph.evaluate()
+
+    assert [node_item.name for node_item in node_graph.node_items] == ['0', '3', 'Group']
+    assert [port.name for port in group.attributes] == ['1.a', '2.out']
+    assert group.get_inner_attribute(group.attributes[0]) is node_items[1].attributes[0]
+    assert len(group.inner_graph.edge_items) == 1
+    assert node_items[3].attributes[2].data == expected
+
+
+def test_collapse_rejects_a_cyclic_dependency() -> None:
+    node_graph, node_items = create_chain(3)
+
+    with pytest.raises(ValueError):
+        GroupNode.collapse(node_graph, [node_items[0], node_items[2]])
+
+
+def test_input_port_change_recomputes_the_group() -> None:
+    node_graph, node_items = create_chain(4)
+    GroupNode.collapse(node_graph, node_items[1:3])
+    node_graph.evaluate()
+
+    node_items[0].attributes[1].data = 4
+    node_graph.evaluate()
+
+    assert node_items[3].attributes[2].data == 4
+    assert not node_graph.dirty_node_items
+
+
+def test_unexposed_inner_edit_dirties_the_group() -> None:
+    node_graph, node_items = create_chain(3)
+    group: GroupNode = GroupNode.collapse(node_graph, node_items[:2])
+    node_graph.evaluate()
+
+    node_items[0].attributes[0].data = 100
+
+    assert node_graph.dirty_node_items == {group, node_items[2]}
+    node_graph.evaluate()
+    assert node_items[2].attributes[2].data == 100
+
+
+def test_inner_topology_change_dirties_the_group() -> None:
+    node_graph, node_items = create_chain(3)
+    group: GroupNode = GroupNode.collapse(node_graph, node_items[:2])
+    node_graph.evaluate()
+
+    group.inner_graph.add_node_item(Add(name='extra'))
+
+    assert group in node_graph.dirty_node_items
+
+
+def test_expose_rejects_invalid_attributes() -> None:
+    inner_graph, node_items = create_chain(2)
+    group: GroupNode = GroupNode(inner_graph=inner_graph)
+    group.expose(node_items[0].attributes[0], name='x')
+
+    with pytest.raises(ValueError):
+        group.expose(node_items[1].attributes[0])
+    with pytest.raises(ValueError):
+        group.expose(node_items[0].attributes[0])
+    with pytest.raises(ValueError):
+        group.expose(node_items[1].attributes[1], name='x')
+    with pytest.raises(ValueError):
+        group.expose(Add().attributes[0])
+
+
+def test_cache_token_ignores_uuids_but_not_data() -> None:
+    node_graph, node_items = create_chain(6)
+    node_items[3].name, node_items[4].name = node_items[1].name, node_items[2].name
+    first_group: GroupNode = GroupNode.collapse(node_graph, node_items[1:3])
+    second_group: GroupNode = GroupNode.collapse(node_graph, node_items[3:5])
+
+    assert first_group.get_cache_token() == second_group.get_cache_token()
+    node_items[4].attributes[1].data = 1
+    assert first_group.get_cache_token() != second_group.get_cache_token()
+
+
+def test_serialization_round_trips() -> None:
+    node_graph, node_items = create_chain(3)
+    node_items[1].attributes[1].data = 2
+    group: GroupNode = GroupNode.collapse(node_graph, node_items[:2])
+
+    loaded_graph: NodeGraph = NodeGraph.from_json(node_graph.to_json())
+    loaded_group: GroupNode = next(
+        node_item for node_item in loaded_graph.node_items if isinstance(node_item, GroupNode)
+    )
+    loaded_graph.evaluate()
+    unpickled_group: GroupNode = pickle.loads(pickle.dumps(group))
+
+    assert loaded_group.get_cache_token() == group.get_cache_token()
+    assert [port.name for port in loaded_group.attributes] == [port.name for port in group.attributes]
+    assert all(
+        node_item.node_graph is unpickled_group.inner_graph for node_item in unpickled_group.inner_graph.node_items
+    )
+    assert unpickled_group.inner_graph.parent is unpickled_group
@@ -0,0 +1,56 @@
+import os
+from uuid import UUID
+
+import pytest
+
+from flowly.core.base_entity import BaseEntity
+from flowly.core.enumerations import IdStrategy
+from flowly.core.id_generator import IdGenerator
+
+
+@pytest.mark.parametrize(('strategy', 'version'), [
+    (IdStrategy.UUID7, 7), (IdStrategy.UUID4, 4), (IdStrategy.UUID1, 1)
+])
+def test_ids_are_valid_uuids(strategy: IdStrategy, version: int) -> None:
+    uuid: UUID = UUID(int=IdGenerator(strategy).next_id())
+
+    assert uuid.version == version and uuid.variant == 'specified in RFC 4122'
+
+
+def test_uuid7_ids_strictly_increase() -> None:
+    generator: IdGenerator = IdGenerator(batch_size=16)
+
+    ids: list[int] = [generator.next_id() for _ in range(10_000)]
+
+    assert ids == sorted(set(ids))
+
+
+def test_counter_ids_are_unique_across_generators() -> None:
+    generators: list[IdGenerator] = [IdGenerator(IdStrategy.COUNTER) for _ in range(2)]
+
+    ids: set[int] = {generator.next_id() for generator in generators for _ in range(1000)}
+
+    assert len(ids) == 2000
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires os.fork")
+def test_forked_children_do_not_repeat_ids() -> None:
+    generator: IdGenerator = IdGenerator(IdStrategy.COUNTER)
+    read_fd, write_fd = os.pipe()
+    pid: int = os.fork()
+    if pid == 0:
+        os.write(write_fd, generator.next_id().to_bytes(16, 'big'))
+        os._exit(0)
+    os.close(write_fd)
+    child_id: int = int.from_bytes(os.read(read_fd, 16), 'big')
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    assert child_id != generator.next_id()
+
+
+def test_entities_accept_uuids_and_their_integer_values() -> None:
+    uuid: UUID = UUID(int=IdGenerator().next_id())
+
+    assert BaseEntity(uuid) == BaseEntity(uuid.int) and BaseEntity(uuid).uuid == uuid
+    assert BaseEntity().id != BaseEntity().id
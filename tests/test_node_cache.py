@@ -0,0 +1,67 @@
+import pickle
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+from flowly.core.fingerprint import fingerprint
+from flowly.core.node_cache import NodeCache
+
+from graph_nodes import Add, create_chain
+
+
+class Subtract(Add):
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return {'out': inputs['a'] - inputs['b']}
+
+
+def test_fingerprint_ignores_dict_order() -> None:
+    assert fingerprint({'a': 1, 'b': {2: 'x', 3: 'y'}}) == fingerprint({'b': {3: 'y', 2: 'x'}, 'a': 1})
+    assert fingerprint({'a': 1}) != fingerprint({'a': 2})
+    assert fingerprint((1, 2)) != fingerprint([1, 2])
+
+
+def test_repeated_evaluation_hits_the_cache() -> None:
+    node_graph, node_items = create_chain(3)
+    node_graph.cache = NodeCache()
+    node_graph.evaluate()
+    node_items[0].attributes[1].data = 1
+    node_graph.evaluate()
+    node_items[0].attributes[1].data = 0
+    node_graph.evaluate()
+
+    assert node_graph.cache.hits == 6 and node_items[2].attributes[2].data == 0
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path: Path) -> None:
+    node_item: Add = Add()
+    key: str = NodeCache.make_key(node_item, {'a': 1, 'b': 2})
+    NodeCache(directory=tmp_path).put(key, {'out': 3})
+
+    cache: NodeCache = NodeCache(directory=tmp_path)
+
+    assert cache.get(key) == {'out': 3} and cache.hits == 1
+
+
+def test_key_depends_on_the_compute_code() -> None:
+    Renamed: type = type('Add', (Subtract,), {'compute': Subtract.compute, '__module__': Add.__module__})
+    Renamed.__qualname__ = Add.__qualname__
+
+    assert NodeCache.make_key(Renamed(), {'a': 1}) != NodeCache.make_key(Add(), {'a': 1})
+    assert NodeCache.make_key(Add(), {'a': 1}) == NodeCache.make_key(Add(), {'a': 1})
+
+
+def test_unloadable_disk_entries_are_misses(tmp_path: Path) -> None:
+    module: types.ModuleType = types.ModuleType('removed_module')
+    exec("class Result:\n    pass", module.__dict__)
+    module.Result.__module__ = 'removed_module'
+    sys.modules['removed_module'] = module
+    try:
+        data: bytes = pickle.dumps({'out': module.Result()})
+    finally:
+        del sys.modules['removed_module']
+    (tmp_path / 'key.pickle').write_bytes(data)
+
+    cache: NodeCache = NodeCache(directory=tmp_path)
+
+    assert cache.get('key') is None and cache.misses == 1
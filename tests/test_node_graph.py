@@ -0,0 +1,57 @@
+import networkx as nx
+
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+def test_add_node_item_updates_the_main_graph_in_place() -> None:
+    node_graph: NodeGraph = NodeGraph()
+    main_graph: nx.DiGraph = node_graph.main_graph
+    node_item: Add = Add()
+
+    node_graph.add_node_item(node_item)
+
+    assert node_graph.main_graph is main_graph
+    assert set(main_graph.nodes) == set(node_item.attributes)
+    assert set(main_graph.edges) == set(node_item.internal_edges)
+    assert node_item.node_graph is node_graph and node_item in node_graph.dirty_node_items
+
+
+def test_bulk_add_matches_single_adds() -> None:
+    node_items: list[Add] = [Add(name=str(index)) for index in range(3)]
+    single_graph: NodeGraph = NodeGraph()
+    for node_item in node_items:
+        single_graph.add_node_item(node_item)
+    bulk_graph: NodeGraph = NodeGraph()
+
+    bulk_graph.add_node_items(Add(uuid=node_item.uuid, name=node_item.name) for node_item in node_items)
+
+    assert [node_item.uuid for node_item in bulk_graph.node_items] == [node_item.uuid for node_item in node_items]
+    assert bulk_graph.main_graph.number_of_nodes() == single_graph.main_graph.number_of_nodes() == 9
+    assert bulk_graph.main_graph.number_of_edges() == single_graph.main_graph.number_of_edges() == 6
+
+
+def test_remove_node_item_removes_only_its_attributes_and_edges() -> None:
+    node_graph, node_items = create_chain(3)
+    node_graph.evaluate()
+
+    node_graph.remove_node_item(node_items[1])
+
+    assert node_graph.node_items == [node_items[0], node_items[2]]
+    assert not any(attr_item in node_graph.main_graph for attr_item in node_items[1].attributes)
+    assert node_graph.edge_items == [] and not node_items[0].attributes[2].has_edge()
+    assert node_graph.get_node_item_by_uuid(node_items[1].uuid) is None and node_items[1].node_graph is None
+    assert node_graph.dirty_node_items == {node_items[2]}
+
+
+def test_removed_node_item_can_be_added_again() -> None:
+    node_graph, node_items = create_chain(2)
+    node_graph.remove_node_item(node_items[0])
+
+    node_graph.add_node_item(node_items[0])
+    node_graph.connect_attribute_items(node_items[0].attributes[2], node_items[1].attributes[0])
+    node_items[0].attributes[0].data = 3
+    node_graph.evaluate()
+
+    assert node_items[1].attributes[2].data == 3
@@ -0,0 +1,65 @@
+import threading
+from typing import Any
+
+import pytest
+
+from flowly.core.enumerations import ExecutorMode
+from flowly.core.node_graph import NodeGraph
+from flowly.core.parallel_scheduler import ParallelScheduler
+
+from graph_nodes import Add, create_chain
+
+
+class BarrierAdd(Add):
+    barrier: threading.Barrier = threading.Barrier(2, timeout=5)
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        BarrierAdd.barrier.wait()
+        return super().compute(inputs)
+
+
+class FailingAdd(Add):
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        raise RuntimeError("compute failed")
+
+
+@pytest.mark.parametrize('mode', [ExecutorMode.THREAD, ExecutorMode.PROCESS])
+def test_results_match_sequential_evaluation(mode: ExecutorMode) -> None:
+    node_graph, node_items = create_chain(4)
+    node_items[0].attributes[0].data = 2
+    node_items[2].attributes[1].data = 3
+
+    node_graph.evaluate(ParallelScheduler(mode, max_workers=2))
+
+    assert node_items[3].attributes[2].data == 5 and not node_graph.dirty_node_items
+
+
+def test_independent_nodes_run_concurrently() -> None:
+    node_graph: NodeGraph = NodeGraph()
+    node_items: list[Add] = [BarrierAdd(name='left'), BarrierAdd(name='right'), Add(name='sink')]
+    node_graph.add_node_items(node_items)
+    node_graph.connect_attribute_items(node_items[0].attributes[2], node_items[2].attributes[0])
+    node_graph.connect_attribute_items(node_items[1].attributes[2], node_items[2].attributes[1])
+    node_items[0].attributes[0].data = 1
+    node_items[1].attributes[0].data = 2
+
+    node_graph.evaluate(ParallelScheduler(ExecutorMode.THREAD, max_workers=2))
+
+    assert node_items[2].attributes[2].data == 3
+
+
+def test_compute_errors_are_raised_and_leave_nodes_dirty() -> None:
+    node_graph, node_items = create_chain(2)
+    failing: FailingAdd = FailingAdd(name='failing')
+    node_graph.add_node_item(failing)
+    node_graph.connect_attribute_items(node_items[1].attributes[2], failing.attributes[0])
+
+    with pytest.raises(RuntimeError):
+        node_graph.evaluate(ParallelScheduler(ExecutorMode.THREAD))
+
+    assert failing in node_graph.dirty_node_items
+
+
+def test_max_workers_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        ParallelScheduler(max_workers=0)
@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from flowly.core.enumerations import ExecutorMode
+from flowly.core.parallel_scheduler import ParallelScheduler
+from flowly.core.profiler import Profiler
+
+from graph_nodes import Add, create_chain
+
+
+def get_counts(profiler: Profiler) -> dict[tuple[str, str], int]:
+    return {(row['category'], row['name']): row['count'] for row in profiler.get_table()}
+
+
+def test_graph_operations_and_node_computations_are_measured() -> None:
+    node_graph, node_items = create_chain(3)
+    node_graph.profiler = Profiler()
+
+    node_graph.add_node_item(Add(name='added'))
+    node_graph.add_edge_item(node_items[2], 2, node_graph.node_items[3], 0)
+    node_graph.evaluate()
+
+    counts: dict[tuple[str, str], int] = get_counts(node_graph.profiler)
+    assert counts[('graph', 'add_edge_item')] == 1 and counts[('graph', 'validate_connection')] == 1
+    assert [counts[('node', name)] for name in ('0', '1', '2', 'added')] == [1, 1, 1, 1]
+    assert 'added' in node_graph.profiler.format_table()
+
+
+def test_scheduler_computations_are_measured() -> None:
+    node_graph, _ = create_chain(2)
+    node_graph.profiler = Profiler()
+
+    node_graph.evaluate(ParallelScheduler(ExecutorMode.THREAD))
+
+    assert get_counts(node_graph.profiler) == {('node', '0'): 1, ('node', '1'): 1}
+
+
+def test_chrome_trace_has_one_complete_event_per_measurement(tmp_path: Path) -> None:
+    profiler: Profiler = Profiler(trace_memory=True)
+    with profiler.measure('node', 'allocate'):
+        data: list[Any] = [0] * 10_000
+    path: Path = tmp_path / 'trace.json'
+
+    profiler.write_chrome_trace(path)
+
+    events: list[dict[str, Any]] = json.loads(path.read_text())['traceEvents']
+    assert [(event['name'], event['ph']) for event in events] == [('allocate', 'X')]
+    assert events[0]['args']['memory_delta'] > 0 and len(data) == profiler.event_count * 10_000
+
+
+def test_detached_profiler_records_nothing() -> None:
+    node_graph, node_items = create_chain(2)
+    profiler: Profiler = Profiler()
+    node_graph.profiler = profiler
+    node_graph.profiler = None
+
+    node_graph.add_node_item(Add(name='added'))
+    node_items[0].attributes[0].data = 1
+    node_graph.evaluate()
+
+    assert profiler.event_count == 0
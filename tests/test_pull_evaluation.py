@@ -0,0 +1,52 @@
+from typing import Any
+
+from flowly.core.node_graph import NodeGraph
+
+from graph_nodes import Add, create_chain
+
+
+class RecordingAdd(Add):
+    computed: list[str] = []
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        RecordingAdd.computed.append(self.name)
+        return super().compute(inputs)
+
+
+def create_fork() -> tuple[NodeGraph, list[RecordingAdd]]:
+    node_graph: NodeGraph = NodeGraph()
+    node_items: list[RecordingAdd] = [RecordingAdd(name=name) for name in ('source', 'left', 'right')]
+    node_graph.add_node_items(node_items)
+    node_graph.connect_attribute_items(node_items[0].attributes[2], node_items[1].attributes[0])
+    node_graph.connect_attribute_items(node_items[0].attributes[2], node_items[2].attributes[0])
+    RecordingAdd.computed.clear()
+    return node_graph, node_items
+
+
+def test_only_the_ancestor_cone_of_the_targets_is_computed() -> None:
+    node_graph, node_items = create_fork()
+    node_items[0].attributes[0].data = 3
+
+    node_graph.evaluate(targets=[node_items[1].attributes[2]])
+
+    assert RecordingAdd.computed == ['source', 'left'] and node_items[1].attributes[2].data == 3
+    assert node_graph.dirty_node_items == {node_items[2]}
+
+
+def test_clean_targets_are_not_recomputed() -> None:
+    node_graph, node_items = create_fork()
+    node_graph.evaluate()
+    RecordingAdd.computed.clear()
+    node_items[2].attributes[1].data = 1
+
+    node_graph.evaluate(targets=[node_items[1].attributes[2]])
+
+    assert RecordingAdd.computed == [] and node_graph.dirty_node_items == {node_items[2]}
+
+
+def test_required_node_items_are_in_topological_order() -> None:
+    node_graph, node_items = create_chain(4)
+
+    assert node_graph.get_required_node_items([node_items[2].attributes[2]]) == node_items[:3]
+    node_graph.evaluate(targets=[node_items[1].attributes[2]])
+    assert node_graph.get_required_node_items([node_items[3].attributes[2]]) == node_items[2:]
@@ -0,0 +1,66 @@
+import json
+from uuid import UUID
+
+import pytest
+
+from flowly.core.attribute import Attribute
+from flowly.core.edge import Edge
+from flowly.core.node_graph import NodeGraph
+from flowly.core.type_registry import TypeRegistry
+
+from graph_nodes import Add, create_chain
+
+
+def edge_triple(edge_item: Edge) -> tuple[UUID, UUID, UUID]:
+    return edge_item.uuid, edge_item.source.uuid, edge_item.target.uuid
+
+
+def test_json_round_trip_keeps_entities_and_types() -> None:
+    node_graph, node_items = create_chain(3)
+    node_items[0].attributes[1].data = 6
+
+    copied_graph: NodeGraph = NodeGraph.from_json(node_graph.to_json())
+
+    assert [type(node_item) for node_item in copied_graph.node_items] == [Add] * 3
+    assert [node_item.uuid for node_item in copied_graph.node_items] == [node_item.uuid for node_item in node_items]
+    assert [edge_triple(edge_item) for edge_item in copied_graph.edge_items] == [
+        edge_triple(edge_item) for edge_item in node_graph.edge_items
+    ]
+    copied_attribute: Attribute = copied_graph.node_items[0].attributes[1]
+    assert (copied_attribute.data, copied_attribute.data_type, copied_attribute.flag) == (
+        6, int, node_items[0].attributes[1].flag
+    )
+    copied_graph.evaluate()
+    assert copied_graph.node_items[2].attributes[2].data == 6
+
+
+def test_from_dict_rejects_incomplete_or_invalid_data() -> None:
+    node_graph, _ = create_chain(2)
+    data: dict = json.loads(node_graph.to_json())
+
+    with pytest.raises(ValueError):
+        NodeGraph.from_dict({'nodes': data['nodes']})
+    data['edges'][0]['target'] = data['edges'][0]['source']
+    with pytest.raises(ValueError):
+        NodeGraph.from_dict(data)
+
+
+def test_type_registry_resolves_and_caches_names() -> None:
+    registry: TypeRegistry = TypeRegistry()
+
+    assert registry.resolve_class('graph_nodes.Add') is registry.resolve_class('graph_nodes.Add') is Add
+    assert registry.resolve_data_type(registry.get_data_type_name(Add)) is Add
+    assert registry.resolve_data_type(None) is registry.resolve_data_type('Any')
+    with pytest.raises(ValueError):
+        registry.resolve_class('graph_nodes.Missing')
+    with pytest.raises(ValueError):
+        registry.resolve_data_type('missing')
+
+
+def test_registered_data_types_use_their_name() -> None:
+    registry: TypeRegistry = TypeRegistry()
+
+    registry.register_data_type(complex, 'complex_number')
+
+    assert registry.get_data_type_name(complex) == 'complex_number'
+    assert registry.resolve_data_type('complex_number') is complex
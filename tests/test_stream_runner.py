@@ -0,0 +1,89 @@
+import itertools
+from typing import Any, Iterator, Optional
+from uuid import UUID
+
+import pytest
+
+from flowly.core.attribute import Attribute
+from flowly.core.enumerations import AttributeFlags, StreamKind
+from flowly.core.node import Node
+from flowly.core.node_graph import NodeGraph
+from flowly.core.stream_runner import StreamRunner
+
+from graph_nodes import Add
+
+
+class Counter(Node):
+    def __init__(self, uuid: Optional[UUID | int] = None, name: str = "Counter") -> None:
+        super().__init__(uuid=uuid, name=name)
+        self.attributes.append(Attribute(name='out', data=0, data_type=int, flag=AttributeFlags.OUTPUT, parent=self))
+
+    def generate(self, inputs: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        for value in itertools.count():
+            yield {'out': value}
+
+
+class Odd(Add):
+    stream_kind = StreamKind.FILTER
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return {'out': inputs['a']} if inputs['a'] % 2 else {}
+
+
+class Sum(Add):
+    stream_kind = StreamKind.WINDOW
+    window_size = 3
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return {'out': sum(inputs['a'])}
+
+
+class Failing(Add):
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        raise RuntimeError("compute failed")
+
+
+def create_pipeline(*node_items: Node) -> NodeGraph:
+    node_graph: NodeGraph = NodeGraph()
+    node_graph.add_node_items(node_items)
+    for upstream_node_item, downstream_node_item in zip(node_items, node_items[1:]):
+        node_graph.connect_attribute_items(upstream_node_item.attributes[-1], downstream_node_item.attributes[0])
+    return node_graph
+
+
+def test_unbounded_stream_flows_through_map_filter_and_window_nodes() -> None:
+    add: Add = Add(name='add')
+    add.attributes[1].data = 10
+    node_graph: NodeGraph = create_pipeline(Counter(), add, Odd(name='odd'), Sum(name='sum'))
+
+    stream: Iterator = node_graph.stream(StreamRunner(chunk_size=2, max_queue_size=2))
+    results: list[int] = [outputs['out'] for _, outputs in itertools.islice(stream, 3)]
+    stream.close()
+
+    assert results == [11 + 13 + 15, 17 + 19 + 21, 23 + 25 + 27]
+
+
+def test_finite_sources_end_the_stream_with_a_final_window() -> None:
+    source: Add = Add(name='source')
+    source.attributes[0].data = 4
+    node_graph: NodeGraph = create_pipeline(source, Sum(name='sum'))
+
+    assert [outputs['out'] for _, outputs in node_graph.stream()] == [4]
+
+
+def test_joins_across_different_filters_are_rejected() -> None:
+    counter: Counter = Counter()
+    odd: Odd = Odd(name='odd')
+    join: Add = Add(name='join')
+    node_graph: NodeGraph = create_pipeline(counter, odd, join)
+    node_graph.connect_attribute_items(counter.attributes[0], join.attributes[1])
+
+    with pytest.raises(ValueError):
+        StreamRunner().run(node_graph)
+
+
+def test_node_errors_stop_the_stream() -> None:
+    node_graph: NodeGraph = create_pipeline(Counter(), Failing(name='failing'))
+
+    with pytest.raises(RuntimeError):
+        list(node_graph.stream())
@@ -0,0 +1,59 @@
+import random
+
+import networkx as nx
+import pytest
+
+from flowly.core.array_di_graph import ArrayDiGraph
+from flowly.core.enumerations import GraphStorage
+from flowly.core.node_graph import NodeGraph
+from flowly.core.topological_order import TopologicalOrder
+
+from graph_nodes import create_chain
+
+
+@pytest.mark.parametrize('graph_type', [nx.DiGraph, ArrayDiGraph])
+def test_random_insertions_match_a_full_cycle_check(graph_type: type) -> None:
+    random_generator: random.Random = random.Random(3)
+    graph: nx.DiGraph | ArrayDiGraph = graph_type()
+    graph.add_nodes_from(range(40))
+    order: TopologicalOrder = TopologicalOrder(graph)
+    reference: nx.DiGraph = nx.DiGraph()
+    reference.add_nodes_from(range(40))
+
+    for _ in range(400):
+        source, target = random_generator.randrange(40), random_generator.randrange(40)
+        reference.add_edge(source, target)
+        expected_cycle: bool = not nx.is_directed_acyclic_graph(reference)
+        assert order.creates_cycle(source, target) == expected_cycle
+        if expected_cycle:
+            reference.remove_edge(source, target)
+            with pytest.raises(ValueError):
+                order.add_edge(source, target)
+        else:
+            order.add_edge(source, target)
+            graph.add_edge(source, target)
+
+    assert all(order.index_of(source) < order.index_of(target) for source, target in graph.edges)
+
+
+def test_existing_vertices_are_sorted_once() -> None:
+    graph: nx.DiGraph = nx.DiGraph([('c', 'b'), ('b', 'a')])
+
+    order: TopologicalOrder = TopologicalOrder(graph)
+
+    assert order.index_of('c') < order.index_of('b') < order.index_of('a')
+    with pytest.raises(ValueError):
+        TopologicalOrder(nx.DiGraph([('a', 'b'), ('b', 'a')]))
+
+
+@pytest.mark.parametrize('storage', [GraphStorage.NETWORKX, GraphStorage.ARRAY])
+def test_node_graph_rejects_cyclic_connections(storage: GraphStorage) -> None:
+    node_graph, node_items = create_chain(3)
+    node_graph = NodeGraph.from_json(node_graph.to_json(), storage)
+    node_items = node_graph.node_items
+
+    assert node_graph.validate_connection(node_items[2].attributes[2], node_items[0].attributes[1]) == (
+        "Cyclic dependency found."
+    )
+    assert node_graph.add_edge_item(node_items[2], 2, node_items[0], 1) is None
+    assert node_graph.validate_connection(node_items[0].attributes[2], node_items[2].attributes[1]) is None
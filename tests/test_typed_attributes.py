@@ -0,0 +1,73 @@
+from typing import Any, Optional
+from uuid import UUID
+
+import numpy as np
+import pytest
+
+from flowly.core.array_attribute import ArrayAttribute
+from flowly.core.bool_attribute import BoolAttribute
+from flowly.core.enumerations import AttributeFlags
+from flowly.core.node import Node
+from flowly.core.node_graph import NodeGraph
+
+
+class Source(Node):
+    def __init__(self, uuid: Optional[UUID | int] = None, name: str = "Source") -> None:
+        super().__init__(uuid=uuid, name=name)
+        self.attributes.append(ArrayAttribute(name='values', dtype=np.float64, parent=self))
+        self.attributes.append(ArrayAttribute(name='out', dtype=np.float64, flag=AttributeFlags.OUTPUT, parent=self))
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return {'out': inputs['values']}
+
+
+class Concatenate(Node):
+    def __init__(self, uuid: Optional[UUID | int] = None, name: str = "Concatenate") -> None:
+        super().__init__(uuid=uuid, name=name)
+        self.attributes.append(ArrayAttribute(name='parts', dtype=np.float64, parent=self))
+        self.attributes.append(ArrayAttribute(name='out', dtype=np.float64, flag=AttributeFlags.OUTPUT, parent=self))
+
+    def compute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return {'out': np.concatenate(inputs['parts'])}
+
+
+def test_multi_edge_array_input_keeps_a_list_of_arrays() -> None:
+    node_graph: NodeGraph = NodeGraph()
+    sources: list[Source] = [Source(name='first'), Source(name='second')]
+    concatenate: Concatenate = Concatenate()
+    node_graph.add_node_items([*sources, concatenate])
+    for source in sources:
+        node_graph.connect_attribute_items(source.attributes[1], concatenate.attributes[0])
+    sources[0].attributes[0].data = [1.0]
+    sources[1].attributes[0].data = [2.0, 3.0]
+
+    node_graph.evaluate()
+
+    parts: Any = concatenate.attributes[0].data
+    assert isinstance(parts, list) and all(isinstance(part, np.ndarray) for part in parts)
+    assert np.array_equal(concatenate.attributes[1].data, [1.0, 2.0, 3.0])
+    assert NodeGraph.from_json(node_graph.to_json()).node_items[2].attributes[0].data is None
+
+
+def test_unconnected_array_input_converts_nested_lists() -> None:
+    attribute: ArrayAttribute = ArrayAttribute(name='points', dtype=np.float64, shape=(None, 2))
+    attribute.data = [[0, 1], [2, 3]]
+
+    assert attribute.data.shape == (2, 2) and not attribute.data.flags.writeable
+    with pytest.raises(ValueError):
+        attribute.data = [1, 2, 3]
+
+
+@pytest.mark.parametrize(('value', 'expected'), [
+    ("false", False), (" No ", False), ("0", False), ("True", True), ("yes", True), (np.bool_(True), True), (0, False)
+])
+def test_bool_attribute_parses_values(value: Any, expected: bool) -> None:
+    attribute: BoolAttribute = BoolAttribute(name='flag')
+    attribute.data = value
+
+    assert attribute.data is expected
+
+
+def test_bool_attribute_rejects_other_strings() -> None:
+    with pytest.raises(ValueError):
+        BoolAttribute(name='flag', data="maybe")